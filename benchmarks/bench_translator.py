@@ -0,0 +1,647 @@
+# Copyright (c) 2026 Autodesk.
+#
+# CONFIDENTIAL AND PROPRIETARY
+#
+# This work is provided "AS IS" and subject to the ShotGrid Pipeline Toolkit
+# Source Code License included in this distribution package. See LICENSE.
+# By accessing, using, copying or modifying this work you indicate your
+# agreement to the ShotGrid Pipeline Toolkit Source Code License. All rights
+# not expressly granted therein are reserved by Autodesk.
+
+"""
+Benchmarks of the LMV translation, packaging and publish steps.
+
+The translations are run with ``fake_extractor.py``, which generates synthetic SVF
+output trees, and the publish plugin is run against a stubbed Flow Production Tracking
+connection, so the benchmarks measure the overhead of the framework itself: staging the
+source file, zipping and streaming the packages, and the publish orchestration.
+
+tk-core must be importable, e.g.::
+
+    PYTHONPATH=/path/to/tk-core/python python benchmarks/bench_translator.py \\
+        --sizes 1 16 128 --files 10 500 --output results.json
+
+Results are written as JSON and can be compared with a previous run to spot
+regressions::
+
+    python benchmarks/bench_translator.py --compare baseline.json --output results.json
+"""
+
+import argparse
+import importlib.util
+import json
+import logging
+import os
+import platform
+import shutil
+import statistics
+import subprocess
+import sys
+import tempfile
+import threading
+import time
+import tracemalloc
+
+BENCHMARKS_DIR = os.path.dirname(os.path.abspath(__file__))
+ROOT_DIR = os.path.dirname(BENCHMARKS_DIR)
+sys.path.insert(0, os.path.join(ROOT_DIR, "python"))
+
+import sgtk  # noqa: E402
+import translator  # noqa: E402
+import upload_server  # noqa: E402
+
+MB = 1024 * 1024
+
+# latency of the stubbed Flow Production Tracking requests, and number of items
+# published at once, when measuring the pipelined publish
+SHOTGUN_LATENCY = 0.05
+PUBLISH_ITEM_COUNT = 4
+
+logger = logging.getLogger("lmv_benchmarks")
+
+# imports the translator package in a new interpreter where tk-core is already loaded,
+# as in a DCC session, then uses some of its attributes
+IMPORT_SCRIPT = """
+import json, sys, time, tracemalloc
+sys.path.insert(0, {python_dir!r})
+import sgtk
+if {trace_memory!r}:
+    tracemalloc.start()
+start_time = time.perf_counter()
+import translator
+for name in {attributes!r}:
+    getattr(translator, name)
+duration = time.perf_counter() - start_time
+print(json.dumps([duration, tracemalloc.get_traced_memory()[1]]))
+"""
+
+
+################################################################################################
+# environment
+
+
+def create_extractor_command(work_dir):
+    """
+    Create an executable running the fake extractor with the current interpreter.
+
+    :param work_dir: Directory where the executable is written.
+    :returns: The path to the executable.
+    """
+
+    fake_extractor_path = os.path.join(BENCHMARKS_DIR, "fake_extractor.py")
+    if sys.platform == "win32":
+        command_path = os.path.join(work_dir, "fake_extractor.cmd")
+        with open(command_path, "w") as fh:
+            fh.write('@"{}" "{}" %*\n'.format(sys.executable, fake_extractor_path))
+    else:
+        command_path = os.path.join(work_dir, "fake_extractor")
+        with open(command_path, "w") as fh:
+            fh.write(
+                '#!/bin/sh\nexec "{}" "{}" "$@"\n'.format(
+                    sys.executable, fake_extractor_path
+                )
+            )
+        os.chmod(command_path, 0o755)
+    return command_path
+
+
+def create_source_file(work_dir, size):
+    """
+    Create a source file of the given size.
+
+    :param work_dir: Directory where the file is written.
+    :param size: Size of the file in bytes.
+    :returns: The path to the file.
+    """
+
+    path = os.path.join(work_dir, "source_{}.stp".format(size))
+    with open(path, "wb") as fh:
+        remaining = size
+        while remaining > 0:
+            chunk_size = min(MB, remaining)
+            fh.write(os.urandom(chunk_size))
+            remaining -= chunk_size
+    return path
+
+
+class StubSetting(object):
+    """A publish plugin setting."""
+
+    def __init__(self, value):
+        self.value = value
+
+
+class StubShotgun(object):
+    """
+    A Flow Production Tracking connection doing nothing but reading the uploads, with
+    an optional latency added to each request.
+    """
+
+    def __init__(self, latency=0):
+        self.__next_id = 1
+        self.__lock = threading.Lock()
+        self.latency = latency
+        self.calls = []
+
+    def create(self, entity_type, data):
+        self.__request("create")
+        with self.__lock:
+            entity = {"type": entity_type, "id": self.__next_id}
+            self.__next_id += 1
+        return entity
+
+    def update(self, entity_type, entity_id, data):
+        self.__request("update")
+        return dict(data, type=entity_type, id=entity_id)
+
+    def upload(self, entity_type, entity_id, path, field_name=None, **kwargs):
+        self.__request("upload")
+        with open(path, "rb") as fh:
+            while fh.read(MB):
+                pass
+        return 1
+
+    def upload_thumbnail(self, entity_type, entity_id, path, **kwargs):
+        self.__request("upload_thumbnail")
+        return 1
+
+    def __request(self, name):
+        self.calls.append(name)
+        if self.latency:
+            time.sleep(self.latency)
+
+
+class StubFramework(object):
+    """The LMV framework, as returned by load_framework."""
+
+    def import_module(self, name):
+        return translator
+
+    @property
+    def translator(self):
+        return translator
+
+
+class StubParent(object):
+    """The publisher app."""
+
+    def __init__(self):
+        self.shotgun = StubShotgun()
+        self.sgtk = None
+
+
+class StubItem(object):
+    """A publish item."""
+
+    def __init__(self, path, parent=None):
+        self.properties = {"path": path}
+        self.context = None
+        self.type_spec = "file.alias"
+        self.checked = True
+        self.parent = parent
+        self.children = []
+        if parent:
+            parent.children.append(self)
+
+    @property
+    def descendants(self):
+        for child in self.children:
+            yield child
+            for descendant in child.descendants:
+                yield descendant
+
+    def get_property(self, name):
+        return self.properties.get(name)
+
+    def get_thumbnail_as_path(self):
+        return None
+
+
+class StubPublishPluginBase(object):
+    """The base class of the publish plugins, creating the Version."""
+
+    def __init__(self, parent):
+        self.parent = parent
+        self.logger = logger
+        self.disk_location = os.path.join(ROOT_DIR, "hooks", "tk-multi-publish2")
+
+    @property
+    def settings(self):
+        return {}
+
+    def load_framework(self, name):
+        return StubFramework()
+
+    def publish(self, settings, item):
+        item.properties["sg_version_data"] = self.parent.shotgun.create(
+            "Version", {"code": os.path.basename(item.properties["path"])}
+        )
+
+    def finalize(self, settings, item):
+        pass
+
+
+def load_publish_plugin():
+    """
+    Load the LMV publish plugin hook on top of the stubbed base plugin.
+
+    :returns: An instance of the plugin.
+    """
+
+    hook_path = os.path.join(
+        ROOT_DIR, "hooks", "tk-multi-publish2", "upload_version_standalone.py"
+    )
+    get_hook_baseclass = sgtk.get_hook_baseclass
+    sgtk.get_hook_baseclass = lambda: StubPublishPluginBase
+    try:
+        spec = importlib.util.spec_from_file_location("lmv_publish_plugin", hook_path)
+        module = importlib.util.module_from_spec(spec)
+        spec.loader.exec_module(module)
+    finally:
+        sgtk.get_hook_baseclass = get_hook_baseclass
+    return module.UploadVersionPlugin(StubParent())
+
+
+################################################################################################
+# benchmarks
+
+
+def bench_translate(source_path, command_path, source_staging):
+    """Translate a file, returning the translator."""
+
+    lmv_translator = translator.LMVTranslator(
+        source_path,
+        None,
+        None,
+        translator_path=command_path,
+        source_staging=source_staging,
+    )
+    lmv_translator.translate()
+    return lmv_translator
+
+
+def bench_package(lmv_translator, workers, stream):
+    """Package a translation, removing the package afterwards."""
+
+    svf_file_name = os.path.splitext(os.path.basename(lmv_translator.source_path))[0]
+    if stream:
+        package, _ = lmv_translator.package_stream(
+            svf_file_name=svf_file_name, workers=workers
+        )
+        package.close()
+    else:
+        zip_path, _ = lmv_translator.package(
+            svf_file_name=svf_file_name, workers=workers
+        )
+        os.remove(zip_path)
+
+
+def bench_publish(plugin, source_path, stream):
+    """Validate and publish a file with the publish plugin."""
+
+    settings = dict(
+        (name, StubSetting(setting["default"]))
+        for name, setting in plugin.settings.items()
+    )
+    settings["Stream Package"] = StubSetting(stream)
+    item = StubItem(source_path)
+    if not plugin.validate(settings, item):
+        raise RuntimeError("Validation of {} failed".format(source_path))
+    plugin.publish(settings, item)
+    plugin.finalize(settings, item)
+
+
+def bench_upload(upload_url, package_path):
+    """Upload a package in parts to the local upload service."""
+
+    translator.ResumableUpload(
+        translator.HTTPUploadTransport(upload_url), package_path, part_size=4 * MB
+    ).run()
+
+
+def bench_publish_items(plugin, source_paths, pipelined):
+    """Publish several items, then finalize them, as the publisher does."""
+
+    settings = dict(
+        (name, StubSetting(setting["default"]))
+        for name, setting in plugin.settings.items()
+    )
+    settings["Pipelined Publish"] = StubSetting(pipelined)
+    items = [StubItem(source_path) for source_path in source_paths]
+    for item in items:
+        if not plugin.validate(settings, item):
+            raise RuntimeError("Validation of {} failed".format(source_paths))
+        plugin.publish(settings, item)
+    for item in items:
+        plugin.finalize(settings, item)
+
+
+def bench_validate(plugin, source_paths):
+    """Validate all the items of a publish tree, as the publisher does."""
+
+    settings = dict(
+        (name, StubSetting(setting["default"]))
+        for name, setting in plugin.settings.items()
+    )
+    root = StubItem(None)
+    items = [StubItem(source_path, parent=root) for source_path in source_paths]
+    for item in items:
+        if not plugin.validate(settings, item):
+            raise RuntimeError(
+                "Validation of {} failed".format(item.properties["path"])
+            )
+
+
+def bench_import(attributes, trace_memory):
+    """
+    Import the translator package in a new interpreter and use some of its attributes.
+
+    :returns: The duration of the import in seconds and its Python memory peak in bytes.
+    """
+
+    output = subprocess.check_output(
+        [
+            sys.executable,
+            "-c",
+            IMPORT_SCRIPT.format(
+                python_dir=os.path.join(ROOT_DIR, "python"),
+                trace_memory=trace_memory,
+                attributes=attributes,
+            ),
+        ],
+        env=dict(os.environ, PYTHONPATH=os.pathsep.join(sys.path)),
+        stderr=subprocess.DEVNULL,
+    )
+    return json.loads(output.decode("utf-8").splitlines()[-1])
+
+
+def measure_import(attributes, repeat):
+    """
+    Measure the duration and the Python memory peak of the import of the translator
+    package, as :func:`measure` does for a function run in this interpreter.
+    """
+
+    durations = [bench_import(attributes, False)[0] for _ in range(repeat)]
+    return {
+        "median": statistics.median(durations),
+        "min": min(durations),
+        "max": max(durations),
+        "peak_python_memory": bench_import(attributes, True)[1],
+    }
+
+
+def measure(func, repeat, setup=None, teardown=None):
+    """
+    Measure the duration and the Python memory peak of a function.
+
+    The function is run ``repeat`` times to measure its duration, then once more to
+    measure its memory peak, as tracing the allocations slows it down.
+
+    :returns: A dictionary with the median, min and max durations in seconds and the
+              memory peak in bytes.
+    """
+
+    durations = []
+    for _ in range(repeat + 1):
+        args = setup() if setup else ()
+        trace_memory = len(durations) == repeat
+        if trace_memory:
+            tracemalloc.start()
+        start_time = time.perf_counter()
+        result = func(*args)
+        duration = time.perf_counter() - start_time
+        if trace_memory:
+            _, peak_memory = tracemalloc.get_traced_memory()
+            tracemalloc.stop()
+        else:
+            durations.append(duration)
+        if teardown:
+            teardown(result, *args)
+
+    return {
+        "median": statistics.median(durations),
+        "min": min(durations),
+        "max": max(durations),
+        "peak_python_memory": peak_memory,
+    }
+
+
+def run_benchmarks(sizes, file_counts, item_count, repeat):
+    """
+    Run all the benchmarks.
+
+    :returns: A dictionary of benchmark names to their measurements.
+    """
+
+    results = {}
+    server = None
+    work_dir = tempfile.mkdtemp(prefix="lmv_bench_")
+    try:
+        # loading the framework only imports the package, a translation imports the
+        # translator and its dependencies
+        for name, attributes in (
+            ("lazy", []),
+            ("translator", ["LMVTranslator"]),
+            ("all", translator.__all__),
+        ):
+            results["import[{}]".format(name)] = measure_import(attributes, repeat)
+
+        command_path = create_extractor_command(work_dir)
+
+        # translators are resolved through the translator path cache, as if they had
+        # been found in a previous session
+        translator.get_translator_path_cache().set(
+            "tk-alias",
+            translator.LMVTranslator.get_translator_relative_paths()["tk-alias"],
+            command_path,
+        )
+        plugin = load_publish_plugin()
+        server = upload_server.start_server()
+        upload_url = "http://127.0.0.1:{}".format(server.server_port)
+
+        for size in sizes:
+            source_path = create_source_file(work_dir, size * MB)
+            for file_count in file_counts:
+                os.environ["LMV_FAKE_EXTRACTOR_FILES"] = str(file_count)
+                case = "size={}MB,files={}".format(size, file_count)
+                logger.info("Running benchmarks for {}".format(case))
+
+                for source_staging in (
+                    translator.LMVTranslator.SOURCE_STAGING_COPY,
+                    translator.LMVTranslator.SOURCE_STAGING_LINK,
+                ):
+                    result = measure(
+                        lambda: bench_translate(
+                            source_path, command_path, source_staging
+                        ),
+                        repeat,
+                        teardown=lambda t: shutil.rmtree(t.output_directory),
+                    )
+                    result["throughput_mb_s"] = size / result["median"]
+                    results["translate[{},{}]".format(source_staging, case)] = result
+
+                for name, workers, stream in (
+                    ("package", 1, False),
+                    ("package_read_ahead", 4, False),
+                    ("package_stream", 1, True),
+                ):
+                    result = measure(
+                        lambda t: bench_package(t, workers, stream),
+                        repeat,
+                        setup=lambda: (
+                            bench_translate(
+                                source_path,
+                                command_path,
+                                translator.LMVTranslator.SOURCE_STAGING_LINK,
+                            ),
+                        ),
+                        teardown=lambda _, t: shutil.rmtree(t.output_directory),
+                    )
+                    result["throughput_mb_s"] = size / result["median"]
+                    results["{}[{}]".format(name, case)] = result
+
+                for name, stream in (("publish", False), ("publish_stream", True)):
+                    result = measure(
+                        lambda: bench_publish(plugin, source_path, stream), repeat
+                    )
+                    result["throughput_mb_s"] = size / result["median"]
+                    results["{}[{}]".format(name, case)] = result
+
+                result = measure(lambda: bench_upload(upload_url, source_path), repeat)
+                result["throughput_mb_s"] = size / result["median"]
+                results["upload_resumable[{}]".format(case)] = result
+
+                # several items published against a server answering with a latency
+                plugin.parent.shotgun.latency = SHOTGUN_LATENCY
+                try:
+                    for name, pipelined in (
+                        ("publish_items", False),
+                        ("publish_items_pipelined", True),
+                    ):
+                        result = measure(
+                            lambda: bench_publish_items(
+                                plugin, [source_path] * PUBLISH_ITEM_COUNT, pipelined
+                            ),
+                            repeat,
+                        )
+                        result["throughput_mb_s"] = (
+                            size * PUBLISH_ITEM_COUNT / result["median"]
+                        )
+                        results["{}[{}]".format(name, case)] = result
+                finally:
+                    plugin.parent.shotgun.latency = 0
+
+        source_paths = []
+        for index in range(item_count):
+            source_paths.append(os.path.join(work_dir, "item_{}.stp".format(index)))
+            with open(source_paths[-1], "wb") as fh:
+                fh.write(os.urandom(64 * 1024))
+        result = measure(lambda: bench_validate(plugin, source_paths), repeat)
+        result["throughput_mb_s"] = item_count * 64 * 1024 / MB / result["median"]
+        results["validate[items={}]".format(item_count)] = result
+    finally:
+        if server:
+            server.shutdown()
+        shutil.rmtree(work_dir, ignore_errors=True)
+
+    return results
+
+
+################################################################################################
+# reporting
+
+
+def compare(results, baseline, threshold):
+    """
+    Compare results with a baseline, printing the relative change of each benchmark.
+
+    :returns: The list of benchmarks slower than the baseline by more than the threshold.
+    """
+
+    regressions = []
+    for name in sorted(results):
+        if name not in baseline:
+            continue
+        ratio = results[name]["median"] / baseline[name]["median"]
+        flag = ""
+        if ratio > 1 + threshold:
+            flag = "  <-- REGRESSION"
+            regressions.append(name)
+        print("{:60} {:+7.1%}{}".format(name, ratio - 1, flag))
+    return regressions
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument(
+        "--sizes",
+        type=int,
+        nargs="+",
+        default=[1, 16, 64],
+        help="Sizes of the source files, in MB.",
+    )
+    parser.add_argument(
+        "--files",
+        type=int,
+        nargs="+",
+        default=[10, 200],
+        help="Numbers of files generated by the fake extractor.",
+    )
+    parser.add_argument(
+        "--items",
+        type=int,
+        default=200,
+        help="Number of publish items validated at once.",
+    )
+    parser.add_argument(
+        "--repeat", type=int, default=3, help="Number of runs of each benchmark."
+    )
+    parser.add_argument("--output", help="Path to the JSON file to write results to.")
+    parser.add_argument("--compare", help="Path to the JSON results of a previous run.")
+    parser.add_argument(
+        "--threshold",
+        type=float,
+        default=0.2,
+        help="Relative slowdown reported as a regression, 0.2 by default.",
+    )
+    args = parser.parse_args()
+
+    logging.basicConfig(level=logging.INFO, format="%(message)s")
+
+    results = run_benchmarks(args.sizes, args.files, args.items, args.repeat)
+    report = {
+        "environment": {
+            "python": platform.python_version(),
+            "platform": platform.platform(),
+            "cpu_count": os.cpu_count(),
+            "time": time.time(),
+        },
+        "results": results,
+    }
+
+    for name in sorted(results):
+        result = results[name]
+        print(
+            "{:60} {:8.3f}s {:9.1f} MB/s {:9.1f} MB peak".format(
+                name,
+                result["median"],
+                result.get("throughput_mb_s", 0.0),
+                result["peak_python_memory"] / float(MB),
+            )
+        )
+
+    if args.output:
+        with open(args.output, "w") as fh:
+            json.dump(report, fh, indent=2, sort_keys=True)
+
+    if args.compare:
+        with open(args.compare, "r") as fh:
+            baseline = json.load(fh)["results"]
+        print("\nCompared to {}:".format(args.compare))
+        if compare(results, baseline, args.threshold):
+            return 1
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
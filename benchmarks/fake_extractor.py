@@ -0,0 +1,83 @@
+# Copyright (c) 2026 Autodesk.
+#
+# CONFIDENTIAL AND PROPRIETARY
+#
+# This work is provided "AS IS" and subject to the ShotGrid Pipeline Toolkit
+# Source Code License included in this distribution package. See LICENSE.
+# By accessing, using, copying or modifying this work you indicate your
+# agreement to the ShotGrid Pipeline Toolkit Source Code License. All rights
+# not expressly granted therein are reserved by Autodesk.
+
+"""
+Stand-in for the LMV extractors, used by the benchmarks.
+
+It is called like the real extractors, with the path to the index file and the path to
+the file to translate, reads the whole source file and writes a synthetic SVF output
+tree next to the index file. The output is configured with environment variables:
+
+- ``LMV_FAKE_EXTRACTOR_FILES``: number of geometry pack files, 10 by default.
+- ``LMV_FAKE_EXTRACTOR_SIZE``: total size of the pack files in bytes, the size of the
+  source file by default.
+- ``LMV_FAKE_EXTRACTOR_COMPRESSIBLE``: ratio of the pack files filled with compressible
+  data instead of random bytes, 0.5 by default.
+"""
+
+import os
+import sys
+
+CHUNK_SIZE = 1024 * 1024
+
+
+def write_file(path, size, compressible):
+    """Write a file of the given size, filled with compressible or random data."""
+
+    with open(path, "wb") as fh:
+        remaining = size
+        while remaining > 0:
+            chunk_size = min(CHUNK_SIZE, remaining)
+            if compressible:
+                fh.write((b"lmv-fake-geometry " * (chunk_size // 18 + 1))[:chunk_size])
+            else:
+                fh.write(os.urandom(chunk_size))
+            remaining -= chunk_size
+
+
+def main(index_file_path, source_path):
+    """Generate the output tree for the given source file."""
+
+    # read the source file, like a real extractor would
+    source_size = 0
+    with open(source_path, "rb") as fh:
+        for block in iter(lambda: fh.read(CHUNK_SIZE), b""):
+            source_size += len(block)
+
+    file_count = int(os.environ.get("LMV_FAKE_EXTRACTOR_FILES", 10))
+    total_size = int(os.environ.get("LMV_FAKE_EXTRACTOR_SIZE", source_size))
+    compressible_ratio = float(os.environ.get("LMV_FAKE_EXTRACTOR_COMPRESSIBLE", 0.5))
+
+    name = os.path.splitext(os.path.basename(source_path))[0]
+    output_dir = os.path.join(os.path.dirname(index_file_path), "output")
+    svf_dir = os.path.join(output_dir, "1")
+    images_dir = os.path.join(output_dir, "images")
+    for directory in (svf_dir, images_dir):
+        if not os.path.isdir(directory):
+            os.makedirs(directory)
+
+    file_size = total_size // max(1, file_count)
+    compressible_count = int(file_count * compressible_ratio)
+    for index in range(file_count):
+        write_file(
+            os.path.join(svf_dir, "{}.pf".format(index)),
+            file_size,
+            index < compressible_count,
+        )
+        print("Translating geometry: {}%".format(int(100 * (index + 1) / file_count)))
+        sys.stdout.flush()
+
+    write_file(os.path.join(svf_dir, "{}.svf".format(name)), 64 * 1024, True)
+    write_file(os.path.join(images_dir, "{}.png".format(name)), 32 * 1024, False)
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main(sys.argv[1], sys.argv[2]))
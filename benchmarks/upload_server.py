@@ -0,0 +1,118 @@
+# Copyright (c) 2026 Autodesk.
+#
+# CONFIDENTIAL AND PROPRIETARY
+#
+# This work is provided "AS IS" and subject to the ShotGrid Pipeline Toolkit
+# Source Code License included in this distribution package. See LICENSE.
+# By accessing, using, copying or modifying this work you indicate your
+# agreement to the ShotGrid Pipeline Toolkit Source Code License. All rights
+# not expressly granted therein are reserved by Autodesk.
+
+"""
+Local stand-in for an upload service, used by the benchmarks.
+
+It implements the protocol of ``HTTPUploadTransport``, keeping the uploaded parts in
+memory, and can fail some of the part uploads to exercise the retries::
+
+    python benchmarks/upload_server.py --port 8000 --failure-rate 0.2
+"""
+
+import argparse
+import hashlib
+import http.server
+import json
+import random
+import re
+import threading
+import uuid
+
+PART_PATTERN = re.compile(r"^/uploads/([^/]+)/parts/(\d+)$")
+COMPLETE_PATTERN = re.compile(r"^/uploads/([^/]+)/complete$")
+
+
+class UploadHandler(http.server.BaseHTTPRequestHandler):
+    """Handle the requests of HTTPUploadTransport."""
+
+    def log_message(self, format, *args):
+        pass
+
+    def do_POST(self):
+        body = self.__read_body()
+        if self.path == "/uploads":
+            upload_id = uuid.uuid4().hex
+            with self.server.lock:
+                self.server.uploads[upload_id] = {}
+            return self.__reply(200, {"upload_id": upload_id})
+
+        match = COMPLETE_PATTERN.match(self.path)
+        if not match or match.group(1) not in self.server.uploads:
+            return self.__reply(404, {})
+        with self.server.lock:
+            parts = self.server.uploads.pop(match.group(1))
+        hasher = hashlib.sha256()
+        size = 0
+        for part_number, tag in json.loads(body.decode("utf-8"))["parts"]:
+            data, part_tag = parts[part_number]
+            if tag != part_tag:
+                return self.__reply(400, {})
+            hasher.update(data)
+            size += len(data)
+        with self.server.lock:
+            self.server.completed.append(hasher.hexdigest())
+        return self.__reply(200, {"size": size, "sha256": hasher.hexdigest()})
+
+    def do_PUT(self):
+        body = self.__read_body()
+        match = PART_PATTERN.match(self.path)
+        if not match or match.group(1) not in self.server.uploads:
+            return self.__reply(404, {})
+        if random.random() < self.server.failure_rate:
+            return self.__reply(503, {})
+        tag = hashlib.md5(body).hexdigest()
+        with self.server.lock:
+            self.server.uploads[match.group(1)][int(match.group(2))] = (body, tag)
+        return self.__reply(200, {"tag": tag})
+
+    def __read_body(self):
+        return self.rfile.read(int(self.headers.get("Content-Length", 0)))
+
+    def __reply(self, status, data):
+        body = json.dumps(data).encode("utf-8")
+        self.send_response(status)
+        self.send_header("Content-Type", "application/json")
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+
+def start_server(port=0, failure_rate=0.0):
+    """
+    Start the upload service in a background thread.
+
+    :param port: Port to listen to, 0 to pick a free one.
+    :param failure_rate: Ratio of the part uploads answered with an HTTP 503 error.
+    :returns: The server, whose URL is ``http://127.0.0.1:<server.server_port>``.
+    """
+
+    server = http.server.ThreadingHTTPServer(("127.0.0.1", port), UploadHandler)
+    server.uploads = {}
+    server.completed = []
+    server.failure_rate = failure_rate
+    server.lock = threading.Lock()
+    thread = threading.Thread(target=server.serve_forever)
+    thread.daemon = True
+    thread.start()
+    return server
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--port", type=int, default=8000)
+    parser.add_argument("--failure-rate", type=float, default=0.0)
+    args = parser.parse_args()
+    server = start_server(args.port, args.failure_rate)
+    print("Listening on http://127.0.0.1:{}".format(server.server_port))
+    try:
+        threading.Event().wait()
+    except KeyboardInterrupt:
+        server.shutdown()
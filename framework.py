@@ -7,9 +7,16 @@
 # By accessing, using, copying or modifying this work you indicate your
 # agreement to the Shotgun Pipeline Toolkit Source Code License. All rights
 # not expressly granted therein are reserved by Shotgun Software Inc.
+import os
+import threading
+
 import sgtk
 
 
+# translator facade of the framework, created when the framework is initialized
+_translator = None
+
+
 class LMVFramework(sgtk.platform.Framework):
 
     ##########################################################################################
@@ -18,5 +25,105 @@ class LMVFramework(sgtk.platform.Framework):
     def init_framework(self):
         self.log_debug("%s: Initializing..." % self)
 
+        # the translator module is only imported and configured once it is used, so
+        # loading the framework in a session which doesn't translate anything is cheap
+        global _translator
+        _translator = TranslatorFacade(self)
+
     def destroy_framework(self):
         self.log_debug("%s: Destroying..." % self)
+
+    ##########################################################################################
+    # properties
+
+    @property
+    def translator(self):
+        """
+        The translator module of the framework, imported the first time it is used.
+
+        :returns: A :class:`TranslatorFacade` giving access to the translator module
+        """
+        return _translator
+
+
+class TranslatorFacade(object):
+    """
+    Give access to the attributes of the translator module, importing and configuring the
+    module according to the framework settings the first time one of them is used.
+    """
+
+    def __init__(self, framework):
+        """
+        Class constructor.
+
+        :param framework: The :class:`LMVFramework` instance.
+        """
+        self.__framework = framework
+        self.__module = None
+        self.__lock = threading.Lock()
+
+    def __getattr__(self, name):
+        return getattr(self.get_module(), name)
+
+    def get_module(self):
+        """
+        Get the translator module, importing and configuring it if needed.
+
+        :returns: The translator module
+        """
+
+        if self.__module is None:
+            with self.__lock:
+                if self.__module is None:
+                    self.__module = self.__load_module()
+        return self.__module
+
+    def __load_module(self):
+        """Import the translator module and configure it from the framework settings."""
+
+        framework = self.__framework
+        translator = framework.import_module("translator")
+
+        # persist the translator paths found on disk so new sessions don't have to scan
+        # the installed software again
+        translator.get_translator_path_cache().set_persistent_path(
+            os.path.join(framework.cache_location, "translator_paths.json")
+        )
+
+        # keep the cost of the translations of this host across sessions, to schedule
+        # the next ones
+        translator.get_translation_statistics().set_persistent_path(
+            os.path.join(framework.cache_location, "translation_statistics.json")
+        )
+
+        # index the translators by file extension once, with the configured ones
+        translator.set_translator_registry(
+            translator.TranslatorRegistry(framework.get_setting("translators"))
+        )
+
+        # create the translation workspaces on the configured scratch volume, and
+        # remove the ones left behind by crashed sessions without delaying the translation
+        workspace_manager = translator.WorkspaceManager(
+            root=framework.get_setting("scratch_directory") or None,
+            max_age=framework.get_setting("workspace_max_age") * 60 * 60,
+        )
+        translator.set_workspace_manager(workspace_manager)
+        thread = threading.Thread(
+            target=self.__collect_workspaces, args=(workspace_manager,)
+        )
+        thread.daemon = True
+        thread.start()
+
+        return translator
+
+    def __collect_workspaces(self, workspace_manager):
+        """Remove the orphaned translation workspaces."""
+        try:
+            removed_paths = workspace_manager.collect_garbage()
+        except Exception as e:
+            self.__framework.log_debug("Couldn't remove orphaned workspaces: %s" % e)
+            return
+        if removed_paths:
+            self.__framework.log_debug(
+                "Removed %d orphaned workspaces" % len(removed_paths)
+            )
@@ -7,9 +7,11 @@
 # By accessing, using, copying or modifying this work you indicate your
 # agreement to the Shotgun Pipeline Toolkit Source Code License. All rights
 # not expressly granted therein are reserved by Shotgun Software Inc.
+import fnmatch
 import os
 import sgtk
-import shutil
+import threading
+from concurrent import futures
 
 HookBaseClass = sgtk.get_hook_baseclass()
 
@@ -19,6 +21,16 @@ class UploadVersionPlugin(HookBaseClass):
     Plugin for sending quicktimes and images to Flow Production Tracking for review.
     """
 
+    # maximum number of items checked at once during validation
+    MAX_VALIDATION_WORKERS = 8
+
+    # number of seconds to wait before retrying a failed upload, doubled after each retry
+    UPLOAD_BACKOFF = 2.0
+
+    # translators resolved by engine name for the session, including the failed lookups
+    _translator_paths = {}
+    _translator_paths_lock = threading.Lock()
+
     @property
     def icon(self):
         """
@@ -70,6 +82,53 @@ class UploadVersionPlugin(HookBaseClass):
                 "default": False,
                 "description": "Upload content to Flow Production Tracking?",
             },
+            "Stream Package": {
+                "type": "bool",
+                "default": False,
+                "description": "Keep small LMV packages in memory instead of "
+                "writing a zip file to disk?",
+            },
+            "Upload Retries": {
+                "type": "int",
+                "default": 3,
+                "description": "Number of times a failed LMV package upload is retried.",
+            },
+            "Upload URL": {
+                "type": "str",
+                "default": "",
+                "description": "URL of a service receiving the LMV packages in parts, "
+                "which attaches each package to the Version whose id is its file name. "
+                "Failed parts are retried without sending the whole package again. "
+                "The packages are uploaded with the Flow Production Tracking API when "
+                "empty.",
+            },
+            "Pipelined Publish": {
+                "type": "bool",
+                "default": False,
+                "description": "Update the Version and upload the thumbnail while the "
+                "file is being translated, and upload the LMV package in the background "
+                "while the next items are published?",
+            },
+            "Max In-Flight Uploads": {
+                "type": "int",
+                "default": 2,
+                "description": "Maximum number of uploads running in the background "
+                "in pipelined mode.",
+            },
+            "Translation Service": {
+                "type": "str",
+                "default": "",
+                "description": "Address of the local LMV translation service the "
+                "translations are submitted to, e.g. localhost:6000. Translate in the "
+                "publisher when empty.",
+            },
+            "Translation Service Key File": {
+                "type": "str",
+                "default": "",
+                "description": "Path to the file holding the secret key shared with "
+                "the translation service. The key is read from the environment when "
+                "empty.",
+            },
         }
 
         # update the base settings
@@ -144,25 +203,212 @@ class UploadVersionPlugin(HookBaseClass):
             self.logger.error("No path found for item")
             return False
 
-        framework_lmv = self.load_framework("tk-framework-lmv_v0.x.x")
-        if not framework_lmv:
+        translator = self._get_translator_module()
+        if not translator:
             self.logger.error("Could not run LMV translation: missing ATF framework")
             return False
 
-        translator = framework_lmv.import_module("translator")
-        lmv_translator = translator.LMVTranslator(path, self.parent.sgtk, item.context)
-        lmv_translator_path = lmv_translator.get_translator_path()
-        if not lmv_translator_path:
-            self.logger.error(
-                "Missing translator for VRED. VRED must be installed locally to run LMV translation."
-            )
+        # the items handled by this plugin are checked all at once the first time one of
+        # them is validated, the results are stored on the items: the successful ones
+        # until the files change, the failed ones until the items are validated
+        validation = self._get_item_validation(translator, item)
+        if validation is None:
+            plugin_items = [item]
+            for other_item in self._get_plugin_items(item)[1:]:
+                # the failures left by a previous validation pass are dropped here
+                other_validation = self._get_item_validation(translator, other_item)
+                if other_validation is None or other_validation["error"]:
+                    plugin_items.append(other_item)
+            validation = self._validate_items(translator, plugin_items)[0]
+            if validation["error"]:
+                item.properties.pop("lmv_validation", None)
+        if validation["error"]:
+            self.logger.error(validation["error"])
             return False
 
+        service = None
+        service_address = settings.get("Translation Service").value
+        if service_address:
+            key_file = settings.get("Translation Service Key File").value
+            service = translator.TranslationServiceClient(
+                service_address, authkey=translator.get_authkey(key_file or None)
+            )
+
         # Store the translator in the item properties so it can be used later
-        item.properties["lmv_translator"] = lmv_translator
+        item.properties["lmv_translator"] = translator.LMVTranslator(
+            path,
+            self.parent.sgtk,
+            item.context,
+            translator_path=validation["translator_path"],
+            service=service,
+        )
 
         return True
 
+    def _get_translator_module(self):
+        """
+        Load the LMV framework once and get its translator module, imported the first
+        time one of its attributes is used.
+
+        :returns: The translator module, or None if the framework couldn't be loaded
+        """
+
+        if getattr(self, "_translator_module", None) is None:
+            framework_lmv = self.load_framework("tk-framework-lmv_v0.x.x")
+            if not framework_lmv:
+                return None
+            self._translator_module = framework_lmv.translator
+        return self._translator_module
+
+    def _get_plugin_items(self, item):
+        """
+        Get the items of the publish tree this plugin is interested in.
+
+        :param item: The item being validated
+        :returns: A list of items, starting with the given one
+        """
+
+        root = item
+        while getattr(root, "parent", None) is not None:
+            root = root.parent
+
+        items = [item]
+        for other_item in getattr(root, "descendants", []):
+            if other_item is item or not getattr(other_item, "checked", True):
+                continue
+            type_spec = getattr(other_item, "type_spec", None)
+            if type_spec and any(
+                fnmatch.fnmatch(type_spec, item_filter)
+                for item_filter in self.item_filters
+            ):
+                items.append(other_item)
+        return items
+
+    def _get_item_validation(self, translator, item):
+        """
+        Get the validation stored on an item, if the file hasn't changed since.
+
+        A successful validation is kept as long as the file and its translator exist,
+        a failed one is only returned once, so it is checked again by the next
+        validation pass.
+
+        :param translator: The translator module of the LMV framework
+        :param item: Item to process
+        :returns: A dictionary with the ``translator_path`` and the validation ``error``,
+                  or None if the item needs to be validated
+        """
+
+        validation = item.properties.get("lmv_validation")
+        if not validation:
+            return None
+        if validation["error"]:
+            item.properties.pop("lmv_validation", None)
+        elif not os.path.exists(validation["translator_path"]):
+            return None
+        if validation["signature"] != self._get_file_signature(
+            translator, item.get_property("path")
+        ):
+            return None
+        return validation
+
+    def _validate_items(self, translator, items):
+        """
+        Check the files of several items concurrently, and store the validations on the
+        items, see :meth:`_get_item_validation`.
+
+        :param translator: The translator module of the LMV framework
+        :param items: The items to validate
+        :returns: The validations of the items with a path, in the same order
+        """
+
+        def validate_item(plugin_item):
+            path = plugin_item.get_property("path")
+            signature = self._get_file_signature(translator, path)
+            translator_entry = translator.get_translator_registry().get_entry(path)
+            engine_name = translator_entry.engine_name if translator_entry else None
+            translator_path = None
+            error = None
+            if signature is None:
+                error = "File not found: {}".format(path)
+            elif not engine_name:
+                error = "LMV translation does not support file: {}".format(path)
+            elif not translator_entry.check_size(signature[0]):
+                error = "File is too big for the {} translator: {}".format(
+                    engine_name, path
+                )
+            else:
+                try:
+                    with open(path, "rb") as fh:
+                        fh.read(1)
+                except (OSError, IOError) as e:
+                    error = "Could not read {}: {}".format(path, e)
+            if not error:
+                translator_path, error = self._get_translator_path(
+                    translator, engine_name, path, plugin_item.context
+                )
+            validation = {
+                "signature": signature,
+                "translator_path": translator_path,
+                "error": error,
+            }
+            plugin_item.properties["lmv_validation"] = validation
+            return validation
+
+        items = [
+            plugin_item for plugin_item in items if plugin_item.get_property("path")
+        ]
+        with futures.ThreadPoolExecutor(
+            max_workers=min(self.MAX_VALIDATION_WORKERS, len(items))
+        ) as executor:
+            return list(executor.map(validate_item, items))
+
+    def _get_translator_path(self, translator, engine_name, path, context):
+        """
+        Resolve the translator of an engine once for the session.
+
+        The failed lookups are remembered as well, so the software isn't scanned again
+        for each file of an engine which isn't installed.
+
+        :param translator: The translator module of the LMV framework
+        :param engine_name: Name of the engine of the translator
+        :param path: Path to a file translated by the translator
+        :param context: Context of the item the file belongs to
+        :returns: A tuple with the path to the translator executable, or None, and the
+                  error message of the lookup, or None
+        """
+
+        cls = UploadVersionPlugin
+        # the translators are resolved one at a time, so each engine is resolved once
+        with cls._translator_paths_lock:
+            translator_path, error = cls._translator_paths.get(
+                engine_name, (None, None)
+            )
+            if error or (translator_path and os.path.exists(translator_path)):
+                return translator_path, error
+            try:
+                translator_path = translator.LMVTranslator(
+                    path, self.parent.sgtk, context
+                ).get_translator_path()
+                error = None
+            except Exception as e:
+                translator_path = None
+                error = str(e)
+            cls._translator_paths[engine_name] = (translator_path, error)
+            return translator_path, error
+
+    def _get_file_signature(self, translator, path):
+        """
+        Get the stat metadata identifying a version of a file.
+
+        :param translator: The translator module of the LMV framework
+        :param path: Path to the file
+        :returns: The signature returned by the framework, starting with the file size,
+                  or None if the file doesn't exist
+        """
+        if not path or not os.path.isfile(path):
+            return None
+        return translator.get_file_signature(path)
+
     def publish(self, settings, item):
         """
         Executes the publish logic for the given item and settings.
@@ -172,41 +418,312 @@ class UploadVersionPlugin(HookBaseClass):
         :param item: Item to process
         """
 
+        # timings of the publish, emitted as a single record once it is over
+        metrics = item.properties["lmv_translator"].metrics
+        try:
+            self._publish_version(settings, item, metrics)
+        except Exception:
+            self._wait_for_uploads(item)
+            # the publisher doesn't finalize any item after a failed publish: the
+            # uploads of the items published before are waited for and reported here
+            self._wait_for_all_uploads()
+            metrics.emit()
+            raise
+        # in pipelined mode, the record is emitted once the uploads are over
+        if not item.properties.get("lmv_uploads"):
+            metrics.emit()
+
+    def finalize(self, settings, item):
+        """
+        Execute the finalization pass. This pass executes once all the publish
+        tasks have completed, and can for example be used to version up files.
+
+        In pipelined mode, wait for the uploads of the item running in the background.
+
+        :param settings: Dictionary of Settings. The keys are strings, matching
+            the keys returned in the settings property. The values are `Setting`
+            instances.
+        :param item: Item to process
+        """
+
+        if item.properties.get("lmv_uploads"):
+            errors = self._wait_for_uploads(item)
+            item.properties["lmv_translator"].metrics.emit()
+            if errors:
+                raise Exception(
+                    "Failed to upload the LMV content: {}".format("; ".join(errors))
+                )
+
+        super(UploadVersionPlugin, self).finalize(settings, item)
+
+    def _publish_version(self, settings, item, metrics):
+        """
+        Create the Version and upload its content, recording the duration of each step.
+
+        :param settings: Dictionary of Settings. The keys are strings, matching
+            the keys returned in the settings property. The values are `Setting`
+            instances.
+        :param item: Item to process
+        :param metrics: The PipelineMetrics the durations are recorded to
+        """
+
+        generate_3d = settings.get("3D Version").value is True
+        pipelined = settings.get("Pipelined Publish").value is True
+
+        # start translating the file in the background while the Version is created
+        if generate_3d:
+            item.properties["lmv_translation"] = item.properties[
+                "lmv_translator"
+            ].translate_async()
+
         # create the Version in Flow Production Tracking
-        super(UploadVersionPlugin, self).publish(settings, item)
+        try:
+            with metrics.stage("create_version"):
+                super(UploadVersionPlugin, self).publish(settings, item)
+        except Exception:
+            if item.properties.get("lmv_translation"):
+                item.properties["lmv_translation"].cancel()
+            raise
+        metrics.set("version_id", item.properties["sg_version_data"]["id"])
+
+        thumbnail_path = item.get_thumbnail_as_path()
+
+        # the Version update and the thumbnail don't depend on the translation: in
+        # pipelined mode, they are uploaded while the file is being translated
+        if pipelined:
+            if generate_3d:
+                self._submit_upload(
+                    settings, item, "update_version", self._update_version, item
+                )
+            if thumbnail_path:
+                self._submit_upload(
+                    settings,
+                    item,
+                    "upload_thumbnail",
+                    self._upload_thumbnail,
+                    item,
+                    thumbnail_path,
+                )
 
         # generate the Version content: LMV file or simple 2D thumbnail
-        if settings.get("3D Version").value is True:
+        if generate_3d:
             self.logger.debug("Creating LMV files from source file")
+            stream_package = settings.get("Stream Package").value is True
             # translate the file to lmv and upload the corresponding package to the Version
-            (
-                package_path,
-                output_directory,
-            ) = self._translate_file_to_lmv(item)
-            self.logger.debug("Uploading LMV file to Flow Production Tracking")
+            if stream_package:
+                package, _ = self._translate_file_to_lmv_stream(item)
+            else:
+                package, _ = self._translate_file_to_lmv(item)
+
+            # without a thumbnail, use the image written by the translator: it is
+            # uploaded with the package, before the translated files are removed
+            lmv_thumbnail_path = None
+            if not thumbnail_path:
+                lmv_translator = item.properties["lmv_translator"]
+                lmv_thumbnail_path = lmv_translator.extract_thumbnail()
+
+            if pipelined:
+                self._submit_upload(
+                    settings,
+                    item,
+                    "upload",
+                    self._upload_lmv_package,
+                    settings,
+                    item,
+                    package,
+                    lmv_thumbnail_path,
+                )
+            else:
+                self._update_version(item)
+                self._upload_lmv_package(settings, item, package, lmv_thumbnail_path)
+
+        if thumbnail_path and not pipelined:
+            self._upload_thumbnail(item, thumbnail_path)
+
+    def _update_version(self, item):
+        """
+        Flag the Version as an LMV Version.
+
+        :param item: Item to process
+        """
+
+        with item.properties["lmv_translator"].metrics.stage("update_version"):
             self.parent.shotgun.update(
                 entity_type="Version",
                 entity_id=item.properties["sg_version_data"]["id"],
                 data={"sg_translation_type": "LMV"},
             )
-            self.parent.shotgun.upload(
-                entity_type="Version",
-                entity_id=item.properties["sg_version_data"]["id"],
-                path=package_path,
-                field_name="sg_uploaded_movie",
-            )
-            # delete the temporary folder on disk
+
+    def _upload_lmv_package(self, settings, item, package, thumbnail_path=None):
+        """
+        Upload the LMV package to the Version, retrying failed uploads, and delete the translated files once the
+        upload is over.
+
+        :param settings: Dictionary of Settings. The keys are strings, matching
+            the keys returned in the settings property. The values are `Setting`
+            instances.
+        :param item: Item to process
+        :param package: The path to the LMV zip file, or the SpooledPackage holding it
+        :param thumbnail_path: Optional path to a thumbnail extracted from the translation, uploaded before the
+                               translated files are deleted
+        """
+
+        metrics = item.properties["lmv_translator"].metrics
+
+        self.logger.debug("Uploading LMV file to Flow Production Tracking")
+        try:
+            if thumbnail_path:
+                self._upload_thumbnail(item, thumbnail_path)
+            with metrics.stage("upload"):
+                if isinstance(package, str):
+                    self._upload_package_file(settings, item, package)
+                    metrics.add_bytes(read=os.path.getsize(package))
+                else:
+                    try:
+                        self._upload_package_stream(settings, item, package)
+                        metrics.add_bytes(read=package.size)
+                    finally:
+                        package.close()
+        finally:
+            # the translated files can't be reused by another publish, which creates
+            # a new Version and packages its own translation
             self.logger.debug("Deleting temporary folder")
-            shutil.rmtree(output_directory)
+            with metrics.stage("cleanup"):
+                item.properties["lmv_translator"].cleanup()
 
-        thumbnail_path = item.get_thumbnail_as_path()
-        if thumbnail_path:
+    def _upload_thumbnail(self, item, thumbnail_path):
+        """
+        Upload the thumbnail of the Version.
+
+        :param item: Item to process
+        :param thumbnail_path: Path to the thumbnail image
+        """
+
+        with item.properties["lmv_translator"].metrics.stage("upload_thumbnail"):
             self.parent.shotgun.upload_thumbnail(
                 entity_type="Version",
                 entity_id=item.properties["sg_version_data"]["id"],
                 path=thumbnail_path,
             )
 
+    def _submit_upload(self, settings, item, name, func, *args):
+        """
+        Run an upload in the background, waiting first if too many uploads are running.
+
+        The uploads of all the items of a publish session share the same threads, so the
+        upload of an item overlaps the translation of the next one. The threads are
+        stopped once the uploads of all the items have been waited for. The Toolkit Flow
+        Production Tracking connection is specific to each thread, so the uploads can
+        safely run concurrently.
+
+        :param settings: Dictionary of Settings. The keys are strings, matching
+            the keys returned in the settings property. The values are `Setting`
+            instances.
+        :param item: Item to process
+        :param name: Name of the upload, used to report errors
+        :param func: The callable running the upload
+        :param args: The arguments of the callable
+        """
+
+        # the items are published one at a time, the executor is created by the first
+        # upload of the session
+        if getattr(self, "_upload_executor", None) is None:
+            max_uploads = max(1, settings.get("Max In-Flight Uploads").value)
+            self._upload_executor = futures.ThreadPoolExecutor(
+                max_workers=max_uploads, thread_name_prefix="LMVUpload"
+            )
+            self._upload_slots = threading.BoundedSemaphore(max_uploads)
+            self._upload_items = []
+        executor = self._upload_executor
+        upload_slots = self._upload_slots
+
+        upload_slots.acquire()
+
+        def run_upload():
+            try:
+                return func(*args)
+            finally:
+                upload_slots.release()
+
+        try:
+            future = executor.submit(run_upload)
+        except Exception:
+            upload_slots.release()
+            raise
+        item.properties.setdefault("lmv_uploads", []).append((name, future))
+        if item not in self._upload_items:
+            self._upload_items.append(item)
+
+    def _wait_for_uploads(self, item):
+        """
+        Wait for the uploads of an item running in the background, and stop the upload
+        threads once the uploads of all the items are over.
+
+        :param item: Item to process
+        :returns: The list of error messages of the failed uploads
+        """
+
+        errors = []
+        for name, future in item.properties.pop("lmv_uploads", []):
+            try:
+                future.result()
+            except Exception as e:
+                self.logger.error("LMV {} failed: {}".format(name, e))
+                errors.append("{}: {}".format(name, e))
+
+        upload_items = getattr(self, "_upload_items", [])
+        if item in upload_items:
+            upload_items.remove(item)
+        if not upload_items and getattr(self, "_upload_executor", None) is not None:
+            self._upload_executor.shutdown()
+            self._upload_executor = None
+        return errors
+
+    def _wait_for_all_uploads(self):
+        """
+        Wait for the uploads of all the items running in the background, reporting
+        the failed ones.
+        """
+
+        for item in list(getattr(self, "_upload_items", [])):
+            errors = self._wait_for_uploads(item)
+            item.properties["lmv_translator"].metrics.emit()
+            if errors:
+                self.logger.error(
+                    "Failed to upload the LMV content of {}: {}".format(
+                        item.get_property("path"), "; ".join(errors)
+                    )
+                )
+
+    def _wait_for_lmv_translation(self, item):
+        """
+        Wait for the translation started in the background to be over, or run it if it hasn't been started.
+
+        :param item: Item to process
+        :returns: The LMVTranslator holding the translated files
+        """
+
+        lmv_translator = item.properties["lmv_translator"]
+        lmv_translation = item.properties.get("lmv_translation")
+        with lmv_translator.metrics.stage("translate"):
+            if lmv_translation:
+                lmv_translation.result()
+            else:
+                lmv_translator.translate()
+        if lmv_translator.package_diff:
+            self.logger.info(
+                "LMV translation compared to the previous version: %s"
+                % lmv_translator.package_diff,
+                extra={
+                    "action_show_more_info": {
+                        "label": "Package Diff",
+                        "tooltip": "Show the files regenerated by the translation",
+                        "text": "\n".join(lmv_translator.package_diff.regenerated),
+                    }
+                },
+            )
+        return lmv_translator
+
     def _translate_file_to_lmv(self, item):
         """
         Translate the current Alias file as an LMV package in order to upload it to Flow Production Tracking as a 3D Version
@@ -218,8 +735,7 @@ class UploadVersionPlugin(HookBaseClass):
             - The path to the temporary folder where the LMV files have been processed
         """
 
-        lmv_translator = item.properties["lmv_translator"]
-        lmv_translator.translate()
+        lmv_translator = self._wait_for_lmv_translation(item)
 
         # package it up
         self.logger.info("Packaging LMV files")
@@ -228,3 +744,110 @@ class UploadVersionPlugin(HookBaseClass):
         )
 
         return package_path, lmv_translator.output_directory
+
+    def _translate_file_to_lmv_stream(self, item):
+        """
+        Translate the current file as an LMV package kept in memory, unless it is too big, in order to upload it to
+        Flow Production Tracking as a 3D Version
+
+        :param item: Item to process
+        :returns:
+            - The SpooledPackage holding the LMV zip archive
+            - The path to the temporary folder where the LMV files have been processed
+        """
+
+        lmv_translator = self._wait_for_lmv_translation(item)
+
+        # package it up
+        self.logger.info("Packaging LMV files")
+        package, _ = lmv_translator.package_stream(
+            svf_file_name=str(item.properties["sg_version_data"]["id"]),
+        )
+
+        return package, lmv_translator.output_directory
+
+    def _upload_package_stream(self, settings, item, package):
+        """
+        Upload an LMV package kept in memory to the Version.
+
+        The package is sent in parts straight from memory when an upload transport is returned by
+        :meth:`_get_upload_transport`. The Flow Production Tracking API uploads files from disk, so without a
+        transport the package is written to disk first if it is still in memory.
+
+        :param settings: Dictionary of Settings. The keys are strings, matching
+            the keys returned in the settings property. The values are `Setting`
+            instances.
+        :param item: Item to process
+        :param package: The SpooledPackage holding the LMV zip archive
+        """
+
+        transport = self._get_upload_transport(settings, item)
+        if transport and not package.rolled_over:
+            translator = self._get_translator_module()
+            translator.upload_stream(
+                transport,
+                package,
+                package.file_name,
+                package.size,
+                retries=settings.get("Upload Retries").value,
+                backoff=self.UPLOAD_BACKOFF,
+            )
+            return
+
+        self._upload_package_file(settings, item, package.get_path())
+
+    def _upload_package_file(self, settings, item, path):
+        """
+        Upload an LMV zip file to the Version, retrying failed uploads.
+
+        The file is uploaded in one request with the Flow Production Tracking API, unless an upload transport is
+        returned by :meth:`_get_upload_transport`, in which case it is uploaded in parts: the failed parts are
+        retried by the upload itself, and the parts already uploaded aren't sent again.
+
+        :param settings: Dictionary of Settings. The keys are strings, matching
+            the keys returned in the settings property. The values are `Setting`
+            instances.
+        :param item: Item to process
+        :param path: Path to the LMV zip file
+        """
+
+        translator = self._get_translator_module()
+        retries = settings.get("Upload Retries").value
+        transport = self._get_upload_transport(settings, item)
+        if transport:
+            translator.ResumableUpload(
+                transport, path, retries=retries, backoff=self.UPLOAD_BACKOFF
+            ).run()
+            return
+
+        translator.retry_call(
+            lambda: self.parent.shotgun.upload(
+                entity_type="Version",
+                entity_id=item.properties["sg_version_data"]["id"],
+                path=path,
+                field_name="sg_uploaded_movie",
+            ),
+            retries=retries,
+            backoff=self.UPLOAD_BACKOFF,
+            description="Upload of {}".format(path),
+        )
+
+    def _get_upload_transport(self, settings, item):
+        """
+        Get the transport used to upload the LMV packages in parts.
+
+        An :class:`HTTPUploadTransport` is returned when the ``Upload URL`` setting is set. Override this method
+        to upload the packages to another service accepting uploads in several parts. The transport is responsible
+        for attaching the package to the Version once the upload is completed.
+
+        :param settings: Dictionary of Settings. The keys are strings, matching
+            the keys returned in the settings property. The values are `Setting`
+            instances.
+        :param item: Item to process
+        :returns: An UploadTransport, or None to upload the packages with the Flow Production Tracking API
+        """
+
+        upload_url = settings.get("Upload URL").value
+        if not upload_url:
+            return None
+        return self._get_translator_module().HTTPUploadTransport(upload_url)
@@ -8,4 +8,73 @@
 # agreement to the Shotgun Pipeline Toolkit Source Code License. All rights
 # not expressly granted therein are reserved by Shotgun Software Inc.
 
-from .lmv_translator import LMVTranslator
+import importlib
+
+# the modules are only imported when one of their attributes is used, so loading the
+# framework doesn't import all the translation, packaging and upload dependencies
+_ATTRIBUTE_MODULES = {
+    "LMVTranslator": "lmv_translator",
+    "BatchResult": "batch_translator",
+    "LMVBatchTranslator": "batch_translator",
+    "Fingerprint": "fingerprint",
+    "FingerprintIndex": "fingerprint",
+    "get_file_signature": "fingerprint",
+    "LineageStore": "lineage_store",
+    "PackageDiff": "manifest",
+    "PackageManifest": "manifest",
+    "PipelineMetrics": "metrics",
+    "add_metrics_sink": "metrics",
+    "remove_metrics_sink": "metrics",
+    "LMVPackager": "packager",
+    "SpooledPackage": "packager",
+    "ProcessLog": "process_log",
+    "ResourceLimits": "process_utils",
+    "ResourceStore": "resource_store",
+    "TranslatorEntry": "registry",
+    "TranslatorRegistry": "registry",
+    "get_translator_registry": "registry",
+    "set_translator_registry": "registry",
+    "HTTPUploadTransport": "resumable_upload",
+    "ResumableUpload": "resumable_upload",
+    "UploadError": "resumable_upload",
+    "UploadTransport": "resumable_upload",
+    "retry_call": "resumable_upload",
+    "upload_stream": "resumable_upload",
+    "TranslationCache": "translation_cache",
+    "TranslatorPathCache": "translator_path_cache",
+    "get_translator_path_cache": "translator_path_cache",
+    "TranslationService": "translation_service",
+    "TranslationServiceClient": "translation_service",
+    "get_authkey": "translation_service",
+    "TranslationCancelled": "translation_handle",
+    "TranslationError": "translation_handle",
+    "TranslationHandle": "translation_handle",
+    "TranslationLimitError": "translation_handle",
+    "TranslationTimeout": "translation_handle",
+    "TranslationEstimate": "translation_statistics",
+    "TranslationStatistics": "translation_statistics",
+    "get_translation_statistics": "translation_statistics",
+    "set_translation_statistics": "translation_statistics",
+    "Workspace": "workspace",
+    "WorkspaceError": "workspace",
+    "WorkspaceManager": "workspace",
+    "get_workspace_manager": "workspace",
+    "set_workspace_manager": "workspace",
+}
+
+__all__ = sorted(_ATTRIBUTE_MODULES)
+
+
+def __getattr__(name):
+    """Import the module defining an attribute the first time it is used."""
+    module_name = _ATTRIBUTE_MODULES.get(name)
+    if module_name is None:
+        raise AttributeError("module {!r} has no attribute {!r}".format(__name__, name))
+    value = getattr(importlib.import_module("." + module_name, __name__), name)
+    globals()[name] = value
+    return value
+
+
+def __dir__():
+    """List the attributes of the package, imported or not."""
+    return sorted(set(globals()) | set(_ATTRIBUTE_MODULES))
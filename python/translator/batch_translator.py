@@ -0,0 +1,297 @@
+# Copyright (c) 2026 Autodesk.
+#
+# CONFIDENTIAL AND PROPRIETARY
+#
+# This work is provided "AS IS" and subject to the ShotGrid Pipeline Toolkit
+# Source Code License included in this distribution package. See LICENSE.
+# By accessing, using, copying or modifying this work you indicate your
+# agreement to the ShotGrid Pipeline Toolkit Source Code License. All rights
+# not expressly granted therein are reserved by Autodesk.
+
+import collections
+import os
+import tempfile
+from concurrent import futures
+
+import sgtk
+
+from .lmv_translator import LMVTranslator
+from .registry import get_translator_registry
+from .translation_statistics import get_translation_statistics
+
+logger = sgtk.platform.get_logger(__name__)
+
+BatchResult = collections.namedtuple(
+    "BatchResult", ["source_path", "translator", "output_directory", "error"]
+)
+BatchResult.__doc__ = """
+Result of the translation of one file of a batch.
+
+The ``translator`` is the :class:`LMVTranslator` used for the file, ``output_directory``
+is None and ``error`` holds the exception raised when the translation failed. Without
+an output directory for the batch, the file is translated to a temporary workspace,
+removed by the ``cleanup`` method of the translator.
+"""
+
+
+class LMVBatchTranslator(object):
+    """
+    A class to translate many files at once, running several translation processes
+    concurrently.
+
+    Translators which aren't parallel safe according to the :class:`TranslatorRegistry`
+    only run one file at a time: their next files are held back until the running one is
+    over, without taking a worker, so the other translators keep running concurrently.
+
+    The files predicted to take the longest by the :class:`TranslationStatistics` are
+    translated first, so a big file doesn't start last and delay the whole batch. With a
+    memory budget, the next files to translate are the longest ones whose predicted
+    memory fits in what the running translations leave.
+    """
+
+    # default maximum number of translation processes running at the same time
+    DEFAULT_MAX_WORKERS = 4
+
+    def __init__(
+        self,
+        paths,
+        tk,
+        context,
+        max_workers=DEFAULT_MAX_WORKERS,
+        cache=None,
+        translator_paths=None,
+        resource_store=None,
+        max_memory=None,
+        statistics=None,
+    ):
+        """
+        Class constructor.
+
+        :param paths: List of paths to the source files to translate.
+        :param max_workers: Maximum number of translation processes running at the same
+                            time.
+        :param cache: Optional :class:`TranslationCache` shared by all the translations.
+        :param translator_paths: Optional dictionary of translator executable paths by
+                                 engine name, used instead of looking for the engine
+                                 software, e.g. when no Toolkit instance is available.
+        :param resource_store: Optional :class:`ResourceStore` shared by all the
+                               translations, the packaged files are added to.
+        :param max_memory: Optional number of bytes the predicted memory of the running
+                           translations can't exceed. A file predicted to need more runs
+                           alone.
+        :param statistics: Optional :class:`TranslationStatistics` used to predict the
+                           cost of the translations. If not supplied, the statistics of
+                           the process are used.
+        """
+        self.__source_paths = list(paths)
+        self.__tk = tk
+        self.__context = context
+        self.__max_workers = max(1, max_workers or 1)
+        self.__cache = cache
+        self.__translator_paths = dict(translator_paths or {})
+        self.__resource_store = resource_store
+        self.__max_memory = max_memory
+        self.__statistics = statistics or get_translation_statistics()
+
+    ################################################################################################
+    # properties
+
+    @property
+    def source_paths(self):
+        """
+        Paths of the files to translate.
+
+        :returns: A list of file paths
+        """
+        return list(self.__source_paths)
+
+    @property
+    def max_workers(self):
+        """
+        Maximum number of translation processes running at the same time.
+
+        :returns: The number of workers as an integer
+        """
+        return self.__max_workers
+
+    @property
+    def max_memory(self):
+        """
+        Maximum predicted memory of the translations running at the same time.
+
+        :returns: The number of bytes, or None if there is no limit
+        """
+        return self.__max_memory
+
+    ################################################################################################
+    # public methods
+
+    def translate_iter(self, output_directory=None):
+        """
+        Translate all the files, yielding the results as soon as they are available.
+
+        :param output_directory: Path to the directory where the translations will be
+                                 written, each file in a new sub-directory. If no path is
+                                 supplied, a temporary directory is used for each file.
+        :returns: A generator of :class:`BatchResult`, in completion order.
+        """
+        for _, result in self.__run(output_directory):
+            yield result
+
+    def translate(self, output_directory=None):
+        """
+        Translate all the files and wait for all the translations to be done.
+
+        :param output_directory: Path to the directory where the translations will be
+                                 written. See :meth:`translate_iter`.
+        :returns: A list of :class:`BatchResult`, in the same order as the source paths.
+        """
+        return [result for _, result in sorted(self.__run(output_directory))]
+
+    ################################################################################################
+    # private methods
+
+    def __run(self, output_directory):
+        """
+        Run the translations, yielding (source index, :class:`BatchResult`) tuples in
+        completion order.
+        """
+
+        translators, errors = self.__create_translators()
+        for index, error in errors:
+            yield index, BatchResult(self.__source_paths[index], None, None, error)
+
+        if not translators:
+            return
+
+        # the translators which can't run several times at once
+        serial_engines = set(
+            entry.engine_name
+            for entry in get_translator_registry().entries
+            if not entry.parallel_safe
+        )
+
+        # the longest translations first
+        pending = []
+        for index, translator in translators:
+            estimate = self.__statistics.estimate(translator.source_path)
+            translator.metrics.set("estimated_duration", estimate.duration)
+            translator.metrics.set("estimated_peak_memory", estimate.peak_memory)
+            engine_name = LMVTranslator.get_translator_engine(translator.source_path)
+            pending.append((index, translator, estimate, engine_name))
+        pending.sort(key=lambda job: (-job[2].duration, job[0]))
+
+        with futures.ThreadPoolExecutor(max_workers=self.__max_workers) as executor:
+            running = {}
+            running_memory = 0
+            busy_engines = set()
+            while pending or running:
+                for job in list(pending):
+                    if len(running) >= self.__max_workers:
+                        break
+                    index, translator, estimate, engine_name = job
+                    if engine_name in busy_engines:
+                        # wait for the running file of this translator to be over
+                        continue
+                    if (
+                        running
+                        and self.__max_memory is not None
+                        and running_memory + estimate.peak_memory > self.__max_memory
+                    ):
+                        continue
+                    pending.remove(job)
+                    if engine_name in serial_engines:
+                        busy_engines.add(engine_name)
+
+                    translator_output_directory = None
+                    if output_directory:
+                        # a new directory for each run, so the translations of a
+                        # previous batch written to the same directory are kept
+                        if not os.path.isdir(output_directory):
+                            os.makedirs(output_directory, exist_ok=True)
+                        translator_output_directory = tempfile.mkdtemp(
+                            prefix="{}_{}_".format(
+                                index, os.path.basename(translator.source_path)
+                            ),
+                            dir=output_directory,
+                        )
+                    future = executor.submit(
+                        translator.translate, translator_output_directory
+                    )
+                    running[future] = job
+                    running_memory += estimate.peak_memory
+
+                done, _ = futures.wait(running, return_when=futures.FIRST_COMPLETED)
+                for future in done:
+                    index, translator, estimate, engine_name = running.pop(future)
+                    running_memory -= estimate.peak_memory
+                    busy_engines.discard(engine_name)
+                    try:
+                        result = future.result()
+                    except Exception as e:
+                        logger.debug(
+                            "Failed to translate {}: {}".format(
+                                translator.source_path, e
+                            )
+                        )
+                        yield index, BatchResult(
+                            translator.source_path, translator, None, e
+                        )
+                    else:
+                        yield index, BatchResult(
+                            translator.source_path, translator, result, None
+                        )
+
+    def __create_translators(self):
+        """
+        Create a translator for each source file, resolving the translator executable
+        only once per engine.
+
+        :returns: A list of (source index, translator) tuples and a list of
+                  (source index, error) tuples for the files which can't be translated.
+        """
+
+        translators = []
+        errors = []
+        translator_paths = dict(self.__translator_paths)
+
+        for index, source_path in enumerate(self.__source_paths):
+            engine_name = LMVTranslator.get_translator_engine(source_path)
+            if engine_name is None:
+                # the error names the file type, so it isn't shared with other files
+                try:
+                    LMVTranslator(
+                        source_path, self.__tk, self.__context
+                    ).get_translator_path()
+                except Exception as e:
+                    errors.append((index, e))
+                    continue
+            if engine_name not in translator_paths:
+                try:
+                    translator_paths[engine_name] = LMVTranslator(
+                        source_path, self.__tk, self.__context
+                    ).get_translator_path()
+                except Exception as e:
+                    translator_paths[engine_name] = e
+
+            translator_path = translator_paths[engine_name]
+            if isinstance(translator_path, Exception):
+                errors.append((index, translator_path))
+                continue
+
+            translators.append(
+                (
+                    index,
+                    LMVTranslator(
+                        source_path,
+                        self.__tk,
+                        self.__context,
+                        cache=self.__cache,
+                        translator_path=translator_path,
+                        resource_store=self.__resource_store,
+                        statistics=self.__statistics,
+                    ),
+                )
+            )
+
+        return translators, errors
@@ -0,0 +1,167 @@
+# Copyright (c) 2026 Autodesk.
+#
+# CONFIDENTIAL AND PROPRIETARY
+#
+# This work is provided "AS IS" and subject to the ShotGrid Pipeline Toolkit
+# Source Code License included in this distribution package. See LICENSE.
+# By accessing, using, copying or modifying this work you indicate your
+# agreement to the ShotGrid Pipeline Toolkit Source Code License. All rights
+# not expressly granted therein are reserved by Autodesk.
+
+import os
+
+import sgtk
+
+from .file_utils import is_reflink_supported, link_or_copy_file, reflink_file
+
+logger = sgtk.platform.get_logger(__name__)
+
+
+class BlobStore(object):
+    """
+    A directory of files keyed by the digest of their content, shared by the
+    :class:`LineageStore` and the :class:`ResourceStore`.
+
+    The blobs are only useful when the files of the packages can be replaced by
+    copy-on-write clones of them: without reflinks, every blob would be a full copy of
+    a file which is already on disk. The support is checked once per store, and when
+    it is missing no blob is stored at all.
+
+    The blob store doesn't lock anything, the callers serialize the changes.
+    """
+
+    def __init__(self, root, supports_reflink=None):
+        """
+        Class constructor.
+
+        :param root: Path to the directory where the blobs are stored.
+        :param supports_reflink: Whether copy-on-write clones can be created in the
+                                 directory, checked on first use if None.
+        """
+        self.__root = root
+        self.__supports_reflink = supports_reflink
+
+    ################################################################################################
+    # properties
+
+    @property
+    def root(self):
+        """
+        Path to the directory where the blobs are stored.
+
+        :returns: The directory path as a string
+        """
+        return self.__root
+
+    @property
+    def supports_reflink(self):
+        """
+        Whether the blobs can be cloned to the files of the packages, checked once.
+
+        :returns: True if copy-on-write clones are supported, False otherwise.
+        """
+        if self.__supports_reflink is None:
+            os.makedirs(self.__root, exist_ok=True)
+            self.__supports_reflink = is_reflink_supported(self.__root)
+            if not self.__supports_reflink:
+                logger.debug(
+                    "Copy-on-write clones aren't supported in {}, no blob is "
+                    "stored".format(self.__root)
+                )
+        return self.__supports_reflink
+
+    ################################################################################################
+    # public methods
+
+    def get_path(self, digest):
+        """
+        Get the path of a blob.
+
+        :param digest: The hex digest of the content of the blob.
+        :returns: The path to the blob, which may not exist.
+        """
+        return os.path.join(self.__root, digest[:2], digest)
+
+    def has(self, digest, size=None):
+        """
+        Check if a blob exists in the store.
+
+        :param digest: The hex digest of the content of the blob.
+        :param size: Optional size in bytes the blob must have.
+        :returns: True if the blob exists, False otherwise.
+        """
+        path = self.get_path(digest)
+        if not os.path.isfile(path):
+            return False
+        return size is None or os.path.getsize(path) == size
+
+    def share(self, digest, path):
+        """
+        Replace a file by a copy-on-write clone of the blob with the same content.
+
+        The blob is touched, so it isn't garbage collected before the manifest
+        referencing it is saved.
+
+        :param digest: The hex digest of the content of the file.
+        :param path: Path to the file.
+        :returns: True if the file shares its data with the blob, False otherwise.
+        """
+        blob_path = self.get_path(digest)
+        if not reflink_file(blob_path, path):
+            return False
+        os.utime(blob_path)
+        return True
+
+    def add(self, digest, path):
+        """
+        Store the content of a file as a blob, when copy-on-write clones are supported.
+
+        The blob is written under a unique temporary name and renamed, so it is never
+        seen partially written, and it is never hard linked to the file, so modifying
+        the file can't corrupt the store.
+
+        :param digest: The hex digest of the content of the file.
+        :param path: Path to the file.
+        :returns: True if the blob has been stored, False otherwise.
+        """
+        if not self.supports_reflink:
+            return False
+        blob_path = self.get_path(digest)
+        os.makedirs(os.path.dirname(blob_path), exist_ok=True)
+        link_or_copy_file(path, blob_path, allow_hardlink=False)
+        return True
+
+    def remove(self, digest):
+        """
+        Remove a blob if it exists.
+
+        :param digest: The hex digest of the content of the blob.
+        :returns: The number of bytes freed.
+        """
+        path = self.get_path(digest)
+        try:
+            size = os.path.getsize(path)
+            os.remove(path)
+        except OSError:
+            return 0
+        return size
+
+    def get_digests(self):
+        """
+        List the blobs of the store.
+
+        :returns: A list of hex digests.
+        """
+        digests = []
+        if not os.path.isdir(self.__root):
+            return digests
+        for dir_name in os.listdir(self.__root):
+            dir_path = os.path.join(self.__root, dir_name)
+            if len(dir_name) != 2 or not os.path.isdir(dir_path):
+                continue
+            digests.extend(
+                file_name
+                for file_name in os.listdir(dir_path)
+                if file_name.startswith(dir_name) and not file_name.endswith(".tmp")
+            )
+        return digests
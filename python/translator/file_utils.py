@@ -0,0 +1,436 @@
+# Copyright (c) 2026 Autodesk.
+#
+# CONFIDENTIAL AND PROPRIETARY
+#
+# This work is provided "AS IS" and subject to the ShotGrid Pipeline Toolkit
+# Source Code License included in this distribution package. See LICENSE.
+# By accessing, using, copying or modifying this work you indicate your
+# agreement to the ShotGrid Pipeline Toolkit Source Code License. All rights
+# not expressly granted therein are reserved by Autodesk.
+
+import ctypes
+import ctypes.util
+import errno
+import hashlib
+import json
+import os
+import shutil
+import socket
+import sys
+import threading
+import time
+import uuid
+
+from .process_utils import is_process_alive
+
+# size of the blocks read when hashing files
+HASH_BLOCK_SIZE = 1024 * 1024
+
+
+def hash_file(path, algorithm="sha256", block_size=HASH_BLOCK_SIZE):
+    """
+    Compute the hex digest of a file's content, reading it in blocks.
+
+    :param path: Path to the file to hash.
+    :param algorithm: Name of the :mod:`hashlib` algorithm to use.
+    :param block_size: Number of bytes read at once.
+
+    :returns: The hex digest as a string.
+    """
+
+    hasher = hashlib.new(algorithm)
+    with open(path, "rb") as fh:
+        for block in iter(lambda: fh.read(block_size), b""):
+            hasher.update(block)
+    return hasher.hexdigest()
+
+
+def get_directory_size(path):
+    """
+    Compute the total size of all the files stored under a directory.
+
+    :param path: Path to the directory.
+
+    :returns: The size in bytes.
+    """
+
+    total = 0
+    for root, _, file_names in os.walk(path):
+        for file_name in file_names:
+            total += os.path.getsize(os.path.join(root, file_name))
+    return total
+
+
+def get_temporary_path(path):
+    """
+    Get a unique path next to a file, to write it before moving it to its final path.
+
+    :param path: Path to the file.
+
+    :returns: The temporary path, in the same directory as the file.
+    """
+    return "{}.{}.tmp".format(path, uuid.uuid4().hex)
+
+
+def reflink_file(source_path, target_path):
+    """
+    Create a copy-on-write clone of a file, if the platform and filesystem support it.
+
+    The clone is created under a temporary name and then replaces the target, so an
+    existing target sharing its data with the source, e.g. a hard link, is never
+    written to.
+
+    :param source_path: Path to the file to clone.
+    :param target_path: Path to the clone to create.
+
+    :returns: True if the clone has been created, False otherwise.
+    """
+
+    tmp_path = get_temporary_path(target_path)
+    if sys.platform.startswith("linux"):
+        try:
+            import fcntl
+        except ImportError:
+            return False
+        # FICLONE ioctl, supported by btrfs, xfs and other copy-on-write filesystems
+        ficlone = 0x40049409
+        try:
+            with open(source_path, "rb") as source_fh:
+                fd = os.open(tmp_path, os.O_CREAT | os.O_EXCL | os.O_WRONLY)
+                with os.fdopen(fd, "wb") as target_fh:
+                    fcntl.ioctl(target_fh.fileno(), ficlone, source_fh.fileno())
+        except (OSError, IOError):
+            _remove_file(tmp_path)
+            return False
+
+    elif sys.platform == "darwin":
+        # clonefile() is available on APFS
+        libc_path = ctypes.util.find_library("c")
+        if not libc_path:
+            return False
+        libc = ctypes.CDLL(libc_path, use_errno=True)
+        if not hasattr(libc, "clonefile"):
+            return False
+        result = libc.clonefile(
+            os.fsencode(source_path), os.fsencode(tmp_path), ctypes.c_int(0)
+        )
+        if result != 0:
+            return False
+
+    else:
+        return False
+
+    _replace_file(tmp_path, target_path)
+    return True
+
+
+def is_reflink_supported(dir_path):
+    """
+    Check if copy-on-write clones can be created in a directory, by cloning a small
+    probe file.
+
+    :param dir_path: Path to an existing directory.
+
+    :returns: True if the clones are supported, False otherwise.
+    """
+
+    probe_path = get_temporary_path(os.path.join(dir_path, ".reflink_probe"))
+    clone_path = get_temporary_path(probe_path)
+    try:
+        with open(probe_path, "wb") as fh:
+            fh.write(b"reflink probe")
+        return reflink_file(probe_path, clone_path)
+    except (OSError, IOError):
+        return False
+    finally:
+        _remove_file(clone_path)
+        _remove_file(probe_path)
+
+
+def link_or_copy_file(source_path, target_path, allow_hardlink=True, before_copy=None):
+    """
+    Make the content of a file available at another path, avoiding copying the data
+    when possible.
+
+    A copy-on-write clone is tried first, then a hard link, and the file is only copied
+    when none of them is possible, e.g. when both paths are on different filesystems.
+    The target is always replaced by a new file, never written to, so an existing
+    target sharing its data with the source is left untouched until it is replaced.
+
+    :param source_path: Path to the file to make available.
+    :param target_path: Path where the file should be available.
+    :param allow_hardlink: False to never hard link the files. A hard link shares the
+                           data with the source file, so any modification made to one
+                           of the files is visible through the other one.
+    :param before_copy: Optional callable called before falling back to a copy, e.g. to
+                        check the free space. It can raise to prevent the copy.
+
+    :returns: The strategy used: ``"reflink"``, ``"hardlink"`` or ``"copy"``.
+    """
+
+    if reflink_file(source_path, target_path):
+        return "reflink"
+
+    tmp_path = get_temporary_path(target_path)
+    if allow_hardlink:
+        try:
+            os.link(source_path, tmp_path)
+        except (OSError, AttributeError):
+            pass
+        else:
+            _replace_file(tmp_path, target_path)
+            return "hardlink"
+
+    if before_copy:
+        before_copy()
+    try:
+        shutil.copyfile(source_path, tmp_path)
+        _replace_file(tmp_path, target_path)
+    except Exception:
+        _remove_file(tmp_path)
+        raise
+    return "copy"
+
+
+def _replace_file(tmp_path, target_path):
+    """Move a temporary file to its final path, replacing any existing file."""
+
+    try:
+        os.replace(tmp_path, target_path)
+    finally:
+        # nothing is renamed when both paths are links to the same file
+        _remove_file(tmp_path)
+
+
+def _remove_file(path):
+    """Remove a file if it exists."""
+    try:
+        os.remove(path)
+    except OSError:
+        pass
+
+
+class FileLockTimeout(Exception):
+    """Raised when a :class:`FileLock` couldn't be acquired in time."""
+
+
+class FileLock(object):
+    """
+    A simple cross-process lock based on the exclusive creation of a lock file.
+
+    The lock file stores the owner process information so locks left behind by a
+    process which died without releasing them can be broken: right away when the
+    owner ran on this host, once they are older than ``stale_age`` seconds when it ran
+    on another host. Locks held for a long time can be kept fresh with a heartbeat.
+    """
+
+    # breaking a lock only takes a few file operations: a break lock file older than
+    # this number of seconds has been left behind by a dead process
+    BREAK_STALE_AGE = 10
+
+    def __init__(
+        self,
+        path,
+        timeout=None,
+        poll_interval=0.1,
+        stale_age=600,
+        heartbeat_interval=None,
+    ):
+        """
+        Class constructor.
+
+        :param path: Path to the lock file.
+        :param timeout: Maximum number of seconds to wait for the lock. ``None`` waits
+                        forever.
+        :param poll_interval: Number of seconds to wait between two attempts.
+        :param stale_age: Age in seconds after which a lock file is considered stale.
+        :param heartbeat_interval: If supplied, number of seconds between two updates
+                                   of the lock file modification time while the lock is
+                                   held. It must be shorter than ``stale_age``.
+        """
+        self.__path = path
+        self.__timeout = timeout
+        self.__poll_interval = poll_interval
+        self.__stale_age = stale_age
+        self.__heartbeat_interval = heartbeat_interval
+        self.__heartbeat_stop = None
+        self.__locked = False
+
+    @property
+    def path(self):
+        """
+        Path to the lock file.
+
+        :returns: The file path as a string
+        """
+        return self.__path
+
+    @property
+    def locked(self):
+        """
+        Whether the lock is currently held by this object.
+
+        :returns: True if the lock is held, False otherwise
+        """
+        return self.__locked
+
+    def acquire(self, blocking=True):
+        """
+        Acquire the lock.
+
+        :param blocking: If False, return immediately when the lock is held by someone
+                         else.
+
+        :returns: True if the lock has been acquired, False otherwise.
+        :raises FileLockTimeout: If the lock couldn't be acquired before the timeout.
+        """
+
+        start_time = time.time()
+        while True:
+            if self.__try_acquire():
+                return True
+            stale_stat = self.__get_stale_stat()
+            if stale_stat and self.__break(stale_stat):
+                continue
+            if not blocking:
+                return False
+            if self.__timeout is not None and time.time() - start_time > self.__timeout:
+                raise FileLockTimeout(
+                    "Couldn't acquire lock {} after {}s".format(
+                        self.__path, self.__timeout
+                    )
+                )
+            time.sleep(self.__poll_interval)
+
+    def release(self):
+        """Release the lock if it is held by this object."""
+
+        if not self.__locked:
+            return
+        self.__locked = False
+        if self.__heartbeat_stop:
+            self.__heartbeat_stop.set()
+            self.__heartbeat_stop = None
+        try:
+            os.remove(self.__path)
+        except OSError:
+            pass
+
+    def __enter__(self):
+        self.acquire()
+        return self
+
+    def __exit__(self, *args):
+        self.release()
+
+    def read_owner(self):
+        """
+        Read the owner information stored in the lock file.
+
+        :returns: A dictionary with the ``pid``, ``host`` and ``time`` keys, or None if
+                  the lock file doesn't exist or can't be read.
+        """
+        try:
+            with open(self.__path, "r") as fh:
+                return json.load(fh)
+        except (OSError, IOError, ValueError):
+            return None
+
+    def __try_acquire(self):
+        """Try to create the lock file, return True on success."""
+
+        lock_dir = os.path.dirname(self.__path)
+        if lock_dir and not os.path.isdir(lock_dir):
+            os.makedirs(lock_dir, exist_ok=True)
+        try:
+            fd = os.open(self.__path, os.O_CREAT | os.O_EXCL | os.O_WRONLY)
+        except OSError as e:
+            if e.errno in (errno.EEXIST, errno.EACCES):
+                return False
+            raise
+        with os.fdopen(fd, "w") as fh:
+            json.dump(
+                {"pid": os.getpid(), "host": socket.gethostname(), "time": time.time()},
+                fh,
+            )
+        self.__locked = True
+        if self.__heartbeat_interval:
+            self.__heartbeat_stop = threading.Event()
+            heartbeat = threading.Thread(
+                target=self.__heartbeat, args=(self.__heartbeat_stop,)
+            )
+            heartbeat.daemon = True
+            heartbeat.start()
+        return True
+
+    def __heartbeat(self, stop_event):
+        """Keep the lock file fresh until the lock is released."""
+        while not stop_event.wait(self.__heartbeat_interval):
+            try:
+                os.utime(self.__path, None)
+            except OSError:
+                pass
+
+    def __get_stale_stat(self):
+        """
+        Check if the current lock file has been left behind by a dead owner.
+
+        :returns: The :func:`os.stat` result of the stale lock file, None if the lock
+                  file doesn't exist or isn't stale.
+        """
+
+        try:
+            stat = os.stat(self.__path)
+        except OSError:
+            return None
+
+        owner = self.read_owner()
+        if owner and owner.get("host") == socket.gethostname():
+            # the owner is known on this host: its lock is never broken while it runs,
+            # however old it is
+            return None if is_process_alive(owner["pid"]) else stat
+
+        if self.__stale_age is None:
+            return None
+        return stat if time.time() - stat.st_mtime > self.__stale_age else None
+
+    def __break(self, stale_stat):
+        """
+        Remove a stale lock file, unless it has been replaced since it was checked.
+
+        The processes breaking the lock are serialized by a break lock file, so a lock
+        file created by a new owner is never removed by a process which checked the
+        previous one.
+
+        :param stale_stat: The :func:`os.stat` result of the stale lock file.
+        :returns: True if the stale lock file doesn't exist anymore, False if another
+                  process is breaking it.
+        """
+
+        break_path = self.__path + ".break"
+        try:
+            fd = os.open(break_path, os.O_CREAT | os.O_EXCL | os.O_WRONLY)
+        except OSError:
+            try:
+                if time.time() - os.path.getmtime(break_path) > self.BREAK_STALE_AGE:
+                    os.remove(break_path)
+            except OSError:
+                pass
+            return False
+        os.close(fd)
+
+        try:
+            stat = os.stat(self.__path)
+            if (stat.st_ino, stat.st_mtime) == (
+                stale_stat.st_ino,
+                stale_stat.st_mtime,
+            ):
+                os.remove(self.__path)
+        except OSError:
+            pass
+        finally:
+            try:
+                os.remove(break_path)
+            except OSError:
+                pass
+        return True
@@ -0,0 +1,243 @@
+# Copyright (c) 2026 Autodesk.
+#
+# CONFIDENTIAL AND PROPRIETARY
+#
+# This work is provided "AS IS" and subject to the ShotGrid Pipeline Toolkit
+# Source Code License included in this distribution package. See LICENSE.
+# By accessing, using, copying or modifying this work you indicate your
+# agreement to the ShotGrid Pipeline Toolkit Source Code License. All rights
+# not expressly granted therein are reserved by Autodesk.
+
+import collections
+import hashlib
+import json
+import mmap
+import os
+import threading
+import time
+
+import sgtk
+
+from .file_utils import hash_file
+
+logger = sgtk.platform.get_logger(__name__)
+
+Fingerprint = collections.namedtuple("Fingerprint", ["digest", "exact"])
+Fingerprint.__doc__ = """
+Quick fingerprint of a file content.
+
+:ivar digest: Hex digest of the file size and of the sampled blocks of its content.
+:ivar exact: True if the whole content has been hashed, False if it has been sampled,
+             in which case two files with the same fingerprint may still differ.
+"""
+
+
+def get_file_signature(path):
+    """
+    Get the stat metadata identifying a version of a file, without reading it.
+
+    The change time isn't part of it: staging the file for a translator with a hard link
+    changes it, as does removing the link afterwards.
+
+    :param path: Path to the file.
+    :returns: A list with the file size, inode and modification time.
+    """
+    stat = os.stat(path)
+    return [stat.st_size, stat.st_ino, stat.st_mtime_ns]
+
+
+def compute_fingerprint(
+    path, sample_size=None, head_size=None, stride_samples=None, algorithm="sha256"
+):
+    """
+    Compute the quick fingerprint of a file.
+
+    Small files are hashed completely. For bigger files, only the head, the tail and
+    blocks sampled at regular intervals in between are hashed, read through a memory
+    map so only the sampled pages are loaded.
+
+    :param path: Path to the file.
+    :param sample_size: Size of the blocks sampled between the head and the tail.
+    :param head_size: Size of the head and of the tail of the file.
+    :param stride_samples: Number of blocks sampled between the head and the tail.
+    :param algorithm: Name of the :mod:`hashlib` algorithm to use.
+    :returns: A :class:`Fingerprint`.
+    """
+
+    sample_size = sample_size or FingerprintIndex.SAMPLE_SIZE
+    head_size = head_size or FingerprintIndex.HEAD_SIZE
+    stride_samples = stride_samples or FingerprintIndex.STRIDE_SAMPLES
+
+    size = os.path.getsize(path)
+    if size <= 2 * head_size + stride_samples * sample_size:
+        return Fingerprint(hash_file(path, algorithm), True)
+
+    hasher = hashlib.new(algorithm)
+    hasher.update(str(size).encode("utf-8"))
+    with open(path, "rb") as fh:
+        with mmap.mmap(fh.fileno(), 0, access=mmap.ACCESS_READ) as data:
+            hasher.update(data[:head_size])
+            stride = (size - 2 * head_size) // (stride_samples + 1)
+            for index in range(1, stride_samples + 1):
+                offset = head_size + index * stride
+                hasher.update(data[offset : offset + sample_size])
+            hasher.update(data[size - head_size :])
+    return Fingerprint(hasher.hexdigest(), False)
+
+
+class FingerprintIndex(object):
+    """
+    A persistent index of the fingerprints and digests of the files.
+
+    Fingerprints are stored with the signature of the file they have been computed for:
+    its size, inode and modification time. Checking a file which hasn't changed only
+    requires a ``stat`` call. The full digest of a file is only computed when it is
+    explicitly requested, e.g. to tell apart two files with the same sampled
+    fingerprint, and is stored as well.
+    """
+
+    # size of the head and of the tail of the files hashed by the quick fingerprint
+    HEAD_SIZE = 1024 * 1024
+
+    # number and size of the blocks sampled between the head and the tail
+    STRIDE_SAMPLES = 32
+    SAMPLE_SIZE = 64 * 1024
+
+    # maximum number of files in the index, the least recently used ones are dropped
+    MAX_ENTRIES = 10000
+
+    def __init__(self, path=None, max_entries=MAX_ENTRIES):
+        """
+        Class constructor.
+
+        :param path: Optional path to the JSON file the index is persisted to.
+        :param max_entries: Maximum number of files in the index.
+        """
+        self.__path = path
+        self.__max_entries = max_entries
+        self.__entries = self.__read()
+        self.__lock = threading.Lock()
+
+    ################################################################################################
+    # properties
+
+    @property
+    def path(self):
+        """
+        Path to the file where the index is persisted.
+
+        :returns: The file path as a string, or None if the index isn't persisted
+        """
+        return self.__path
+
+    ################################################################################################
+    # public methods
+
+    def get_fingerprint(self, path):
+        """
+        Get the quick fingerprint of a file, computing it if the file changed.
+
+        :param path: Path to the file.
+        :returns: A :class:`Fingerprint`.
+        """
+
+        key, signature, entry = self.__get_entry(path)
+        if entry.get("fingerprint") is not None:
+            return Fingerprint(entry["fingerprint"], entry["exact"])
+
+        fingerprint = compute_fingerprint(
+            path, self.SAMPLE_SIZE, self.HEAD_SIZE, self.STRIDE_SAMPLES
+        )
+        values = {"fingerprint": fingerprint.digest, "exact": fingerprint.exact}
+        if fingerprint.exact:
+            values["digest"] = fingerprint.digest
+        self.__update_entry(key, signature, values)
+        return fingerprint
+
+    def get_digest(self, path, compute=True):
+        """
+        Get the hex digest of the whole content of a file, computing it if the file changed.
+
+        :param path: Path to the file.
+        :param compute: If False, the content isn't hashed and None is returned when the
+                        digest of the current version of the file isn't known yet.
+        :returns: The sha256 hex digest as a string, or None.
+        """
+
+        key, signature, entry = self.__get_entry(path)
+        if entry.get("digest") is not None or not compute:
+            return entry.get("digest")
+
+        logger.debug("Hashing the whole content of {}".format(path))
+        digest = hash_file(path)
+        self.__update_entry(key, signature, {"digest": digest})
+        return digest
+
+    ################################################################################################
+    # private methods
+
+    def __get_entry(self, path):
+        """Get the key, the current signature and a copy of the index entry of a file."""
+
+        key = os.path.normcase(os.path.abspath(path))
+        # the signature is read before the content, so a file modified while it is
+        # being hashed gets a new entry the next time it is checked
+        signature = get_file_signature(path)
+        with self.__lock:
+            entry = self.__entries.get(key)
+            if entry is None or entry["signature"] != signature:
+                return key, signature, {}
+            entry["used"] = time.time()
+            return key, signature, dict(entry)
+
+    def __update_entry(self, key, signature, values):
+        """Store values in the entry of a file and persist the index."""
+
+        with self.__lock:
+            entry = self.__entries.get(key)
+            if entry is None or entry["signature"] != signature:
+                entry = {"signature": signature}
+                self.__entries[key] = entry
+            entry.update(values)
+            entry["used"] = time.time()
+        self.__save()
+
+    def __read(self):
+        """Read the entries stored in the persistent file."""
+
+        if not self.__path or not os.path.isfile(self.__path):
+            return {}
+        try:
+            with open(self.__path, "r") as fh:
+                return json.load(fh)
+        except (OSError, IOError, ValueError) as e:
+            logger.debug(
+                "Couldn't read fingerprint index {}: {}".format(self.__path, e)
+            )
+            return {}
+
+    def __save(self):
+        """Write the entries to the persistent file, if any."""
+
+        with self.__lock:
+            if len(self.__entries) > self.__max_entries:
+                for key, _ in sorted(
+                    self.__entries.items(), key=lambda item: item[1].get("used", 0)
+                )[: len(self.__entries) - self.__max_entries]:
+                    del self.__entries[key]
+
+            if not self.__path:
+                return
+
+            try:
+                index_dir = os.path.dirname(self.__path)
+                if index_dir and not os.path.isdir(index_dir):
+                    os.makedirs(index_dir)
+                tmp_path = "{}.{}.tmp".format(self.__path, os.getpid())
+                with open(tmp_path, "w") as fh:
+                    json.dump(self.__entries, fh)
+                os.replace(tmp_path, self.__path)
+            except (OSError, IOError) as e:
+                logger.debug(
+                    "Couldn't write fingerprint index {}: {}".format(self.__path, e)
+                )
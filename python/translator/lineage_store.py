@@ -0,0 +1,150 @@
+# Copyright (c) 2026 Autodesk.
+#
+# CONFIDENTIAL AND PROPRIETARY
+#
+# This work is provided "AS IS" and subject to the ShotGrid Pipeline Toolkit
+# Source Code License included in this distribution package. See LICENSE.
+# By accessing, using, copying or modifying this work you indicate your
+# agreement to the ShotGrid Pipeline Toolkit Source Code License. All rights
+# not expressly granted therein are reserved by Autodesk.
+
+import hashlib
+import os
+import re
+
+import sgtk
+
+from .blob_store import BlobStore
+from .file_utils import FileLock, is_reflink_supported
+from .manifest import PackageManifest
+
+logger = sgtk.platform.get_logger(__name__)
+
+
+class LineageStore(object):
+    """
+    A store keeping the latest translation of each source lineage, i.e. the successive
+    versions of the same source file.
+
+    When a new version is translated, the files it produced whose content didn't change
+    are replaced by copy-on-write clones of the files kept from the previous version,
+    so unchanged geometry packs are stored only once, and a :class:`PackageDiff`
+    reports what has been reused and what has been regenerated. Files are never hard
+    linked, so writing to a translation can't alter the files kept in the store. On
+    filesystems without copy-on-write clones, e.g. ext4 or NTFS, no file is kept and
+    only the manifests are stored to compute the diffs.
+    """
+
+    # version tokens removed from the source file names to get the default lineage: a
+    # ``v`` and digits starting the name or following a separator, and ending the stem
+    # or followed by a separator, so ``car_v012.wire`` becomes ``car.wire`` while
+    # ``rev12.wire`` is kept as is
+    VERSION_PATTERN = re.compile(r"(?:^|[._-])v\d+(?=[._-]|$)", re.IGNORECASE)
+
+    MANIFEST_FILE_NAME = "manifest.json"
+
+    def __init__(self, root):
+        """
+        Class constructor.
+
+        :param root: Path to the directory where the lineages are stored.
+        """
+        self.__root = root
+        self.__supports_reflink = None
+
+    @property
+    def root(self):
+        """
+        Path to the directory where the lineages are stored.
+
+        :returns: The directory path as a string
+        """
+        return self.__root
+
+    def get_lineage(self, source_path):
+        """
+        Get the default lineage of a source file, built from its path without any
+        version number in its file name.
+
+        :param source_path: Path to the source file.
+        :returns: The lineage as a string.
+        """
+        dir_path, file_name = os.path.split(
+            os.path.normcase(os.path.abspath(source_path))
+        )
+        return os.path.join(dir_path, self.VERSION_PATTERN.sub("", file_name))
+
+    def get_manifest(self, lineage):
+        """
+        Get the manifest of the latest translation of a lineage.
+
+        :param lineage: The lineage, see :meth:`get_lineage`.
+        :returns: The :class:`PackageManifest`, or None if the lineage is unknown.
+        """
+
+        manifest_path = os.path.join(
+            self.__get_lineage_dir(lineage), self.MANIFEST_FILE_NAME
+        )
+        if not os.path.isfile(manifest_path):
+            return None
+        try:
+            return PackageManifest.load(manifest_path)
+        except (OSError, IOError, ValueError, KeyError) as e:
+            logger.debug("Ignoring invalid manifest {}: {}".format(manifest_path, e))
+            return None
+
+    def update(self, lineage, output_dir_path):
+        """
+        Record a new translation of a lineage, deduplicating its files against the
+        previous translation.
+
+        :param lineage: The lineage, see :meth:`get_lineage`.
+        :param output_dir_path: Path to the ``output`` folder of the translation.
+        :returns: The :class:`PackageDiff` between the previous and the new translation.
+        """
+
+        lineage_dir = self.__get_lineage_dir(lineage)
+        # concurrent updates of the lineage can both create the directory
+        os.makedirs(lineage_dir, exist_ok=True)
+        resources = BlobStore(
+            os.path.join(lineage_dir, "resources"),
+            supports_reflink=self.__get_supports_reflink(),
+        )
+
+        manifest = PackageManifest.from_directory(output_dir_path)
+
+        with FileLock(os.path.join(lineage_dir, "lineage.lock")):
+            package_diff = manifest.diff(self.get_manifest(lineage))
+
+            digests = set()
+            if resources.supports_reflink:
+                for rel_path, entry in manifest.entries.items():
+                    digest = entry["digest"]
+                    digests.add(digest)
+                    path = os.path.join(output_dir_path, *rel_path.split("/"))
+                    # share the data of the file with the previous translation
+                    if not (resources.has(digest) and resources.share(digest, path)):
+                        resources.add(digest, path)
+
+            # only keep the resources of the latest translation
+            for digest in resources.get_digests():
+                if digest not in digests:
+                    resources.remove(digest)
+
+            manifest.save(os.path.join(lineage_dir, self.MANIFEST_FILE_NAME))
+
+        logger.debug("Translation of {}: {}".format(lineage, package_diff))
+        return package_diff
+
+    def __get_supports_reflink(self):
+        """Check once if copy-on-write clones can be created in the store."""
+        if self.__supports_reflink is None:
+            os.makedirs(self.__root, exist_ok=True)
+            self.__supports_reflink = is_reflink_supported(self.__root)
+        return self.__supports_reflink
+
+    def __get_lineage_dir(self, lineage):
+        """Get the directory where a lineage is stored."""
+        return os.path.join(
+            self.__root, hashlib.sha1(lineage.encode("utf-8")).hexdigest()
+        )
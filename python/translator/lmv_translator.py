@@ -8,11 +8,29 @@
 # agreement to the ShotGrid Pipeline Toolkit Source Code License. All rights
 # not expressly granted therein are reserved by Autodesk.
 
+import functools
 import os
 import sgtk
 import shutil
-import subprocess
-import tempfile
+import threading
+import time
+
+from .file_utils import get_directory_size, link_or_copy_file
+from .metrics import PipelineMetrics
+from .packager import LMVPackager
+from .process_log import ProcessLog
+from .registry import get_translator_registry
+from .thumbnail import find_output_image, resize_image
+from .translation_handle import (
+    TranslationCancelled,
+    TranslationError,
+    TranslationHandle,
+    TranslationLimitError,
+    TranslationTimeout,
+)
+from .translation_statistics import TranslationStatistics, get_translation_statistics
+from .translator_path_cache import get_translator_path_cache
+from .workspace import get_workspace_manager
 
 logger = sgtk.platform.get_logger(__name__)
 
@@ -20,15 +38,96 @@ logger = sgtk.platform.get_logger(__name__)
 class LMVTranslator:
     """A class to translate files to be consumed by the Flow Production Tracking 3D LMV Viewer."""
 
-    def __init__(self, path, tk, context):
+    # Ways to give the source file to the translator:
+    # - copy: always copy the source file to the output directory
+    # - link: clone or hard link the source file to the output directory when the
+    #   filesystem allows it, copy it otherwise
+    # - direct: give the original source path to the translator
+    SOURCE_STAGING_COPY = "copy"
+    SOURCE_STAGING_LINK = "link"
+    SOURCE_STAGING_DIRECT = "direct"
+
+    # name of the log file of the translator output, written to the output directory
+    LOG_FILE_NAME = "translator.log"
+
+    # maximum width and height of the thumbnails extracted from the translations, and
+    # name of the directory of the output directory they are cached in
+    THUMBNAIL_SIZE = 512
+    THUMBNAIL_DIR_NAME = "thumbnails"
+
+    def __init__(
+        self,
+        path,
+        tk,
+        context,
+        cache=None,
+        translator_path=None,
+        source_staging=None,
+        lineage_store=None,
+        lineage=None,
+        metrics=None,
+        service=None,
+        limits=None,
+        workspace_manager=None,
+        line_hooks=None,
+        resource_store=None,
+        statistics=None,
+    ):
         """
         Class constructor.
 
         :param path: Path to the source file we want to perform operations on.
+        :param cache: Optional :class:`TranslationCache` used to reuse the results of
+                      previous translations of the same file.
+        :param translator_path: Optional path to the translator executable. If not
+                                supplied, it will be resolved from the file type.
+        :param source_staging: How the source file is given to the translator, one of the
+                               ``SOURCE_STAGING_*`` values. If not supplied, the source
+                               file is given directly to the translators able to read it
+                               at its original path, and linked otherwise.
+        :param lineage_store: Optional :class:`LineageStore` used to reuse the unchanged
+                              files of the previous translation of the same lineage.
+        :param lineage: The lineage of the source file. If not supplied, it is deduced
+                        from the source path by the lineage store.
+        :param metrics: Optional :class:`PipelineMetrics` the timings of the translation
+                        are recorded to. If not supplied, a new one is created.
+        :param service: Optional :class:`TranslationServiceClient` the translation is
+                        submitted to, instead of running the translator in this process.
+        :param limits: Optional :class:`ResourceLimits` applied to the translator
+                       process.
+        :param workspace_manager: Optional :class:`WorkspaceManager` creating the
+                                  temporary output directories. If not supplied, the
+                                  workspace manager of the process is used.
+        :param line_hooks: Optional list of callables called with each line of the
+                           translator output, e.g. to parse its warnings.
+        :param resource_store: Optional :class:`ResourceStore` the packaged files are
+                               added to, so the files shared with the packages already
+                               stored are kept once on disk.
+        :param statistics: Optional :class:`TranslationStatistics` the cost and the
+                           outcome of the translation are recorded to. If not supplied,
+                           the statistics of the process are used.
         """
         self.__source_path = path
         self.__tk = tk
         self.__context = context
+        self.__cache = cache
+        self.__translator_path = translator_path
+        self.__source_staging = source_staging
+        self.__lineage_store = lineage_store
+        self.__lineage = lineage
+        self.__package_diff = None
+        self.__metrics = metrics or PipelineMetrics("lmv_translation", source_path=path)
+        self.__service = service
+        self.__limits = limits
+        self.__workspace_manager = workspace_manager or get_workspace_manager()
+        self.__workspace = None
+        self.__line_hooks = list(line_hooks or [])
+        self.__log = None
+        self.__resource_store = resource_store
+        self.__package_manifest = None
+        self.__statistics = statistics or get_translation_statistics()
+        # True when the last translation reused a translation of the cache
+        self.__reused = False
         self.__output_directory = None
         self.__svf_path = None
 
@@ -40,19 +139,29 @@ class LMVTranslator:
         Return a mapping of file types to translator engine.
 
         The translator engine is the name of the engine that has the necessary tools to
-        translate the file type.
+        translate the file type. File types are lower case extensions, see
+        :class:`TranslatorRegistry` for the registered translators.
         """
 
         return {
-            ".wire": "tk-alias",
-            ".CATPart": "tk-alias",
-            ".jt": "tk-alias",
-            ".igs": "tk-alias",
-            ".stp": "tk-alias",
-            ".fbx": "tk-alias",
-            ".vpb": "tk-vred",
+            extension: get_translator_registry().get_entry(extension).engine_name
+            for extension in get_translator_registry().get_extensions()
         }
 
+    def get_translator_engine(path):
+        """
+        Return the name of the engine able to translate the given file.
+
+        :param path: Path to the file to translate.
+        :type path: str
+
+        :return: The engine name or None if the file type isn't supported.
+        :rtype: str
+        """
+
+        entry = get_translator_registry().get_entry(path)
+        return entry.engine_name if entry else None
+
     def get_translator_relative_paths():
         """
         Return a mapping of translator engine to the relative path of the translator executable.
@@ -61,8 +170,8 @@ class LMVTranslator:
         """
 
         return {
-            "tk-alias": os.path.join("LMVExtractor", "atf_lmv_extractor.exe"),
-            "tk-vred": os.path.join("LMV", "viewing-vpb-lmv.exe"),
+            entry.engine_name: entry.relative_path
+            for entry in get_translator_registry().entries
         }
 
     def find_translator_path(tk, context, engine_name, translator_executable_path):
@@ -79,10 +188,22 @@ class LMVTranslator:
         :type extractor_path: str
 
         :return: The thumbnail extractor executable path relative to the engine's software
-            location.
+            location, or None if it can't be found.
         :rtype: str
         """
 
+        # Scanning the software is slow, first look for a translator found previously
+        translator_path_cache = get_translator_path_cache()
+        translator_path = translator_path_cache.get(
+            engine_name, translator_executable_path
+        )
+        if translator_path:
+            return translator_path
+
+        # Without Toolkit instance, e.g. on a farm node, the software can't be scanned
+        if tk is None:
+            return None
+
         # Create the engine laucnher in order to discover the engine's software location
         launcher = sgtk.platform.create_engine_launcher(tk, context, engine_name)
         software_versions = launcher.scan_software()
@@ -96,6 +217,9 @@ class LMVTranslator:
             root_dir = os.path.dirname(software_exe_path)
             translator_path = os.path.join(root_dir, translator_executable_path)
             if os.path.exists(translator_path):
+                translator_path_cache.set(
+                    engine_name, translator_executable_path, translator_path
+                )
                 return translator_path
 
         # No translator executable path found
@@ -113,6 +237,52 @@ class LMVTranslator:
         """
         return self.__source_path
 
+    @property
+    def cache(self):
+        """
+        Cache used to reuse the results of previous translations.
+
+        :returns: The :class:`TranslationCache` instance, or None if no cache is used
+        """
+        return self.__cache
+
+    @property
+    def metrics(self):
+        """
+        Timings and counters recorded while translating and packaging the source file.
+
+        :returns: The :class:`PipelineMetrics` instance
+        """
+        return self.__metrics
+
+    @property
+    def package_diff(self):
+        """
+        Difference between the last translation and the previous translation of the same lineage.
+
+        :returns: The :class:`PackageDiff`, or None if no lineage store is used
+        """
+        return self.__package_diff
+
+    @property
+    def package_manifest(self):
+        """
+        Files of the last package, as references into the resource store.
+
+        :returns: The :class:`PackageManifest`, or None if no resource store is used
+        """
+        return self.__package_manifest
+
+    @property
+    def log(self):
+        """
+        Output of the last translator process run, written to the ``translator.log`` file
+        of the output directory.
+
+        :returns: The :class:`ProcessLog` instance, or None if no translator has been run
+        """
+        return self.__log
+
     @property
     def output_directory(self):
         """
@@ -125,103 +295,209 @@ class LMVTranslator:
     ################################################################################################
     # public methods
 
-    def translate(self, output_directory=None):
+    def translate(self, output_directory=None, timeout=None):
         """
         Run the translation to convert the source file to a bunch of files needed by the 3D Viewer.
 
         :param output_directory: Path to the directory we want to translate the file to. If no path is supplied, a
                                 temporary one will be used
-        :param use_framework_translator: True will use the translator shipped with the framework, else
-                                         False (default) will use a translator based on the type of file to
-                                         translate and the current engine running.
+        :param timeout: Maximum number of seconds the translation can take, None to wait forever
         :returns: The path to the directory where all the translated files have been written.
         """
+        return self.translate_async(output_directory, timeout=timeout).result()
 
-        self.__output_directory = output_directory
-
-        translator_path = self.get_translator_path()
-        logger.debug(
-            "Using LMV Tanslator: {translator}".format(translator=translator_path)
-        )
-
-        if self.output_directory is None:
-            # generate all the files and folders needed for the translation
-            self.__output_directory = tempfile.mkdtemp(prefix="lmv_")
-        output_path = os.path.join(
-            self.output_directory, os.path.basename(self.source_path)
-        )
+    def translate_async(
+        self, output_directory=None, timeout=None, progress_callback=None
+    ):
+        """
+        Start running the translation in the background.
 
-        index_file_path = os.path.join(self.output_directory, "index.json")
-        open(index_file_path, "w").close()
+        :param output_directory: Path to the directory we want to translate the file to. If no path is supplied, a
+                                temporary workspace will be used, and removed if the translation fails or by
+                                :meth:`cleanup`
+        :param timeout: Maximum number of seconds the translation can take, None to wait forever
+        :param progress_callback: Optional callable called with the progress, between 0 and 1, and the translator
+                                  output line it has been read from
+        :returns: A :class:`TranslationHandle` to follow, wait for or cancel the translation.
+        :raises TranslationError: If the source file is bigger than the translator can handle.
+        """
 
-        # copy the source file to the temporary location and run the translation
-        logger.debug("Copying source file to temporary folder")
-        shutil.copyfile(self.source_path, output_path)
+        # the workspace of a previous translation isn't used anymore
+        self.cleanup()
+        self.__output_directory = output_directory
 
-        logger.debug("Running translation process")
-        cmd = [translator_path, index_file_path, output_path]
-        p = subprocess.Popen(cmd, stdout=subprocess.PIPE, stderr=subprocess.PIPE)
-        p_output, _ = p.communicate()
+        translator_entry = get_translator_registry().get_entry(self.source_path)
+        if translator_entry and not translator_entry.check_size(
+            os.path.getsize(self.source_path)
+        ):
+            raise TranslationError(
+                "{} is bigger than the {} bytes the {} translator can handle".format(
+                    self.source_path,
+                    translator_entry.max_size,
+                    translator_entry.engine_name,
+                )
+            )
 
-        if p.returncode != 0:
-            raise Exception(p_output)
+        if self.__service:
+            # the service picks the translator of the file itself
+            translator_path = None
+        else:
+            with self.metrics.stage("resolve_translator"):
+                translator_path = self.get_translator_path()
+            logger.debug(
+                "Using LMV Tanslator: {translator}".format(translator=translator_path)
+            )
+            self.metrics.set("translator_path", translator_path)
 
-        return self.output_directory
+        if self.output_directory is None:
+            # generate all the files and folders needed for the translation
+            self.__workspace = self.__workspace_manager.create()
+            self.__output_directory = self.__workspace.path
 
-    def package(self, svf_file_name=None, thumbnail_path=None):
+        handle = TranslationHandle(
+            functools.partial(self.__run_in_workspace, translator_path),
+            timeout=timeout,
+            progress_callback=progress_callback,
+        )
+        handle.start()
+        return handle
+
+    def package(
+        self,
+        svf_file_name=None,
+        thumbnail_path=None,
+        compression_level=LMVPackager.DEFAULT_COMPRESSION_LEVEL,
+        workers=1,
+    ):
         """
         Package all the translated files into a zip file and extract the LMV thumbnail if needed
 
         :param svf_file_name: If supplied, rename the svf file according to the given name
         :param thumbnail_path: If supplied, use this thumbnail as LMV thumbnail. Otherwise, try to extract the thumbnail
                                from the source file
+        :param compression_level: The deflate compression level used for the files which aren't already compressed,
+                                  from 0 (no compression) to 9 (best compression)
+        :param workers: Number of threads reading the files to package ahead of their compression
         :return: The path to the zip file and the path to the thumbnail shipped with the LMV file
         """
 
-        if not self.output_directory or not os.path.isdir(self.output_directory):
-            raise Exception(
-                "Couldn't package the LMV files: no file seems to have been created"
+        with self.metrics.stage("prepare_package"):
+            svf_file_name, package_thumbnail_path = self.__prepare_package(
+                svf_file_name, thumbnail_path
             )
+        self.__store_resources()
 
-        output_dir_path = os.path.join(self.output_directory, "output")
+        # zip the package
+        logger.debug("Making archive from LMV files")
+        packager = LMVPackager(
+            os.path.join(self.output_directory, "output"),
+            compression_level=compression_level,
+            workers=workers,
+        )
+        with self.metrics.stage("zip"):
+            zip_path = packager.write(
+                os.path.join(self.output_directory, "{}.zip".format(svf_file_name))
+            )
+        self.metrics.add_bytes(written=os.path.getsize(zip_path))
+        self.metrics.set("package_size", os.path.getsize(zip_path))
 
-        # rename the svf file if needed
-        if svf_file_name:
-            logger.debug("Renaming SVF file")
-            source_path = self.__get_svf_path()
-            target_path = os.path.join(
-                output_dir_path, "1", "{}.svf".format(svf_file_name)
+        return zip_path, package_thumbnail_path
+
+    def package_stream(
+        self,
+        svf_file_name=None,
+        thumbnail_path=None,
+        compression_level=LMVPackager.DEFAULT_COMPRESSION_LEVEL,
+        workers=1,
+        max_memory_size=None,
+    ):
+        """
+        Package all the translated files into a zip archive kept in memory, unless it is too big, instead of writing
+        a zip file next to the translated files
+
+        :param svf_file_name: If supplied, rename the svf file according to the given name
+        :param thumbnail_path: If supplied, use this thumbnail as LMV thumbnail
+        :param compression_level: The deflate compression level, see :meth:`package`
+        :param workers: Number of threads reading the files to package, see :meth:`package`
+        :param max_memory_size: Maximum size of the archive kept in memory, in bytes. Bigger archives are written to
+                                the output directory
+        :return: The :class:`SpooledPackage` holding the archive and the path to the thumbnail shipped with the LMV
+                 file. The package must be closed once it has been consumed
+        """
+
+        with self.metrics.stage("prepare_package"):
+            svf_file_name, package_thumbnail_path = self.__prepare_package(
+                svf_file_name, thumbnail_path
             )
-            if os.path.isfile(target_path):
-                raise Exception(
-                    "Couldn't rename svf file: target path %s already exists"
-                    % target_path
-                )
-            os.rename(source_path, target_path)
-            self.__svf_path = target_path
-        else:
-            svf_file_name = os.path.splitext(os.path.basename(self.source_path)[0])
+        self.__store_resources()
 
-        if thumbnail_path:
-            images_dir_path = os.path.join(output_dir_path, "images")
-            if not os.path.exists(images_dir_path):
-                os.makedirs(images_dir_path)
-            package_thumbnail_path = os.path.join(
-                images_dir_path, "{}.jpg".format(svf_file_name)
+        logger.debug("Streaming archive from LMV files")
+        packager = LMVPackager(
+            os.path.join(self.output_directory, "output"),
+            compression_level=compression_level,
+            workers=workers,
+        )
+        with self.metrics.stage("zip"):
+            package = packager.write_spooled(
+                max_memory_size=max_memory_size,
+                directory=self.output_directory,
+                file_name="{}.zip".format(svf_file_name),
             )
-            shutil.copyfile(thumbnail_path, package_thumbnail_path)
-        else:
-            package_thumbnail_path = None
+        if package.rolled_over:
+            self.metrics.add_bytes(written=package.size)
+        self.metrics.set("package_size", package.size)
+        logger.debug(
+            "Archive of {} bytes kept {}".format(
+                package.size, "on disk" if package.rolled_over else "in memory"
+            )
+        )
 
-        # zip the package
-        logger.debug("Making archive from LMV files")
-        zip_path = shutil.make_archive(
-            base_name=os.path.join(self.output_directory, svf_file_name),
-            format="zip",
-            root_dir=output_dir_path,
+        return package, package_thumbnail_path
+
+    def extract_thumbnail(self, size=THUMBNAIL_SIZE):
+        """
+        Get a thumbnail of the model from the image written by the translator, without running any other process.
+
+        The image is resized once and cached in the output directory, next to the translated files.
+
+        :param size: Maximum width and height of the thumbnail, in pixels
+        :return: The path to the thumbnail, or None if the translator didn't write any image
+        """
+
+        if not self.output_directory:
+            return None
+        image_path = find_output_image(
+            os.path.join(self.output_directory, "output"),
+            os.path.splitext(os.path.basename(self.source_path))[0],
         )
+        if not image_path:
+            logger.debug(
+                "No image found in the translation of {}".format(self.source_path)
+            )
+            return None
 
-        return zip_path, package_thumbnail_path
+        thumbnail_dir_path = os.path.join(
+            self.output_directory, self.THUMBNAIL_DIR_NAME, str(size)
+        )
+        thumbnail_path = os.path.join(thumbnail_dir_path, os.path.basename(image_path))
+        if os.path.isfile(thumbnail_path) and os.path.getmtime(
+            thumbnail_path
+        ) >= os.path.getmtime(image_path):
+            return thumbnail_path
+
+        if not os.path.isdir(thumbnail_dir_path):
+            os.makedirs(thumbnail_dir_path, exist_ok=True)
+        # resized to a temporary path, so a thumbnail being written is never used
+        tmp_path = os.path.join(
+            thumbnail_dir_path,
+            ".{}_{}_{}".format(
+                os.getpid(), threading.get_ident(), os.path.basename(image_path)
+            ),
+        )
+        with self.metrics.stage("extract_thumbnail"):
+            resize_image(image_path, tmp_path, size)
+            os.replace(tmp_path, thumbnail_path)
+        return thumbnail_path
 
     def get_translator_path(self):
         """
@@ -231,24 +507,25 @@ class LMVTranslator:
         :rtype: str
         """
 
+        if self.__translator_path:
+            return self.__translator_path
+
         _, ext = os.path.splitext(self.source_path)
         current_engine = sgtk.platform.current_engine()
 
-        translator_engine = LMVTranslator.get_translators_by_file_type().get(ext)
-        if not translator_engine:
-            raise Exception("LMV translation does not support file type: {ext}")
-
-        translator_relative_path = LMVTranslator.get_translator_relative_paths().get(
-            translator_engine
-        )
-        if not translator_relative_path:
+        translator_entry = get_translator_registry().get_entry(self.source_path)
+        if not translator_entry:
             raise Exception(
-                "Mising translator information for engine: {translator_engine}"
+                "LMV translation does not support file type: {ext}".format(ext=ext)
             )
+        translator_engine = translator_entry.engine_name
+        translator_relative_path = translator_entry.relative_path
 
         # First try a shortcut to get the translator executable path from the current engine
-        if current_engine.name == translator_engine and hasattr(
-            current_engine, "executable_path"
+        if (
+            current_engine
+            and current_engine.name == translator_engine
+            and hasattr(current_engine, "executable_path")
         ):
             root_dir = os.path.dirname(current_engine.executable_path)
             translator_path = os.path.join(root_dir, translator_relative_path)
@@ -263,13 +540,375 @@ class LMVTranslator:
             translator_engine,
             translator_relative_path,
         )
-        if not os.path.exists(translator_path):
-            raise Exception("Couldn't find translator for Alias.")
+        if not translator_path or not os.path.exists(translator_path):
+            raise Exception(
+                "Couldn't find translator for {translator_engine}.".format(
+                    translator_engine=translator_engine
+                )
+            )
         return translator_path
 
+    def cleanup(self):
+        """
+        Remove the temporary workspace the source file has been translated to, if any.
+
+        The translated files stay available until this is called, even after the
+        translator is garbage collected. A workspace which is never cleaned up is
+        removed by :meth:`WorkspaceManager.collect_garbage` once this process is over.
+        Output directories supplied to :meth:`translate` are left untouched.
+        """
+
+        if self.__workspace:
+            self.__workspace.remove()
+            self.__workspace = None
+
     ########################################################################################
     # private methods
 
+    def __run_in_workspace(self, translator_path, handle):
+        """
+        Run the translation, removing the temporary workspace if it fails.
+
+        The cost and the outcome of the translation are recorded to the statistics,
+        whether it succeeds or not.
+
+        :param translator_path: The path to the translator executable
+        :param handle: The :class:`TranslationHandle` of the translation
+        :return: The path to the directory where all the translated files have been written
+        """
+
+        start_time = time.time()
+        self.__reused = False
+        outcome = TranslationStatistics.FAILURE
+        try:
+            if not self.__workspace:
+                output_directory = self.__run_translation(translator_path, handle)
+            else:
+                with self.__workspace:
+                    output_directory = self.__run_translation(translator_path, handle)
+            if self.__service:
+                outcome = TranslationStatistics.SERVICE
+            elif self.__reused:
+                outcome = TranslationStatistics.CACHE_HIT
+            else:
+                outcome = TranslationStatistics.SUCCESS
+            return output_directory
+        except TranslationCancelled:
+            outcome = TranslationStatistics.CANCELLED
+            raise
+        except TranslationTimeout:
+            outcome = TranslationStatistics.TIMEOUT
+            raise
+        except TranslationLimitError as e:
+            if e.limit == "memory":
+                outcome = TranslationStatistics.MEMORY_LIMIT
+            else:
+                outcome = TranslationStatistics.TIMEOUT
+            raise
+        finally:
+            self.__record_statistics(
+                outcome, time.time() - start_time, handle.peak_memory
+            )
+
+    def __run_translation(self, translator_path, handle):
+        """
+        Run the translation process, reusing a cached translation if possible.
+
+        :param translator_path: The path to the translator executable
+        :param handle: The :class:`TranslationHandle` of the translation
+        :return: The path to the directory where all the translated files have been written
+        """
+
+        if self.__service:
+            return self.__run_service_translation(handle)
+
+        if not self.cache:
+            self.__extract(translator_path, handle)
+            self.__update_lineage()
+            return self.output_directory
+
+        with self.metrics.stage("cache_fetch"):
+            cache_key = self.cache.get_key(self.source_path, translator_path)
+            # a miss is only counted once the lookup is tried again below
+            cache_hit = self.cache.fetch(
+                cache_key, self.output_directory, self.source_path, count_miss=False
+            )
+        self.metrics.set("cache_hit", cache_hit)
+        if cache_hit:
+            logger.debug("Reusing cached translation")
+            self.__reused = True
+            self.__update_lineage()
+            return self.output_directory
+
+        # another process may be translating the same content: wait for it to be over
+        # and reuse its translation instead of running the translator twice
+        translation_lock = self.cache.get_translation_lock(cache_key)
+        with self.metrics.stage("wait_for_translation"):
+            while not translation_lock.acquire(blocking=False):
+                handle.check_cancelled()
+                handle.check_timeout()
+                time.sleep(handle.POLL_INTERVAL)
+        try:
+            if self.cache.fetch(cache_key, self.output_directory, self.source_path):
+                logger.debug("Reusing translation made by another process")
+                self.metrics.set("coalesced", True)
+                self.__reused = True
+            else:
+                self.__extract(translator_path, handle)
+                with self.metrics.stage("cache_store"):
+                    self.cache.store(cache_key, self.output_directory, self.source_path)
+        finally:
+            translation_lock.release()
+
+        self.__update_lineage()
+        return self.output_directory
+
+    def __extract(self, translator_path, handle):
+        """
+        Run the translator process on the source file.
+
+        :param translator_path: The path to the translator executable
+        :param handle: The :class:`TranslationHandle` of the translation
+        :raises TranslationError: If the translator failed
+        """
+
+        index_file_path = os.path.join(self.output_directory, "index.json")
+        open(index_file_path, "w").close()
+
+        with self.metrics.stage("stage_source"):
+            input_path = self.__stage_source()
+
+        logger.debug("Running translation process")
+        cmd = [translator_path, index_file_path, input_path]
+        self.__log = ProcessLog(os.path.join(self.output_directory, self.LOG_FILE_NAME))
+        for hook in self.__line_hooks:
+            self.__log.add_line_hook(hook)
+        with self.metrics.stage("extract"):
+            try:
+                returncode, _ = handle.run_process(
+                    cmd, limits=self.__limits, log=self.__log
+                )
+            except TranslationLimitError as e:
+                self.metrics.set("exceeded_limit", e.limit)
+                self.metrics.set("extractor_peak_memory", e.usage["peak_memory"])
+                raise
+        self.metrics.set("extractor_exit_code", returncode)
+        self.metrics.set("extractor_peak_memory", handle.peak_memory)
+        self.metrics.set("extractor_output_lines", self.__log.line_count)
+        self.metrics.set("extractor_warnings", self.__log.warning_count)
+        self.metrics.add_bytes(
+            read=os.path.getsize(self.source_path),
+            written=get_directory_size(os.path.join(self.output_directory, "output")),
+        )
+
+        if returncode != 0:
+            # the log file of a temporary workspace is removed with it
+            raise TranslationError(
+                "Translator failed with exit code {}:\n{}".format(
+                    returncode,
+                    self.__log.get_summary(include_path=self.__workspace is None),
+                )
+            )
+
+    def __run_service_translation(self, handle):
+        """
+        Submit the translation to the translation service and wait for it to be over.
+
+        The service doesn't stop the translation when it is cancelled here, as other
+        clients may be waiting for the same translation.
+
+        :param handle: The :class:`TranslationHandle` of the translation
+        :return: The path to the directory where all the translated files have been written
+        """
+
+        logger.debug(
+            "Submitting translation to service {}".format(self.__service.address)
+        )
+        self.metrics.set("translation_service", str(self.__service.address))
+        with self.metrics.stage("extract"):
+            self.__service.translate(
+                self.source_path,
+                output_directory=self.output_directory,
+                timeout=handle.timeout,
+            )
+        handle.check_cancelled()
+        self.__update_lineage()
+        return self.output_directory
+
+    def __record_statistics(self, outcome, duration, peak_memory):
+        """
+        Record the cost and the outcome of the translation, to predict the cost of the
+        next translations of similar files.
+
+        :param outcome: How the translation ended, see :class:`TranslationStatistics`
+        :param duration: Wall time of the translation, in seconds
+        :param peak_memory: Peak memory of the translator process in bytes, None if
+                            no translator process has been run
+        """
+
+        self.metrics.set("outcome", outcome)
+        translator_entry = get_translator_registry().get_entry(self.source_path)
+        try:
+            self.__statistics.record(
+                self.source_path,
+                translator_entry.engine_name if translator_entry else None,
+                duration,
+                peak_memory,
+                outcome=outcome,
+            )
+        except Exception as e:
+            # the source file may be gone, which mustn't hide the translation result
+            logger.debug("Couldn't record translation statistics: {}".format(e))
+
+    def __update_lineage(self):
+        """
+        Record the translation in the lineage store, if any, sharing the unchanged files with the previous
+        translation of the same lineage.
+        """
+
+        if not self.__lineage_store:
+            return
+
+        lineage = self.__lineage or self.__lineage_store.get_lineage(self.source_path)
+        with self.metrics.stage("lineage_update"):
+            self.__package_diff = self.__lineage_store.update(
+                lineage, os.path.join(self.output_directory, "output")
+            )
+        self.metrics.set("package_diff", self.__package_diff.to_dict())
+
+    def __store_resources(self):
+        """Add the files to package to the resource store, if any."""
+
+        if not self.__resource_store:
+            return
+
+        with self.metrics.stage("store_resources"):
+            manifest, new_bytes = self.__resource_store.add_directory(
+                os.path.join(self.output_directory, "output")
+            )
+            manifest_id = self.__resource_store.save_manifest(manifest)
+        self.__package_manifest = manifest
+        self.metrics.set("package_manifest_id", manifest_id)
+        self.metrics.set("package_new_bytes", new_bytes)
+        self.metrics.set("package_shared_bytes", manifest.total_size - new_bytes)
+
+    def __prepare_package(self, svf_file_name, thumbnail_path):
+        """
+        Rename the svf file and add the thumbnail to the translated files before packaging them
+
+        :param svf_file_name: If supplied, rename the svf file according to the given name
+        :param thumbnail_path: If supplied, use this thumbnail as LMV thumbnail
+        :return: The name of the svf file and the path to the thumbnail shipped with the LMV file
+        """
+
+        if not self.output_directory or not os.path.isdir(self.output_directory):
+            raise Exception(
+                "Couldn't package the LMV files: no file seems to have been created"
+            )
+
+        output_dir_path = os.path.join(self.output_directory, "output")
+
+        # rename the svf file if needed
+        if svf_file_name:
+            logger.debug("Renaming SVF file")
+            source_path = self.__get_svf_path()
+            target_path = os.path.join(
+                output_dir_path, "1", "{}.svf".format(svf_file_name)
+            )
+            if source_path != target_path:
+                if os.path.isfile(target_path):
+                    raise Exception(
+                        "Couldn't rename svf file: target path %s already exists"
+                        % target_path
+                    )
+                os.rename(source_path, target_path)
+                self.__svf_path = target_path
+        else:
+            svf_file_name = os.path.splitext(os.path.basename(self.source_path))[0]
+
+        if thumbnail_path:
+            images_dir_path = os.path.join(output_dir_path, "images")
+            if not os.path.exists(images_dir_path):
+                os.makedirs(images_dir_path)
+            package_thumbnail_path = os.path.join(
+                images_dir_path, "{}.jpg".format(svf_file_name)
+            )
+            if os.path.isfile(package_thumbnail_path):
+                # never write through a link to a file shared with other packages
+                os.remove(package_thumbnail_path)
+            shutil.copyfile(thumbnail_path, package_thumbnail_path)
+        else:
+            # the package ships the image written by the translator, if any
+            package_thumbnail_path = find_output_image(
+                output_dir_path,
+                os.path.splitext(os.path.basename(self.source_path))[0],
+            )
+
+        return svf_file_name, package_thumbnail_path
+
+    def __stage_source(self):
+        """
+        Make the source file available to the translator according to the staging mode.
+
+        :return: The path of the file to give to the translator
+        """
+
+        source_staging = self.__source_staging
+        if source_staging is None:
+            translator_entry = get_translator_registry().get_entry(self.source_path)
+            if translator_entry and translator_entry.direct_path_input:
+                source_staging = self.SOURCE_STAGING_DIRECT
+            else:
+                source_staging = self.SOURCE_STAGING_LINK
+
+        if source_staging == self.SOURCE_STAGING_DIRECT:
+            logger.debug(
+                "Using source file directly, avoided copying {} bytes".format(
+                    os.path.getsize(self.source_path)
+                )
+            )
+            self.metrics.set("source_staging", "direct")
+            return self.source_path
+
+        staged_path = os.path.join(
+            self.output_directory, os.path.basename(self.source_path)
+        )
+        if source_staging == self.SOURCE_STAGING_LINK:
+            # a clone or a hard link doesn't take any space, only check the free
+            # space when falling back to a copy
+            strategy = link_or_copy_file(
+                self.source_path,
+                staged_path,
+                before_copy=self.__check_free_space_for_source,
+            )
+        else:
+            self.__check_free_space_for_source()
+            shutil.copyfile(self.source_path, staged_path)
+            strategy = "copy"
+
+        bytes_avoided = 0 if strategy == "copy" else os.path.getsize(staged_path)
+        self.metrics.set("source_staging", strategy)
+        if strategy == "copy":
+            self.metrics.add_bytes(
+                read=os.path.getsize(staged_path), written=os.path.getsize(staged_path)
+            )
+        logger.debug(
+            "Staged source file using {}, avoided copying {} bytes".format(
+                strategy, bytes_avoided
+            )
+        )
+        return staged_path
+
+    def __check_free_space_for_source(self):
+        """
+        Check that the source file can be copied to the output directory.
+
+        :raises WorkspaceError: If there isn't enough free space on the volume.
+        """
+        self.__workspace_manager.check_free_space(
+            self.output_directory, os.path.getsize(self.source_path)
+        )
+
     def __get_svf_path(self):
         """
         Get the SFV file path according to the output directory
@@ -0,0 +1,229 @@
+# Copyright (c) 2026 Autodesk.
+#
+# CONFIDENTIAL AND PROPRIETARY
+#
+# This work is provided "AS IS" and subject to the ShotGrid Pipeline Toolkit
+# Source Code License included in this distribution package. See LICENSE.
+# By accessing, using, copying or modifying this work you indicate your
+# agreement to the ShotGrid Pipeline Toolkit Source Code License. All rights
+# not expressly granted therein are reserved by Autodesk.
+
+import json
+import os
+
+from .file_utils import hash_file
+
+
+class PackageManifest(object):
+    """
+    A description of the files of an LMV output tree.
+
+    Each file is identified by its path relative to the root of the tree, using ``/`` as
+    separator, and described by the digest of its content and its size.
+    """
+
+    FORMAT_VERSION = 1
+
+    def __init__(self, entries=None):
+        """
+        Class constructor.
+
+        :param entries: Dictionary of relative paths to ``{"digest": str, "size": int}``
+                        dictionaries.
+        """
+        self.__entries = dict(entries or {})
+
+    @classmethod
+    def from_directory(cls, root_dir):
+        """
+        Build the manifest of all the files stored under a directory.
+
+        :param root_dir: Path to the root of the tree.
+        :returns: The :class:`PackageManifest`.
+        """
+
+        entries = {}
+        for root, _, file_names in os.walk(root_dir):
+            for file_name in file_names:
+                path = os.path.join(root, file_name)
+                rel_path = os.path.relpath(path, root_dir).replace(os.sep, "/")
+                entries[rel_path] = {
+                    "digest": hash_file(path),
+                    "size": os.path.getsize(path),
+                }
+        return cls(entries)
+
+    @classmethod
+    def load(cls, path):
+        """
+        Read a manifest from a JSON file.
+
+        :param path: Path to the manifest file.
+        :returns: The :class:`PackageManifest`.
+        """
+
+        with open(path, "r") as fh:
+            data = json.load(fh)
+        if data.get("version") != cls.FORMAT_VERSION:
+            raise ValueError(
+                "Unsupported manifest version {} in {}".format(
+                    data.get("version"), path
+                )
+            )
+        return cls(data["files"])
+
+    @property
+    def entries(self):
+        """
+        Files described by the manifest.
+
+        :returns: A dictionary of relative paths to ``{"digest": str, "size": int}``
+                  dictionaries
+        """
+        return dict(self.__entries)
+
+    @property
+    def total_size(self):
+        """
+        Total size of the files described by the manifest.
+
+        :returns: The size in bytes
+        """
+        return sum(entry["size"] for entry in self.__entries.values())
+
+    def save(self, path):
+        """
+        Write the manifest to a JSON file.
+
+        :param path: Path to the manifest file.
+        """
+
+        tmp_path = "{}.{}.tmp".format(path, os.getpid())
+        with open(tmp_path, "w") as fh:
+            json.dump(
+                {"version": self.FORMAT_VERSION, "files": self.__entries},
+                fh,
+                indent=2,
+                sort_keys=True,
+            )
+        os.replace(tmp_path, path)
+
+    def diff(self, previous):
+        """
+        Compare this manifest with the manifest of a previous version of the tree.
+
+        :param previous: The previous :class:`PackageManifest`, or None.
+        :returns: The :class:`PackageDiff` between both manifests.
+        """
+
+        previous_digests = set()
+        previous_paths = set()
+        if previous:
+            previous_entries = previous.entries
+            previous_digests = set(e["digest"] for e in previous_entries.values())
+            previous_paths = set(previous_entries)
+
+        reused = []
+        regenerated = []
+        for rel_path, entry in sorted(self.__entries.items()):
+            if entry["digest"] in previous_digests:
+                reused.append((rel_path, entry["size"]))
+            else:
+                regenerated.append((rel_path, entry["size"]))
+        removed = sorted(previous_paths - set(self.__entries))
+
+        return PackageDiff(reused, regenerated, removed)
+
+
+class PackageDiff(object):
+    """
+    The difference between two versions of an LMV output tree: the files whose content
+    already existed in the previous version, the new or modified ones and the ones which
+    don't exist anymore.
+    """
+
+    def __init__(self, reused, regenerated, removed):
+        """
+        Class constructor.
+
+        :param reused: List of (relative path, size) tuples of the reused files.
+        :param regenerated: List of (relative path, size) tuples of the new or modified
+                            files.
+        :param removed: List of relative paths of the removed files.
+        """
+        self.__reused = list(reused)
+        self.__regenerated = list(regenerated)
+        self.__removed = list(removed)
+
+    @property
+    def reused(self):
+        """
+        Files whose content already existed in the previous version.
+
+        :returns: A list of relative paths
+        """
+        return [rel_path for rel_path, _ in self.__reused]
+
+    @property
+    def regenerated(self):
+        """
+        Files which are new or whose content changed.
+
+        :returns: A list of relative paths
+        """
+        return [rel_path for rel_path, _ in self.__regenerated]
+
+    @property
+    def removed(self):
+        """
+        Files of the previous version which don't exist anymore.
+
+        :returns: A list of relative paths
+        """
+        return list(self.__removed)
+
+    @property
+    def reused_bytes(self):
+        """
+        Size of the reused files.
+
+        :returns: The size in bytes
+        """
+        return sum(size for _, size in self.__reused)
+
+    @property
+    def regenerated_bytes(self):
+        """
+        Size of the new or modified files.
+
+        :returns: The size in bytes
+        """
+        return sum(size for _, size in self.__regenerated)
+
+    def to_dict(self):
+        """
+        Get a report of the difference, suitable for JSON serialization.
+
+        :returns: A dictionary.
+        """
+        return {
+            "reused_files": len(self.__reused),
+            "reused_bytes": self.reused_bytes,
+            "regenerated_files": len(self.__regenerated),
+            "regenerated_bytes": self.regenerated_bytes,
+            "removed_files": len(self.__removed),
+            "regenerated": self.regenerated,
+            "removed": self.removed,
+        }
+
+    def __str__(self):
+        return (
+            "{} files reused ({} bytes), {} files regenerated ({} bytes), "
+            "{} files removed".format(
+                len(self.__reused),
+                self.reused_bytes,
+                len(self.__regenerated),
+                self.regenerated_bytes,
+                len(self.__removed),
+            )
+        )
@@ -0,0 +1,164 @@
+# Copyright (c) 2026 Autodesk.
+#
+# CONFIDENTIAL AND PROPRIETARY
+#
+# This work is provided "AS IS" and subject to the ShotGrid Pipeline Toolkit
+# Source Code License included in this distribution package. See LICENSE.
+# By accessing, using, copying or modifying this work you indicate your
+# agreement to the ShotGrid Pipeline Toolkit Source Code License. All rights
+# not expressly granted therein are reserved by Autodesk.
+
+import contextlib
+import json
+import threading
+import time
+
+import sgtk
+
+logger = sgtk.platform.get_logger(__name__)
+
+# callables receiving every emitted metrics record
+_sinks = []
+_sinks_lock = threading.Lock()
+
+
+def add_metrics_sink(sink):
+    """
+    Register a callable receiving the metrics records emitted by the current process.
+
+    :param sink: A callable taking the record, a JSON serializable dictionary, as
+                 argument.
+    """
+    with _sinks_lock:
+        if sink not in _sinks:
+            _sinks.append(sink)
+
+
+def remove_metrics_sink(sink):
+    """
+    Unregister a metrics sink.
+
+    :param sink: A callable previously registered with :func:`add_metrics_sink`.
+    """
+    with _sinks_lock:
+        if sink in _sinks:
+            _sinks.remove(sink)
+
+
+class PipelineMetrics(object):
+    """
+    Timings and counters collected along the LMV publish pipeline.
+
+    Durations are recorded per stage, and bytes read and written are accumulated. The
+    whole record is emitted at once, as a single JSON document, to the debug log and to
+    the registered sinks.
+    """
+
+    def __init__(self, name, **attributes):
+        """
+        Class constructor.
+
+        :param name: Name of the pipeline the metrics are collected for.
+        :param attributes: Additional values describing the pipeline run, e.g. the
+                           source path or the Version id.
+        """
+        self.__name = name
+        self.__values = dict(attributes)
+        self.__stages = {}
+        self.__bytes = {"read": 0, "written": 0}
+        self.__start_time = time.time()
+        self.__lock = threading.Lock()
+
+    @property
+    def name(self):
+        """
+        Name of the pipeline the metrics are collected for.
+
+        :returns: The name as a string
+        """
+        return self.__name
+
+    @contextlib.contextmanager
+    def stage(self, name):
+        """
+        Context manager measuring the duration of a pipeline stage. The durations of
+        stages run several times are added up.
+
+        :param name: Name of the stage.
+        """
+
+        start_time = time.time()
+        try:
+            yield
+        except Exception:
+            self.set("failed_stage", name)
+            raise
+        finally:
+            duration = time.time() - start_time
+            with self.__lock:
+                stage = self.__stages.setdefault(name, {"duration": 0.0, "count": 0})
+                stage["duration"] += duration
+                stage["count"] += 1
+
+    def add_bytes(self, read=0, written=0):
+        """
+        Account for bytes read or written by the pipeline.
+
+        :param read: Number of bytes read.
+        :param written: Number of bytes written.
+        """
+        with self.__lock:
+            self.__bytes["read"] += read
+            self.__bytes["written"] += written
+
+    def set(self, key, value):
+        """
+        Record a value, e.g. the translator exit code.
+
+        :param key: Name of the value.
+        :param value: The value, which must be JSON serializable.
+        """
+        with self.__lock:
+            self.__values[key] = value
+
+    def to_dict(self):
+        """
+        Get the metrics record.
+
+        :returns: A JSON serializable dictionary.
+        """
+        with self.__lock:
+            record = {
+                "name": self.__name,
+                "timestamp": self.__start_time,
+                "total_duration": time.time() - self.__start_time,
+                "stages": dict(
+                    (name, dict(stage)) for name, stage in self.__stages.items()
+                ),
+                "bytes_read": self.__bytes["read"],
+                "bytes_written": self.__bytes["written"],
+            }
+            record.update(self.__values)
+        return record
+
+    def emit(self, sinks=None):
+        """
+        Send the metrics record to the debug log and to the sinks.
+
+        :param sinks: List of sinks to send the record to. If not supplied, the sinks
+                      registered with :func:`add_metrics_sink` are used.
+        :returns: The record sent.
+        """
+
+        record = self.to_dict()
+        logger.debug("LMV metrics: {}".format(json.dumps(record, sort_keys=True)))
+
+        if sinks is None:
+            with _sinks_lock:
+                sinks = list(_sinks)
+        for sink in sinks:
+            try:
+                sink(record)
+            except Exception as e:
+                logger.warning("LMV metrics sink {} failed: {}".format(sink, e))
+        return record
@@ -0,0 +1,436 @@
+# Copyright (c) 2026 Autodesk.
+#
+# CONFIDENTIAL AND PROPRIETARY
+#
+# This work is provided "AS IS" and subject to the ShotGrid Pipeline Toolkit
+# Source Code License included in this distribution package. See LICENSE.
+# By accessing, using, copying or modifying this work you indicate your
+# agreement to the ShotGrid Pipeline Toolkit Source Code License. All rights
+# not expressly granted therein are reserved by Autodesk.
+
+import collections
+import io
+import os
+import queue
+import shutil
+import tempfile
+import threading
+import zipfile
+from concurrent import futures
+
+import sgtk
+
+logger = sgtk.platform.get_logger(__name__)
+
+
+class LMVPackager(object):
+    """
+    A class to build the zip package of the files produced by an LMV translation.
+
+    Entries are streamed to the archive one after the other. Files which are already
+    compressed, like SVF pack files and images, are stored as they are instead of being
+    deflated a second time. Reading the files from disk can be done by several threads so
+    it overlaps with the compression of the previous entries.
+    """
+
+    DEFAULT_COMPRESSION_LEVEL = 6
+
+    # extensions of the files whose content is already compressed
+    STORED_EXTENSIONS = (".pf", ".png", ".jpg", ".jpeg", ".gz", ".zip")
+
+    # files bigger than this are streamed from disk by the writer instead of being read
+    # ahead by the workers
+    MAX_READ_AHEAD_FILE_SIZE = 64 * 1024 * 1024
+
+    def __init__(
+        self,
+        root_dir,
+        compression_level=DEFAULT_COMPRESSION_LEVEL,
+        stored_extensions=STORED_EXTENSIONS,
+        workers=1,
+    ):
+        """
+        Class constructor.
+
+        :param root_dir: Path to the directory to package. Its content is added at the
+                         root of the archive.
+        :param compression_level: The deflate compression level, from 0 (no compression)
+                                  to 9 (best compression).
+        :param stored_extensions: Extensions of the files to store without compression.
+        :param workers: Number of threads reading the files ahead of the compression.
+        """
+        self.__root_dir = root_dir
+        self.__compression_level = compression_level
+        self.__stored_extensions = tuple(ext.lower() for ext in stored_extensions or [])
+        self.__workers = max(1, workers or 1)
+
+    ################################################################################################
+    # properties
+
+    @property
+    def root_dir(self):
+        """
+        Path to the directory to package.
+
+        :returns: The directory path as a string
+        """
+        return self.__root_dir
+
+    ################################################################################################
+    # public methods
+
+    def write(self, zip_path):
+        """
+        Write the package to a zip file on disk.
+
+        :param zip_path: Path to the zip file to create.
+        :returns: The path to the zip file.
+        """
+
+        with open(zip_path, "wb") as fh:
+            self.write_to(fh)
+        return zip_path
+
+    def write_to(self, fileobj):
+        """
+        Write the package to a file-like object.
+
+        :param fileobj: The binary file-like object to write the archive to. It doesn't
+                        need to be seekable.
+        """
+
+        with zipfile.ZipFile(fileobj, "w", allowZip64=True) as zip_file:
+            if self.__workers > 1:
+                self.__write_entries_read_ahead(zip_file)
+            else:
+                for arcname, path, is_dir in self.__iter_entries():
+                    self.__write_entry(zip_file, arcname, path, is_dir)
+
+    def write_spooled(self, max_memory_size=None, directory=None, file_name=None):
+        """
+        Write the package to a :class:`SpooledPackage`, kept in memory as long as it is
+        smaller than the given size.
+
+        :param max_memory_size: Maximum size of the package kept in memory, in bytes.
+        :param directory: Directory where the package is written if it gets too big.
+        :param file_name: Name of the file the package is written to.
+        :returns: The :class:`SpooledPackage`, rewound to its beginning.
+        """
+
+        package = SpooledPackage(
+            max_memory_size=max_memory_size, directory=directory, file_name=file_name
+        )
+        try:
+            self.write_to(package)
+            package.seek(0)
+        except Exception:
+            package.close()
+            raise
+        return package
+
+    def iter_bytes(self, chunk_size=1024 * 1024, max_pending_chunks=8):
+        """
+        Build the package on the fly, yielding the content of the archive as it is
+        written. Nothing is written to disk.
+
+        :param chunk_size: Size of the chunks yielded.
+        :param max_pending_chunks: Maximum number of chunks waiting to be consumed,
+                                   which bounds the memory used.
+        :returns: A generator of bytes.
+        """
+
+        chunks = queue.Queue(maxsize=max_pending_chunks)
+        stream = _ChunkedStream(chunks, chunk_size)
+        errors = []
+
+        def write():
+            try:
+                self.write_to(stream)
+                stream.flush()
+            except Exception as e:
+                errors.append(e)
+            try:
+                stream.put(None)
+            except IOError:
+                # the consumer stopped reading the package
+                pass
+
+        writer = threading.Thread(target=write, name="LMVPackager")
+        writer.daemon = True
+        writer.start()
+        try:
+            while True:
+                chunk = chunks.get()
+                if chunk is None:
+                    break
+                yield chunk
+        finally:
+            stream.cancel()
+            writer.join()
+
+        if errors:
+            raise errors[0]
+
+    ################################################################################################
+    # private methods
+
+    def __iter_entries(self):
+        """
+        Iterate over the entries to add to the archive, in a stable order.
+
+        :returns: A generator of (archive name, file path, is directory) tuples.
+        """
+
+        for root, dir_names, file_names in os.walk(self.__root_dir):
+            dir_names.sort()
+            rel_root = os.path.relpath(root, self.__root_dir)
+            if rel_root != os.curdir:
+                yield rel_root.replace(os.sep, "/") + "/", root, True
+            for file_name in sorted(file_names):
+                path = os.path.join(root, file_name)
+                arcname = os.path.relpath(path, self.__root_dir).replace(os.sep, "/")
+                yield arcname, path, False
+
+    def __get_compression(self, arcname):
+        """Get the compression type and level to use for an entry."""
+
+        if arcname.lower().endswith(self.__stored_extensions):
+            return zipfile.ZIP_STORED, None
+        if self.__compression_level == 0:
+            return zipfile.ZIP_STORED, None
+        return zipfile.ZIP_DEFLATED, self.__compression_level
+
+    def __write_entry(self, zip_file, arcname, path, is_dir, data=None):
+        """
+        Add an entry to the archive.
+
+        :param data: The content of the file, if it has already been read.
+        """
+
+        if is_dir:
+            zip_file.write(path, arcname)
+            return
+
+        compress_type, compress_level = self.__get_compression(arcname)
+        if data is None:
+            zip_file.write(
+                path,
+                arcname,
+                compress_type=compress_type,
+                compresslevel=compress_level,
+            )
+        else:
+            zip_info = zipfile.ZipInfo.from_file(path, arcname)
+            zip_file.writestr(
+                zip_info,
+                data,
+                compress_type=compress_type,
+                compresslevel=compress_level,
+            )
+
+    def __read_entry(self, path):
+        """Read the content of a file, or return None if it is too big to read ahead."""
+
+        if os.path.getsize(path) > self.MAX_READ_AHEAD_FILE_SIZE:
+            return None
+        with open(path, "rb") as fh:
+            return fh.read()
+
+    def __write_entries_read_ahead(self, zip_file):
+        """
+        Add all the entries to the archive, reading the files in worker threads ahead of
+        the entry being compressed.
+        """
+
+        # keep a bounded number of files read ahead to limit the memory used
+        max_pending = self.__workers * 2
+        pending = collections.deque()
+
+        with futures.ThreadPoolExecutor(max_workers=self.__workers) as executor:
+            for arcname, path, is_dir in self.__iter_entries():
+                future = None if is_dir else executor.submit(self.__read_entry, path)
+                pending.append((arcname, path, is_dir, future))
+                if len(pending) >= max_pending:
+                    self.__write_pending_entry(zip_file, pending.popleft())
+            while pending:
+                self.__write_pending_entry(zip_file, pending.popleft())
+
+    def __write_pending_entry(self, zip_file, pending_entry):
+        """Add an entry whose content may be being read by a worker to the archive."""
+
+        arcname, path, is_dir, future = pending_entry
+        data = future.result() if future else None
+        self.__write_entry(zip_file, arcname, path, is_dir, data)
+
+
+class SpooledPackage(io.RawIOBase):
+    """
+    A binary file object holding a package in memory until it grows bigger than a given
+    size. Its content is then moved to a file on disk.
+
+    Upload targets which can read file objects can consume the package directly, the
+    others can call :meth:`get_path` to get a file on disk.
+    """
+
+    # default maximum size of a package kept in memory: 64 MB
+    DEFAULT_MAX_MEMORY_SIZE = 64 * 1024 * 1024
+
+    def __init__(self, max_memory_size=None, directory=None, file_name=None):
+        """
+        Class constructor.
+
+        :param max_memory_size: Maximum size of the content kept in memory, in bytes.
+        :param directory: Directory where the content is written when it gets too big.
+                          If not supplied, a temporary directory is created.
+        :param file_name: Name of the file written to disk, ``package.zip`` by default.
+        """
+        super(SpooledPackage, self).__init__()
+        if max_memory_size is None:
+            max_memory_size = self.DEFAULT_MAX_MEMORY_SIZE
+        self.__max_memory_size = max_memory_size
+        self.__directory = directory
+        self.__file_name = file_name or "package.zip"
+        self.__file = io.BytesIO()
+        self.__path = None
+        self.__temp_directory = None
+
+    @property
+    def rolled_over(self):
+        """
+        Whether the content has been moved to a file on disk.
+
+        :returns: True if the content is on disk, False if it is in memory
+        """
+        return self.__path is not None
+
+    @property
+    def file_name(self):
+        """
+        Name of the file holding the content on disk.
+
+        :returns: The file name as a string
+        """
+        return self.__file_name
+
+    @property
+    def size(self):
+        """
+        Size of the content.
+
+        :returns: The size in bytes
+        """
+        position = self.__file.tell()
+        size = self.__file.seek(0, io.SEEK_END)
+        self.__file.seek(position)
+        return size
+
+    def get_path(self):
+        """
+        Get the path to a file on disk holding the content, writing it if it is still
+        in memory. The file is removed when the package is closed.
+
+        :returns: The file path as a string.
+        """
+        if not self.rolled_over:
+            self.__roll_over()
+        self.__file.flush()
+        return self.__path
+
+    def readable(self):
+        return True
+
+    def writable(self):
+        return True
+
+    def seekable(self):
+        return True
+
+    def read(self, size=-1):
+        return self.__file.read(size)
+
+    def readinto(self, buffer):
+        return self.__file.readinto(buffer)
+
+    def write(self, data):
+        if (
+            not self.rolled_over
+            and self.__file.tell() + len(data) > self.__max_memory_size
+        ):
+            self.__roll_over()
+        return self.__file.write(data)
+
+    def seek(self, offset, whence=io.SEEK_SET):
+        return self.__file.seek(offset, whence)
+
+    def tell(self):
+        return self.__file.tell()
+
+    def flush(self):
+        if not self.closed:
+            self.__file.flush()
+
+    def close(self):
+        """Release the memory used by the content and remove the file on disk, if any."""
+        if self.closed:
+            return
+        super(SpooledPackage, self).close()
+        self.__file.close()
+        if self.__path and os.path.exists(self.__path):
+            os.remove(self.__path)
+        if self.__temp_directory:
+            shutil.rmtree(self.__temp_directory, ignore_errors=True)
+
+    def __roll_over(self):
+        """Move the content from memory to a file on disk."""
+
+        directory = self.__directory
+        if not directory:
+            self.__temp_directory = tempfile.mkdtemp(prefix="lmv_")
+            directory = self.__temp_directory
+        path = os.path.join(directory, self.__file_name)
+        disk_file = open(path, "w+b")
+        disk_file.write(self.__file.getvalue())
+        disk_file.seek(self.__file.tell())
+        self.__file.close()
+        self.__file = disk_file
+        self.__path = path
+
+
+class _ChunkedStream(io.RawIOBase):
+    """A non seekable stream splitting the data written to it into queued chunks."""
+
+    def __init__(self, chunks, chunk_size):
+        super(_ChunkedStream, self).__init__()
+        self.__chunks = chunks
+        self.__chunk_size = chunk_size
+        self.__buffer = bytearray()
+        self.__cancelled = threading.Event()
+
+    def writable(self):
+        return True
+
+    def write(self, data):
+        self.__buffer.extend(data)
+        while len(self.__buffer) >= self.__chunk_size:
+            self.put(bytes(self.__buffer[: self.__chunk_size]))
+            del self.__buffer[: self.__chunk_size]
+        return len(data)
+
+    def flush(self):
+        if self.__buffer:
+            self.put(bytes(self.__buffer))
+            self.__buffer = bytearray()
+
+    def put(self, chunk):
+        """Queue a chunk, giving up if the consumer stopped reading."""
+        while not self.__cancelled.is_set():
+            try:
+                self.__chunks.put(chunk, timeout=0.1)
+                return
+            except queue.Full:
+                continue
+        raise IOError("The package stream has been closed")
+
+    def cancel(self):
+        """Stop queueing chunks, the consumer doesn't read them anymore."""
+        self.__cancelled.set()
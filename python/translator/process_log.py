@@ -0,0 +1,212 @@
+# Copyright (c) 2026 Autodesk.
+#
+# CONFIDENTIAL AND PROPRIETARY
+#
+# This work is provided "AS IS" and subject to the ShotGrid Pipeline Toolkit
+# Source Code License included in this distribution package. See LICENSE.
+# By accessing, using, copying or modifying this work you indicate your
+# agreement to the ShotGrid Pipeline Toolkit Source Code License. All rights
+# not expressly granted therein are reserved by Autodesk.
+
+import collections
+import io
+import os
+import re
+import threading
+
+import sgtk
+
+logger = sgtk.platform.get_logger(__name__)
+
+
+class ProcessLog(object):
+    """
+    The output of a translator process, written to a log file line by line as it is
+    produced, with only its last lines kept in memory.
+
+    The log file is rotated when it gets too big, so the disk and memory used by a
+    translation stay bounded however verbose the translator is. Hooks can be added to
+    parse each line, e.g. to report the progress.
+    """
+
+    # number of lines kept in memory, used to report the errors
+    DEFAULT_TAIL_SIZE = 50
+
+    # size after which the log file is rotated, and number of rotated files kept
+    DEFAULT_MAX_SIZE = 10 * 1024 * 1024
+    DEFAULT_BACKUP_COUNT = 2
+
+    # pattern of the lines reporting a warning
+    WARNING_PATTERN = re.compile(r"\bwarn(ing)?\b", re.IGNORECASE)
+
+    def __init__(
+        self,
+        path=None,
+        tail_size=DEFAULT_TAIL_SIZE,
+        max_size=DEFAULT_MAX_SIZE,
+        backup_count=DEFAULT_BACKUP_COUNT,
+    ):
+        """
+        Class constructor.
+
+        :param path: Optional path to the log file. If not supplied, only the last lines
+                     are kept.
+        :param tail_size: Number of lines kept in memory.
+        :param max_size: Size in bytes after which the log file is rotated.
+        :param backup_count: Number of rotated log files kept, named after the log file
+                             with a ``.1``, ``.2``... suffix.
+        """
+        self.__path = path
+        self.__tail = collections.deque(maxlen=tail_size)
+        self.__max_size = max_size
+        self.__backup_count = backup_count
+        self.__line_hooks = []
+        self.__line_count = 0
+        self.__warning_count = 0
+        self.__file = None
+        self.__file_size = 0
+        self.__lock = threading.Lock()
+
+    ################################################################################################
+    # properties
+
+    @property
+    def path(self):
+        """
+        Path to the log file.
+
+        :returns: The file path as a string, or None if the output isn't written to a file
+        """
+        return self.__path
+
+    @property
+    def tail(self):
+        """
+        Last lines of the output.
+
+        :returns: A list of strings
+        """
+        with self.__lock:
+            return list(self.__tail)
+
+    @property
+    def line_count(self):
+        """
+        Number of lines written to the log.
+
+        :returns: The number of lines as an integer
+        """
+        return self.__line_count
+
+    @property
+    def warning_count(self):
+        """
+        Number of lines reporting a warning.
+
+        :returns: The number of lines as an integer
+        """
+        return self.__warning_count
+
+    ################################################################################################
+    # public methods
+
+    def add_line_hook(self, hook):
+        """
+        Add a callable called with each line written to the log.
+
+        Exceptions raised by the hooks are logged and ignored.
+
+        :param hook: The callable, taking the line as argument.
+        """
+        self.__line_hooks.append(hook)
+
+    def write(self, line):
+        """
+        Write a line of the output to the log.
+
+        :param line: The line, without its line ending.
+        """
+
+        with self.__lock:
+            self.__tail.append(line)
+            self.__line_count += 1
+            if self.WARNING_PATTERN.search(line):
+                self.__warning_count += 1
+            if self.__path:
+                self.__write_to_file(line)
+
+        for hook in self.__line_hooks:
+            try:
+                hook(line)
+            except Exception as e:
+                logger.debug("Translator output hook failed: {}".format(e))
+
+    def close(self):
+        """Close the log file."""
+        with self.__lock:
+            if self.__file:
+                self.__file.close()
+                self.__file = None
+
+    def get_summary(self, line_count=None, include_path=True):
+        """
+        Summarize the output, e.g. to report an error.
+
+        :param line_count: Number of lines of the summary, defaults to all the lines
+                           kept in memory.
+        :param include_path: False to leave out the path to the log file, e.g. when it
+                             is about to be removed.
+        :returns: The last lines of the output, preceded by the number of lines left out
+                  and the path to the log file, if any.
+        """
+
+        lines = self.tail
+        if line_count is not None:
+            lines = lines[-line_count:] if line_count > 0 else []
+        if self.__line_count > len(lines):
+            header = "... {} lines omitted".format(self.__line_count - len(lines))
+            if self.__path and include_path:
+                header += ", see {}".format(self.__path)
+            lines = [header] + lines
+        return "\n".join(lines)
+
+    ################################################################################################
+    # private methods
+
+    def __write_to_file(self, line):
+        """Append a line to the log file, rotating it if it is too big."""
+
+        try:
+            if self.__file is None:
+                self.__file = io.open(
+                    self.__path, "w", encoding="utf-8", errors="replace"
+                )
+                self.__file_size = 0
+            data = line + "\n"
+            data_size = len(data.encode("utf-8", "replace"))
+            if self.__file_size and self.__file_size + data_size > self.__max_size:
+                self.__rotate()
+            self.__file.write(data)
+            self.__file_size += data_size
+        except (OSError, IOError) as e:
+            # keep running the translation, only the tail of the output is kept
+            logger.debug("Couldn't write to log file {}: {}".format(self.__path, e))
+            if self.__file:
+                self.__file.close()
+                self.__file = None
+            self.__path = None
+
+    def __rotate(self):
+        """Rename the log files, dropping the oldest one, and start a new log file."""
+
+        self.__file.close()
+        for index in range(self.__backup_count - 1, 0, -1):
+            source_path = "{}.{}".format(self.__path, index)
+            if os.path.exists(source_path):
+                os.replace(source_path, "{}.{}".format(self.__path, index + 1))
+        if self.__backup_count > 0:
+            os.replace(self.__path, self.__path + ".1")
+        else:
+            os.remove(self.__path)
+        self.__file = io.open(self.__path, "w", encoding="utf-8", errors="replace")
+        self.__file_size = 0
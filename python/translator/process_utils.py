@@ -0,0 +1,413 @@
+# Copyright (c) 2026 Autodesk.
+#
+# CONFIDENTIAL AND PROPRIETARY
+#
+# This work is provided "AS IS" and subject to the ShotGrid Pipeline Toolkit
+# Source Code License included in this distribution package. See LICENSE.
+# By accessing, using, copying or modifying this work you indicate your
+# agreement to the ShotGrid Pipeline Toolkit Source Code License. All rights
+# not expressly granted therein are reserved by Autodesk.
+
+import ctypes
+import errno
+import os
+import signal
+import sys
+
+try:
+    import resource
+except ImportError:
+    # not available on Windows
+    resource = None
+
+try:
+    import psutil
+except ImportError:
+    psutil = None
+
+
+class ResourceLimits(object):
+    """
+    Limits applied to the translator processes, so several translations can safely share a host.
+
+    The memory used by the process and all its descendants is checked while it runs,
+    and they are killed as soon as they use more than ``max_memory`` altogether. On
+    Linux, the address space of the process can also be capped by the system with
+    ``max_address_space``, in which case it fails to allocate memory instead of being
+    killed. This cap applies to each process separately.
+
+    The priority and the address space limit are applied by :meth:`apply` right after
+    the process has started, not from a ``preexec_fn``, which isn't safe when processes
+    are started from several threads.
+    """
+
+    # environment variables limiting the number of threads used by the common
+    # multi-threading runtimes
+    THREAD_ENV_VARS = (
+        "OMP_NUM_THREADS",
+        "MKL_NUM_THREADS",
+        "OPENBLAS_NUM_THREADS",
+        "TBB_NUM_THREADS",
+    )
+
+    # Windows process creation flag used to lower the priority of the process
+    BELOW_NORMAL_PRIORITY_CLASS = 0x4000
+
+    def __init__(
+        self,
+        timeout=None,
+        max_memory=None,
+        max_address_space=None,
+        nice=None,
+        threads=None,
+    ):
+        """
+        Class constructor.
+
+        :param timeout: Maximum number of seconds the process can run.
+        :param max_memory: Maximum resident memory of the process and its descendants
+                           in bytes.
+        :param max_address_space: Maximum address space of the process in bytes, only
+                                  enforced on Linux.
+        :param nice: Niceness increment of the process on POSIX systems. Any positive
+                     value runs the process with a below normal priority on Windows.
+        :param threads: Number of threads the process is hinted to use.
+        """
+        self.__timeout = timeout
+        self.__max_memory = max_memory
+        self.__max_address_space = max_address_space
+        self.__nice = nice
+        self.__threads = threads
+
+    @property
+    def timeout(self):
+        """
+        Maximum number of seconds the process can run.
+
+        :returns: The timeout as a float, or None if there is no timeout
+        """
+        return self.__timeout
+
+    @property
+    def max_memory(self):
+        """
+        Maximum resident memory of the process and its descendants.
+
+        :returns: The size in bytes, or None if there is no limit
+        """
+        return self.__max_memory
+
+    def get_popen_kwargs(self):
+        """
+        Get the :class:`subprocess.Popen` arguments applying the limits to a new process.
+
+        :returns: A dictionary of keyword arguments.
+        """
+
+        kwargs = {}
+        if self.__threads:
+            env = dict(os.environ)
+            for name in self.THREAD_ENV_VARS:
+                env[name] = str(self.__threads)
+            kwargs["env"] = env
+
+        if sys.platform == "win32" and self.__nice and self.__nice > 0:
+            kwargs["creationflags"] = self.BELOW_NORMAL_PRIORITY_CLASS
+        return kwargs
+
+    def apply(self, process):
+        """
+        Apply the limits which can only be set once the process has started.
+
+        :param process: The :class:`subprocess.Popen` object of the process.
+        :raises OSError: If a limit couldn't be applied, e.g. a negative niceness
+                         increment without the privileges to raise the priority.
+        """
+
+        if sys.platform == "win32":
+            return
+        if self.__nice:
+            # the process inherited the priority of this one
+            os.setpriority(
+                os.PRIO_PROCESS,
+                process.pid,
+                os.getpriority(os.PRIO_PROCESS, 0) + self.__nice,
+            )
+        if self.__max_address_space and hasattr(resource, "prlimit"):
+            resource.prlimit(
+                process.pid,
+                resource.RLIMIT_AS,
+                (self.__max_address_space, self.__max_address_space),
+            )
+
+    def check(self, process, elapsed):
+        """
+        Check if a running process exceeds the limits.
+
+        :param process: The :class:`subprocess.Popen` object of the process.
+        :param elapsed: Number of seconds the process has been running.
+        :returns: A tuple with the name of the exceeded limit, ``timeout`` or
+                  ``memory``, and the current memory used by the process and its
+                  descendants in bytes. The name is None if no limit is exceeded.
+        """
+
+        memory = get_process_memory(process) if self.__max_memory else None
+        if self.__timeout is not None and elapsed > self.__timeout:
+            return "timeout", memory
+        if memory is not None and memory > self.__max_memory:
+            return "memory", memory
+        return None, memory
+
+
+def reap_process(process):
+    """
+    Check if a process is over and collect its exit code and peak memory usage.
+
+    On POSIX systems, the process is waited for with ``wait4`` to get its resource
+    usage, on Windows the peak working set size is read from its process handle.
+
+    :param process: The :class:`subprocess.Popen` object of the process.
+    :returns: None if the process is still running, otherwise a tuple with the exit code
+              and the peak resident memory in bytes, or None if it is unknown.
+    """
+
+    if process.returncode is not None:
+        return process.returncode, None
+
+    if hasattr(os, "wait4"):
+        pid, status, rusage = os.wait4(process.pid, os.WNOHANG)
+        if pid == 0:
+            return None
+        process.returncode = _get_exit_code(status)
+        # ru_maxrss is expressed in bytes on macOS and in kilobytes elsewhere
+        peak_memory = rusage.ru_maxrss
+        if sys.platform != "darwin":
+            peak_memory *= 1024
+        return process.returncode, peak_memory
+
+    if process.poll() is None:
+        return None
+    return process.returncode, _get_windows_peak_memory(process)
+
+
+def kill_process(process):
+    """
+    Kill a process which hasn't been reaped by :func:`reap_process` yet.
+
+    Unlike :meth:`subprocess.Popen.kill`, this doesn't wait for the process on POSIX
+    systems, so its resource usage can still be collected. Its descendants are killed
+    as well when they can be listed.
+
+    :param process: The :class:`subprocess.Popen` object of the process.
+    """
+
+    if process.returncode is not None:
+        return
+    if hasattr(os, "wait4"):
+        # the descendants are listed before killing the process, which would make
+        # them orphans
+        for pid in reversed(get_process_tree(process.pid)):
+            try:
+                os.kill(pid, signal.SIGKILL)
+            except OSError:
+                pass
+    else:
+        process.kill()
+
+
+def is_process_alive(pid):
+    """
+    Check if a process is running on this host.
+
+    :param pid: The process id.
+    :returns: True if the process is running, False otherwise.
+    """
+
+    if hasattr(ctypes, "windll"):
+        handle = ctypes.windll.kernel32.OpenProcess(
+            _PROCESS_QUERY_LIMITED_INFORMATION, False, pid
+        )
+        if not handle:
+            return False
+        try:
+            exit_code = ctypes.c_ulong()
+            if not ctypes.windll.kernel32.GetExitCodeProcess(
+                handle, ctypes.byref(exit_code)
+            ):
+                return True
+            return exit_code.value == _STILL_ACTIVE
+        finally:
+            ctypes.windll.kernel32.CloseHandle(handle)
+
+    try:
+        os.kill(pid, 0)
+    except OSError as e:
+        # the process exists but belongs to another user
+        return e.errno == errno.EPERM
+    return True
+
+
+def get_process_tree(pid):
+    """
+    Get the ids of a process and of all its descendants.
+
+    The descendants are listed from ``/proc`` on Linux, and with ``psutil`` elsewhere
+    if it is available.
+
+    :param pid: The process id.
+    :returns: The list of the process ids, starting with the given one and with each
+              process before its children.
+    """
+
+    if os.path.isdir("/proc/{}".format(pid)):
+        parents = None
+        if not os.path.exists("/proc/{0}/task/{0}/children".format(pid)):
+            # kernels built without the children files
+            parents = _read_linux_parents()
+        pids = [pid]
+        # the list grows while it is iterated, down to the last generation
+        for parent_pid in pids:
+            if parents is None:
+                pids.extend(_read_linux_children(parent_pid))
+            else:
+                pids.extend(parents.get(parent_pid, []))
+        return pids
+
+    if psutil:
+        try:
+            return [pid] + [
+                child.pid for child in psutil.Process(pid).children(recursive=True)
+            ]
+        except psutil.Error:
+            pass
+    return [pid]
+
+
+def get_process_memory(process):
+    """
+    Get the resident memory currently used by a running process and its descendants,
+    so the translators running their work in child processes are fully accounted for.
+
+    :param process: The :class:`subprocess.Popen` object of the process.
+    :returns: The size in bytes, or None if it is unknown.
+    """
+
+    if process.returncode is not None:
+        return None
+
+    if os.path.exists("/proc/{}/statm".format(process.pid)):
+        memory = None
+        for pid in get_process_tree(process.pid):
+            pid_memory = _read_linux_memory(pid)
+            if pid_memory is not None:
+                memory = (memory or 0) + pid_memory
+        return memory
+
+    if psutil:
+        try:
+            return sum(
+                psutil.Process(pid).memory_info().rss
+                for pid in get_process_tree(process.pid)
+            )
+        except psutil.Error:
+            return None
+
+    if hasattr(ctypes, "windll"):
+        # without psutil, only the process itself is accounted for
+        counters = _get_windows_memory_counters(process)
+        return counters.WorkingSetSize if counters else None
+    return None
+
+
+def _read_linux_memory(pid):
+    """Read the resident memory of a Linux process, None if it is gone."""
+    try:
+        with open("/proc/{}/statm".format(pid), "r") as fh:
+            resident_pages = int(fh.read().split()[1])
+        return resident_pages * os.sysconf("SC_PAGE_SIZE")
+    except (OSError, IOError, ValueError, IndexError):
+        return None
+
+
+def _read_linux_children(pid):
+    """Read the ids of the children of all the threads of a Linux process."""
+
+    children = []
+    task_dir = "/proc/{}/task".format(pid)
+    try:
+        for tid in os.listdir(task_dir):
+            with open(os.path.join(task_dir, tid, "children"), "r") as fh:
+                children.extend(int(child) for child in fh.read().split())
+    except (OSError, IOError, ValueError):
+        # the process or one of its threads is gone
+        pass
+    return children
+
+
+def _read_linux_parents():
+    """Read the ids of the children of all the Linux processes, by parent id."""
+
+    parents = {}
+    for name in os.listdir("/proc"):
+        if not name.isdigit():
+            continue
+        try:
+            with open("/proc/{}/stat".format(name), "r") as fh:
+                # the command name, in parentheses, may hold spaces
+                parent_pid = int(fh.read().rsplit(")", 1)[1].split()[1])
+        except (OSError, IOError, ValueError, IndexError):
+            continue
+        parents.setdefault(parent_pid, []).append(int(name))
+    return parents
+
+
+def _get_exit_code(status):
+    """Convert a wait status to an exit code, negative if killed by a signal."""
+
+    if os.WIFSIGNALED(status):
+        return -os.WTERMSIG(status)
+    return os.WEXITSTATUS(status)
+
+
+# Windows API constants
+_PROCESS_QUERY_LIMITED_INFORMATION = 0x1000
+_STILL_ACTIVE = 259
+
+
+class _ProcessMemoryCounters(ctypes.Structure):
+    """The PROCESS_MEMORY_COUNTERS structure of the Windows API."""
+
+    _fields_ = [
+        ("cb", ctypes.c_ulong),
+        ("PageFaultCount", ctypes.c_ulong),
+        ("PeakWorkingSetSize", ctypes.c_size_t),
+        ("WorkingSetSize", ctypes.c_size_t),
+        ("QuotaPeakPagedPoolUsage", ctypes.c_size_t),
+        ("QuotaPagedPoolUsage", ctypes.c_size_t),
+        ("QuotaPeakNonPagedPoolUsage", ctypes.c_size_t),
+        ("QuotaNonPagedPoolUsage", ctypes.c_size_t),
+        ("PagefileUsage", ctypes.c_size_t),
+        ("PeakPagefileUsage", ctypes.c_size_t),
+    ]
+
+
+def _get_windows_memory_counters(process):
+    """Get the memory counters of a Windows process, or None if unknown."""
+
+    handle = getattr(process, "_handle", None)
+    if handle is None or not hasattr(ctypes, "windll"):
+        return None
+    counters = _ProcessMemoryCounters()
+    counters.cb = ctypes.sizeof(counters)
+    if not ctypes.windll.psapi.GetProcessMemoryInfo(
+        int(handle), ctypes.byref(counters), counters.cb
+    ):
+        return None
+    return counters
+
+
+def _get_windows_peak_memory(process):
+    """Get the peak working set size of a Windows process, or None if unknown."""
+
+    counters = _get_windows_memory_counters(process)
+    return counters.PeakWorkingSetSize if counters else None
@@ -0,0 +1,330 @@
+# Copyright (c) 2026 Autodesk.
+#
+# CONFIDENTIAL AND PROPRIETARY
+#
+# This work is provided "AS IS" and subject to the ShotGrid Pipeline Toolkit
+# Source Code License included in this distribution package. See LICENSE.
+# By accessing, using, copying or modifying this work you indicate your
+# agreement to the ShotGrid Pipeline Toolkit Source Code License. All rights
+# not expressly granted therein are reserved by Autodesk.
+
+import os
+import threading
+
+import sgtk
+
+logger = sgtk.platform.get_logger(__name__)
+
+
+class TranslatorEntry(object):
+    """
+    A translator known by the registry: the engine shipping it, where to find it in the
+    engine software, the file types it translates and what it is capable of.
+    """
+
+    def __init__(
+        self,
+        engine_name,
+        relative_path,
+        extensions,
+        max_size=None,
+        direct_path_input=False,
+        parallel_safe=True,
+    ):
+        """
+        Class constructor.
+
+        :param engine_name: Name of the engine whose software ships the translator.
+        :param relative_path: Path to the translator executable, relative to the engine
+                              software executable location.
+        :param extensions: List of the extensions of the files the translator handles.
+        :param max_size: Maximum size in bytes of the files the translator can handle,
+                         None if there is no limit.
+        :param direct_path_input: True if the translator can read the source file at
+                                  its original path, so it doesn't need to be staged.
+        :param parallel_safe: False if only one instance of the translator can run at a
+                              time on a host.
+        """
+        self.__engine_name = engine_name
+        self.__relative_path = relative_path
+        self.__extensions = [normalize_extension(ext) for ext in extensions]
+        self.__max_size = max_size
+        self.__direct_path_input = direct_path_input
+        self.__parallel_safe = parallel_safe
+
+    def __repr__(self):
+        return "<TranslatorEntry {} {}>".format(self.__engine_name, self.__extensions)
+
+    ################################################################################################
+    # properties
+
+    @property
+    def engine_name(self):
+        """
+        Name of the engine whose software ships the translator.
+
+        :returns: The engine name as a string
+        """
+        return self.__engine_name
+
+    @property
+    def relative_path(self):
+        """
+        Path to the translator executable, relative to the engine software location.
+
+        :returns: The relative path as a string
+        """
+        return self.__relative_path
+
+    @property
+    def extensions(self):
+        """
+        Extensions of the files the translator handles, in lower case.
+
+        :returns: A list of extensions, with their leading dot
+        """
+        return list(self.__extensions)
+
+    @property
+    def max_size(self):
+        """
+        Maximum size of the files the translator can handle.
+
+        :returns: The size in bytes, or None if there is no limit
+        """
+        return self.__max_size
+
+    @property
+    def direct_path_input(self):
+        """
+        Whether the translator can read the source file at its original path.
+
+        :returns: A boolean
+        """
+        return self.__direct_path_input
+
+    @property
+    def parallel_safe(self):
+        """
+        Whether several instances of the translator can run at the same time.
+
+        :returns: A boolean
+        """
+        return self.__parallel_safe
+
+    ################################################################################################
+    # public methods
+
+    def check_size(self, size):
+        """
+        Check if the translator can handle a file.
+
+        :param size: Size of the file in bytes.
+        :returns: True if the file isn't bigger than the maximum size, False otherwise.
+        """
+        return self.__max_size is None or size <= self.__max_size
+
+
+def normalize_extension(extension):
+    """
+    Normalize a file extension so the lookups ignore its case.
+
+    :param extension: The extension, with or without its leading dot.
+    :returns: The lower case extension with its leading dot.
+    """
+    extension = extension.lower()
+    return extension if extension.startswith(".") else "." + extension
+
+
+class TranslatorRegistry(object):
+    """
+    The translators available to translate the files, indexed by file extension.
+
+    Extensions are matched regardless of their case, and the common alternative spellings
+    of an extension, e.g. ``.step`` for ``.stp``, are matched as well. Translators can be
+    added or replaced by registering new entries, e.g. from the ``translators`` setting
+    of the framework.
+    """
+
+    # translators shipped with the software of the supported engines
+    DEFAULT_ENTRIES = [
+        {
+            "engine": "tk-alias",
+            "relative_path": os.path.join("LMVExtractor", "atf_lmv_extractor.exe"),
+            "extensions": [".wire", ".CATPart", ".jt", ".igs", ".stp", ".fbx"],
+        },
+        {
+            "engine": "tk-vred",
+            "relative_path": os.path.join("LMV", "viewing-vpb-lmv.exe"),
+            "extensions": [".vpb"],
+        },
+    ]
+
+    # alternative spellings of the extensions, and the extension they stand for
+    DEFAULT_ALIASES = {
+        ".step": ".stp",
+        ".iges": ".igs",
+    }
+
+    def __init__(self, entries=None, aliases=None):
+        """
+        Class constructor.
+
+        :param entries: Optional list of dictionaries describing translators registered
+                        on top of the default ones, with the ``engine``,
+                        ``relative_path`` and ``extensions`` keys, and optionally the
+                        ``max_size``, ``direct_path_input`` and ``parallel_safe`` keys.
+        :param aliases: Optional dictionary of extension aliases added to the default
+                        ones.
+        """
+        self.__entries = {}
+        self.__extensions = {}
+        self.__aliases = {}
+        self.__lock = threading.Lock()
+
+        for alias, extension in list(self.DEFAULT_ALIASES.items()) + list(
+            (aliases or {}).items()
+        ):
+            self.add_alias(alias, extension)
+        for entry in self.DEFAULT_ENTRIES + list(entries or []):
+            self.register(
+                entry["engine"],
+                entry["relative_path"],
+                entry["extensions"],
+                max_size=entry.get("max_size"),
+                direct_path_input=entry.get("direct_path_input", False),
+                parallel_safe=entry.get("parallel_safe", True),
+            )
+
+    ################################################################################################
+    # properties
+
+    @property
+    def entries(self):
+        """
+        Registered translators.
+
+        :returns: A list of :class:`TranslatorEntry`
+        """
+        return list(self.__entries.values())
+
+    ################################################################################################
+    # public methods
+
+    def register(
+        self,
+        engine_name,
+        relative_path,
+        extensions,
+        max_size=None,
+        direct_path_input=False,
+        parallel_safe=True,
+    ):
+        """
+        Register a translator, replacing the one previously registered for the same
+        engine. Its extensions are handled by this translator from now on.
+
+        See :class:`TranslatorEntry` for the parameters.
+
+        :returns: The new :class:`TranslatorEntry`.
+        """
+
+        entry = TranslatorEntry(
+            engine_name,
+            relative_path,
+            extensions,
+            max_size=max_size,
+            direct_path_input=direct_path_input,
+            parallel_safe=parallel_safe,
+        )
+        with self.__lock:
+            previous_entry = self.__entries.get(engine_name)
+            if previous_entry:
+                for extension in previous_entry.extensions:
+                    if self.__extensions.get(extension) is previous_entry:
+                        del self.__extensions[extension]
+            self.__entries[engine_name] = entry
+            for extension in entry.extensions:
+                self.__extensions[extension] = entry
+        logger.debug("Registered translator {}".format(entry))
+        return entry
+
+    def add_alias(self, alias, extension):
+        """
+        Handle the files with an extension as the files with another one.
+
+        :param alias: The alternative extension, e.g. ``.step``.
+        :param extension: The extension it stands for, e.g. ``.stp``.
+        """
+        with self.__lock:
+            self.__aliases[normalize_extension(alias)] = normalize_extension(extension)
+
+    def get_entry(self, path):
+        """
+        Get the translator of a file, according to its extension.
+
+        :param path: Path to the file, or its extension.
+        :returns: The :class:`TranslatorEntry`, or None if the file type isn't supported.
+        """
+
+        extension = os.path.splitext(path)[1]
+        if not extension and path.startswith("."):
+            extension = path
+        if not extension:
+            return None
+        extension = normalize_extension(extension)
+        extension = self.__aliases.get(extension, extension)
+        return self.__extensions.get(extension)
+
+    def get_engine_entry(self, engine_name):
+        """
+        Get the translator of an engine.
+
+        :param engine_name: Name of the engine.
+        :returns: The :class:`TranslatorEntry`, or None if the engine has no translator.
+        """
+        return self.__entries.get(engine_name)
+
+    def get_extensions(self):
+        """
+        Get all the extensions of the files which can be translated, aliases included.
+
+        :returns: A sorted list of lower case extensions
+        """
+        with self.__lock:
+            extensions = set(self.__extensions)
+            extensions.update(
+                alias
+                for alias, extension in self.__aliases.items()
+                if extension in self.__extensions
+            )
+        return sorted(extensions)
+
+
+# created the first time it is used, unless the framework set a configured one
+_translator_registry = None
+_translator_registry_lock = threading.Lock()
+
+
+def get_translator_registry():
+    """
+    Get the translator registry of this process.
+
+    :returns: The :class:`TranslatorRegistry` instance
+    """
+    global _translator_registry
+    if _translator_registry is None:
+        with _translator_registry_lock:
+            if _translator_registry is None:
+                _translator_registry = TranslatorRegistry()
+    return _translator_registry
+
+
+def set_translator_registry(translator_registry):
+    """
+    Set the translator registry of this process.
+
+    :param translator_registry: The :class:`TranslatorRegistry` instance
+    """
+    global _translator_registry
+    _translator_registry = translator_registry
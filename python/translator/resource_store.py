@@ -0,0 +1,220 @@
+# Copyright (c) 2026 Autodesk.
+#
+# CONFIDENTIAL AND PROPRIETARY
+#
+# This work is provided "AS IS" and subject to the ShotGrid Pipeline Toolkit
+# Source Code License included in this distribution package. See LICENSE.
+# By accessing, using, copying or modifying this work you indicate your
+# agreement to the ShotGrid Pipeline Toolkit Source Code License. All rights
+# not expressly granted therein are reserved by Autodesk.
+
+import hashlib
+import json
+import os
+import time
+
+import sgtk
+
+from .blob_store import BlobStore
+from .file_utils import FileLock
+from .manifest import PackageManifest
+
+logger = sgtk.platform.get_logger(__name__)
+
+
+class ResourceStore(object):
+    """
+    A local store of the files of the LMV packages, keyed by the digest of their content.
+
+    Each file is stored once as a blob, however many packages contain it, and a package
+    is described by a :class:`PackageManifest` referencing the blobs of its files.
+    Adding the files of a new package only stores the blobs which don't exist yet, and
+    the other files are replaced by copy-on-write clones of the existing blobs, so
+    successive versions of the same model share their unchanged geometry packs on disk.
+    Blobs are never hard linked to the files of the packages, so modifying a package
+    can't corrupt the store. On filesystems without copy-on-write clones, e.g. ext4 or
+    NTFS, nothing could be shared and no blob is stored, only the manifests are kept.
+
+    The blobs are added and removed under a lock file, so several processes can share
+    the same store.
+    """
+
+    BLOBS_DIR_NAME = "blobs"
+    MANIFESTS_DIR_NAME = "manifests"
+
+    # unreferenced blobs younger than this number of seconds are kept by the garbage
+    # collection, as they may belong to a package whose manifest isn't saved yet
+    DEFAULT_GC_MIN_AGE = 60 * 60
+
+    # the store lock is refreshed while held, as storing big packages can take a while
+    LOCK_HEARTBEAT = 30
+
+    def __init__(self, root):
+        """
+        Class constructor.
+
+        :param root: Path to the directory where the blobs and manifests are stored.
+        """
+        self.__root = root
+        self.__blobs = BlobStore(os.path.join(root, self.BLOBS_DIR_NAME))
+
+    ################################################################################################
+    # properties
+
+    @property
+    def root(self):
+        """
+        Path to the directory where the blobs and manifests are stored.
+
+        :returns: The directory path as a string
+        """
+        return self.__root
+
+    ################################################################################################
+    # public methods
+
+    def get_path(self, digest):
+        """
+        Get the path of a blob.
+
+        :param digest: The hex digest of the content of the blob.
+        :returns: The path to the blob, which may not exist.
+        """
+        return self.__blobs.get_path(digest)
+
+    def has(self, digest):
+        """
+        Check if a blob exists in the store.
+
+        :param digest: The hex digest of the content of the blob.
+        :returns: True if the blob exists, False otherwise.
+        """
+        return self.__blobs.has(digest)
+
+    def add_directory(self, root_dir):
+        """
+        Store the files of a directory, cloning the existing blobs to the files whose
+        content is already stored.
+
+        Nothing is stored when the filesystem doesn't support copy-on-write clones, as
+        the blobs would only be copies of the files.
+
+        :param root_dir: Path to the directory, e.g. the ``output`` folder of a
+                         translation.
+        :returns: The :class:`PackageManifest` of the directory and the number of bytes
+                  which don't share their data with the store.
+        """
+
+        manifest = PackageManifest.from_directory(root_dir)
+        if not self.__blobs.supports_reflink:
+            return manifest, manifest.total_size
+
+        new_bytes = 0
+        with self.__get_lock():
+            for rel_path, entry in sorted(manifest.entries.items()):
+                path = os.path.join(root_dir, *rel_path.split("/"))
+                digest = entry["digest"]
+                if self.__blobs.has(digest, entry["size"]) and self.__blobs.share(
+                    digest, path
+                ):
+                    continue
+                self.__blobs.add(digest, path)
+                new_bytes += entry["size"]
+
+        logger.debug(
+            "Stored {} of {} bytes of {}".format(
+                new_bytes, manifest.total_size, root_dir
+            )
+        )
+        return manifest, new_bytes
+
+    def save_manifest(self, manifest):
+        """
+        Keep a package manifest in the store, so its blobs are never garbage collected.
+
+        Manifests are identified by the digest of their content, so saving the same
+        package twice keeps a single manifest.
+
+        :param manifest: The :class:`PackageManifest` of the package.
+        :returns: The id of the manifest, as a string.
+        """
+
+        manifest_id = hashlib.sha256(
+            json.dumps(manifest.entries, sort_keys=True).encode("utf-8")
+        ).hexdigest()
+        manifests_dir = os.path.join(self.__root, self.MANIFESTS_DIR_NAME)
+        if not os.path.isdir(manifests_dir):
+            os.makedirs(manifests_dir, exist_ok=True)
+        manifest.save(os.path.join(manifests_dir, "{}.json".format(manifest_id)))
+        return manifest_id
+
+    def load_manifest(self, manifest_id):
+        """
+        Read a package manifest kept in the store.
+
+        :param manifest_id: The id returned by :meth:`save_manifest`.
+        :returns: The :class:`PackageManifest`.
+        """
+        return PackageManifest.load(
+            os.path.join(
+                self.__root, self.MANIFESTS_DIR_NAME, "{}.json".format(manifest_id)
+            )
+        )
+
+    def remove_manifest(self, manifest_id):
+        """
+        Forget a package, so the blobs only it references can be garbage collected.
+
+        :param manifest_id: The id returned by :meth:`save_manifest`.
+        """
+        try:
+            os.remove(
+                os.path.join(
+                    self.__root, self.MANIFESTS_DIR_NAME, "{}.json".format(manifest_id)
+                )
+            )
+        except OSError:
+            pass
+
+    def collect_garbage(self, min_age=DEFAULT_GC_MIN_AGE):
+        """
+        Remove the blobs which aren't referenced by any manifest kept in the store.
+
+        :param min_age: Age in seconds under which the unreferenced blobs are kept.
+        :returns: The number of bytes freed.
+        """
+
+        with self.__get_lock():
+            digests = set()
+            manifests_dir = os.path.join(self.__root, self.MANIFESTS_DIR_NAME)
+            if os.path.isdir(manifests_dir):
+                for file_name in os.listdir(manifests_dir):
+                    if not file_name.endswith(".json"):
+                        continue
+                    manifest = PackageManifest.load(
+                        os.path.join(manifests_dir, file_name)
+                    )
+                    digests.update(
+                        entry["digest"] for entry in manifest.entries.values()
+                    )
+
+            freed_bytes = 0
+            for digest in self.__blobs.get_digests():
+                if digest in digests:
+                    continue
+                path = self.__blobs.get_path(digest)
+                if time.time() - os.path.getmtime(path) < min_age:
+                    continue
+                freed_bytes += self.__blobs.remove(digest)
+        logger.debug("Freed {} bytes from resource store".format(freed_bytes))
+        return freed_bytes
+
+    ################################################################################################
+    # private methods
+
+    def __get_lock(self):
+        """Get the lock held while adding or removing blobs."""
+        return FileLock(
+            os.path.join(self.__root, "store.lock"),
+            heartbeat_interval=self.LOCK_HEARTBEAT,
+        )
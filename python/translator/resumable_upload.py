@@ -0,0 +1,409 @@
+# Copyright (c) 2026 Autodesk.
+#
+# CONFIDENTIAL AND PROPRIETARY
+#
+# This work is provided "AS IS" and subject to the ShotGrid Pipeline Toolkit
+# Source Code License included in this distribution package. See LICENSE.
+# By accessing, using, copying or modifying this work you indicate your
+# agreement to the ShotGrid Pipeline Toolkit Source Code License. All rights
+# not expressly granted therein are reserved by Autodesk.
+
+import json
+import os
+import random
+import time
+from urllib import error as urllib_error
+from urllib import request as urllib_request
+
+import sgtk
+
+logger = sgtk.platform.get_logger(__name__)
+
+
+class UploadError(Exception):
+    """Raised when an upload failed after all its retries."""
+
+
+def retry_call(func, retries=3, backoff=1.0, max_backoff=60.0, description=None):
+    """
+    Call a function, retrying it with an exponential backoff when it raises.
+
+    :param func: The callable to call, without arguments.
+    :param retries: Number of retries after the first failure.
+    :param backoff: Number of seconds to wait before the first retry, doubled after
+                    each retry.
+    :param max_backoff: Maximum number of seconds to wait between two retries.
+    :param description: Description of the call, used in the log messages.
+    :returns: The value returned by the callable.
+    :raises: The exception raised by the last attempt.
+    """
+
+    attempt = 0
+    while True:
+        try:
+            return func()
+        except Exception as e:
+            if attempt >= retries:
+                raise
+            # add some jitter so clients failing together don't retry together
+            delay = min(max_backoff, backoff * 2**attempt) * random.uniform(0.5, 1.0)
+            attempt += 1
+            logger.debug(
+                "{} failed ({}), retry {}/{} in {:.1f}s".format(
+                    description or func, e, attempt, retries, delay
+                )
+            )
+            time.sleep(delay)
+
+
+def upload_stream(
+    transport,
+    stream,
+    file_name,
+    size,
+    part_size=None,
+    retries=5,
+    backoff=1.0,
+    progress_callback=None,
+):
+    """
+    Upload the content of a file object in parts, without writing it to disk.
+
+    Unlike :class:`ResumableUpload`, no journal is kept: a failed upload starts over the
+    next time.
+
+    :param transport: The :class:`UploadTransport` receiving the parts.
+    :param stream: A readable and seekable binary file object.
+    :param file_name: Name of the uploaded file.
+    :param size: Size of the content in bytes.
+    :param part_size: Size of the parts in bytes, 8 MB by default.
+    :param retries: Number of retries of each request.
+    :param backoff: Number of seconds to wait before the first retry of a request,
+                    doubled after each retry.
+    :param progress_callback: Optional callable called with the number of bytes
+                              uploaded and the size of the content after each part.
+    :returns: The result of the upload, as returned by the transport.
+    :raises UploadError: If a request failed after all its retries.
+    """
+
+    part_size = part_size or ResumableUpload.DEFAULT_PART_SIZE
+    upload_id = _retry_request(
+        lambda: transport.start(file_name, size),
+        retries,
+        backoff,
+        "Starting upload of {}".format(file_name),
+    )
+    parts = []
+    part_count = max(1, -(-size // part_size))
+    for part_number in range(1, part_count + 1):
+        stream.seek((part_number - 1) * part_size)
+        data = stream.read(part_size)
+        tag = _retry_request(
+            lambda: transport.upload_part(upload_id, part_number, data),
+            retries,
+            backoff,
+            "Uploading part {} of {}".format(part_number, file_name),
+        )
+        parts.append([part_number, tag])
+        if progress_callback:
+            progress_callback(min(size, part_number * part_size), size)
+    return _retry_request(
+        lambda: transport.complete(upload_id, parts),
+        retries,
+        backoff,
+        "Completing upload of {}".format(file_name),
+    )
+
+
+def _retry_request(func, retries, backoff, description):
+    """Call a function with retries, raising an UploadError if it keeps failing."""
+    try:
+        return retry_call(func, retries, backoff, description=description)
+    except UploadError:
+        raise
+    except Exception as e:
+        raise UploadError("{} failed: {}".format(description, e))
+
+
+class UploadTransport(object):
+    """
+    Interface of the services receiving uploads in several parts.
+
+    Parts can be uploaded in any order, and an upload is only visible once completed.
+    """
+
+    def start(self, file_name, size):
+        """
+        Start a new upload.
+
+        :param file_name: Name of the uploaded file.
+        :param size: Size of the uploaded file in bytes.
+        :returns: The id of the upload, as a string.
+        """
+        raise NotImplementedError
+
+    def upload_part(self, upload_id, part_number, data):
+        """
+        Upload a part of the file.
+
+        :param upload_id: The id returned by :meth:`start`.
+        :param part_number: Number of the part, starting at 1.
+        :param data: The content of the part, as bytes.
+        :returns: The tag identifying the uploaded part, as a string.
+        """
+        raise NotImplementedError
+
+    def complete(self, upload_id, parts):
+        """
+        Assemble the uploaded parts.
+
+        :param upload_id: The id returned by :meth:`start`.
+        :param parts: List of (part number, tag) tuples of all the parts, in order.
+        :returns: The result of the upload, specific to the transport.
+        """
+        raise NotImplementedError
+
+
+class HTTPUploadTransport(UploadTransport):
+    """
+    Upload parts to an HTTP service, with the following requests:
+
+    - ``POST <url>/uploads`` with a JSON ``{"file_name", "size"}`` body, answering with a
+      JSON ``{"upload_id"}`` body.
+    - ``PUT <url>/uploads/<upload_id>/parts/<part_number>`` with the part as body,
+      answering with a JSON ``{"tag"}`` body.
+    - ``POST <url>/uploads/<upload_id>/complete`` with a JSON ``{"parts": [[number,
+      tag], ...]}`` body, answering with a JSON body returned as the upload result.
+    """
+
+    def __init__(self, url, headers=None, timeout=60):
+        """
+        Class constructor.
+
+        :param url: Base URL of the service.
+        :param headers: Optional dictionary of headers added to all the requests, e.g.
+                        for authentication.
+        :param timeout: Maximum number of seconds to wait for each request.
+        """
+        self.__url = url.rstrip("/")
+        self.__headers = headers or {}
+        self.__timeout = timeout
+
+    def start(self, file_name, size):
+        """
+        Start a new upload.
+
+        :param file_name: Name of the uploaded file.
+        :param size: Size of the uploaded file in bytes.
+        :returns: The id of the upload, as a string.
+        """
+        response = self.__request(
+            "POST", "/uploads", json.dumps({"file_name": file_name, "size": size})
+        )
+        return response["upload_id"]
+
+    def upload_part(self, upload_id, part_number, data):
+        """
+        Upload a part of the file.
+
+        :param upload_id: The id returned by :meth:`start`.
+        :param part_number: Number of the part, starting at 1.
+        :param data: The content of the part, as bytes.
+        :returns: The tag identifying the uploaded part, as a string.
+        """
+        response = self.__request(
+            "PUT",
+            "/uploads/{}/parts/{}".format(upload_id, part_number),
+            data,
+            content_type="application/octet-stream",
+        )
+        return response["tag"]
+
+    def complete(self, upload_id, parts):
+        """
+        Assemble the uploaded parts.
+
+        :param upload_id: The id returned by :meth:`start`.
+        :param parts: List of (part number, tag) tuples of all the parts, in order.
+        :returns: The JSON response of the service.
+        """
+        return self.__request(
+            "POST",
+            "/uploads/{}/complete".format(upload_id),
+            json.dumps({"parts": parts}),
+        )
+
+    def __request(self, method, path, body, content_type="application/json"):
+        """Send a request and decode its JSON response."""
+
+        if isinstance(body, str):
+            body = body.encode("utf-8")
+        headers = dict(self.__headers)
+        headers["Content-Type"] = content_type
+        http_request = urllib_request.Request(
+            self.__url + path, data=body, headers=headers, method=method
+        )
+        try:
+            with urllib_request.urlopen(http_request, timeout=self.__timeout) as fh:
+                return json.loads(fh.read().decode("utf-8") or "{}")
+        except urllib_error.HTTPError as e:
+            raise UploadError(
+                "{} {} failed with HTTP {}: {}".format(method, path, e.code, e.reason)
+            )
+
+
+class ResumableUpload(object):
+    """
+    Upload a file in parts, recording the uploaded parts in a journal next to the file.
+
+    Failed parts are retried with an exponential backoff. If the upload still fails,
+    running it again with the same file resumes it from the parts recorded in the
+    journal, as long as the file hasn't changed. The journal is removed once the upload
+    is completed.
+    """
+
+    # default size of the uploaded parts: 8 MB
+    DEFAULT_PART_SIZE = 8 * 1024 * 1024
+
+    JOURNAL_SUFFIX = ".upload.json"
+
+    def __init__(
+        self,
+        transport,
+        path,
+        part_size=DEFAULT_PART_SIZE,
+        retries=5,
+        backoff=1.0,
+        journal_path=None,
+    ):
+        """
+        Class constructor.
+
+        :param transport: The :class:`UploadTransport` receiving the parts.
+        :param path: Path to the file to upload.
+        :param part_size: Size of the parts in bytes.
+        :param retries: Number of retries of each request.
+        :param backoff: Number of seconds to wait before the first retry of a request,
+                        doubled after each retry.
+        :param journal_path: Path to the journal. Defaults to the path of the file with
+                             a ``.upload.json`` suffix.
+        """
+        self.__transport = transport
+        self.__path = path
+        self.__part_size = part_size
+        self.__retries = retries
+        self.__backoff = backoff
+        self.__journal_path = journal_path or path + self.JOURNAL_SUFFIX
+
+    ################################################################################################
+    # properties
+
+    @property
+    def path(self):
+        """
+        Path to the uploaded file.
+
+        :returns: The file path as a string
+        """
+        return self.__path
+
+    @property
+    def journal_path(self):
+        """
+        Path to the journal of the uploaded parts.
+
+        :returns: The file path as a string
+        """
+        return self.__journal_path
+
+    ################################################################################################
+    # public methods
+
+    def run(self, progress_callback=None):
+        """
+        Upload the file, resuming a previous upload if possible.
+
+        :param progress_callback: Optional callable called with the number of bytes
+                                  uploaded and the size of the file after each part.
+        :returns: The result of the upload, as returned by the transport.
+        :raises UploadError: If a request failed after all its retries.
+        """
+
+        stat = os.stat(self.__path)
+        journal = self.__read_journal()
+        signature = [stat.st_size, stat.st_mtime, self.__part_size]
+        if journal is None or journal["signature"] != signature:
+            upload_id = self.__retry(
+                lambda: self.__transport.start(
+                    os.path.basename(self.__path), stat.st_size
+                ),
+                "Starting upload of {}".format(self.__path),
+            )
+            journal = {"upload_id": upload_id, "signature": signature, "parts": {}}
+            self.__write_journal(journal)
+        else:
+            logger.debug(
+                "Resuming upload of {} with {} uploaded parts".format(
+                    self.__path, len(journal["parts"])
+                )
+            )
+
+        part_count = max(1, -(-stat.st_size // self.__part_size))
+        with open(self.__path, "rb") as fh:
+            for part_number in range(1, part_count + 1):
+                if str(part_number) in journal["parts"]:
+                    continue
+                fh.seek((part_number - 1) * self.__part_size)
+                data = fh.read(self.__part_size)
+                journal["parts"][str(part_number)] = self.__retry(
+                    lambda: self.__transport.upload_part(
+                        journal["upload_id"], part_number, data
+                    ),
+                    "Uploading part {} of {}".format(part_number, self.__path),
+                )
+                self.__write_journal(journal)
+                if progress_callback:
+                    progress_callback(
+                        min(stat.st_size, part_number * self.__part_size),
+                        stat.st_size,
+                    )
+
+        parts = [
+            [part_number, journal["parts"][str(part_number)]]
+            for part_number in range(1, part_count + 1)
+        ]
+        result = self.__retry(
+            lambda: self.__transport.complete(journal["upload_id"], parts),
+            "Completing upload of {}".format(self.__path),
+        )
+        self.discard()
+        return result
+
+    def discard(self):
+        """Forget the uploaded parts, so the next run starts a new upload."""
+        try:
+            os.remove(self.__journal_path)
+        except OSError:
+            pass
+
+    ################################################################################################
+    # private methods
+
+    def __retry(self, func, description):
+        """Call a function with retries, raising an UploadError if it keeps failing."""
+        return _retry_request(func, self.__retries, self.__backoff, description)
+
+    def __read_journal(self):
+        """Read the journal of a previous upload, None if there is none."""
+        try:
+            with open(self.__journal_path, "r") as fh:
+                return json.load(fh)
+        except (OSError, IOError, ValueError):
+            return None
+
+    def __write_journal(self, journal):
+        """Write the journal atomically, so an interrupted upload can be resumed."""
+        tmp_path = "{}.{}.tmp".format(self.__journal_path, os.getpid())
+        with open(tmp_path, "w") as fh:
+            json.dump(journal, fh)
+        os.replace(tmp_path, self.__journal_path)
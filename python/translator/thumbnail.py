@@ -0,0 +1,108 @@
+# Copyright (c) 2026 Autodesk.
+#
+# CONFIDENTIAL AND PROPRIETARY
+#
+# This work is provided "AS IS" and subject to the ShotGrid Pipeline Toolkit
+# Source Code License included in this distribution package. See LICENSE.
+# By accessing, using, copying or modifying this work you indicate your
+# agreement to the ShotGrid Pipeline Toolkit Source Code License. All rights
+# not expressly granted therein are reserved by Autodesk.
+
+import os
+import shutil
+
+import sgtk
+
+logger = sgtk.platform.get_logger(__name__)
+
+# extensions of the images written by the translators, by order of preference
+IMAGE_EXTENSIONS = (".png", ".jpg", ".jpeg")
+
+
+def find_output_image(output_directory, name=None):
+    """
+    Find the image of the model written by the translator.
+
+    :param output_directory: Path to the ``output`` directory of the translation.
+    :param name: Optional name of the image, without extension, e.g. the name of the
+                 svf file. If no image has this name, the biggest image is used.
+    :returns: The path to the image, or None if the translator didn't write any.
+    """
+
+    images_dir_path = os.path.join(output_directory, "images")
+    if not os.path.isdir(images_dir_path):
+        return None
+
+    image_paths = [
+        os.path.join(images_dir_path, file_name)
+        for file_name in sorted(os.listdir(images_dir_path))
+        if os.path.splitext(file_name)[1].lower() in IMAGE_EXTENSIONS
+    ]
+    if name:
+        for extension in IMAGE_EXTENSIONS:
+            for image_path in image_paths:
+                if os.path.basename(image_path).lower() == (name + extension).lower():
+                    return image_path
+    if not image_paths:
+        return None
+    return max(image_paths, key=os.path.getsize)
+
+
+def resize_image(source_path, target_path, size):
+    """
+    Scale an image down so it fits in a square, keeping its aspect ratio.
+
+    Qt is used when it is available, then Pillow. The image is copied as it is when
+    neither of them is available, or when it is already small enough.
+
+    :param source_path: Path to the image to resize.
+    :param target_path: Path to the resized image. Its extension sets its format.
+    :param size: Maximum width and height of the resized image, in pixels.
+    :returns: True if the image has been resized, False if it has been copied.
+    """
+
+    for resize in (_resize_with_qt, _resize_with_pillow):
+        try:
+            if resize(source_path, target_path, size):
+                return True
+        except Exception as e:
+            logger.debug("Couldn't resize {}: {}".format(source_path, e))
+    shutil.copyfile(source_path, target_path)
+    return False
+
+
+def _resize_with_qt(source_path, target_path, size):
+    """Resize an image with the Qt of the current engine, if any."""
+
+    try:
+        from sgtk.platform.qt import QtCore, QtGui
+    except ImportError:
+        return False
+    if not hasattr(QtGui, "QImage"):
+        return False
+
+    image = QtGui.QImage(source_path)
+    if image.isNull() or max(image.width(), image.height()) <= size:
+        return False
+    image = image.scaled(
+        size, size, QtCore.Qt.KeepAspectRatio, QtCore.Qt.SmoothTransformation
+    )
+    return image.save(target_path)
+
+
+def _resize_with_pillow(source_path, target_path, size):
+    """Resize an image with Pillow, if it is installed."""
+
+    try:
+        from PIL import Image
+    except ImportError:
+        return False
+
+    with Image.open(source_path) as image:
+        if max(image.size) <= size:
+            return False
+        image.thumbnail((size, size))
+        if os.path.splitext(target_path)[1].lower() in (".jpg", ".jpeg"):
+            image = image.convert("RGB")
+        image.save(target_path)
+    return True
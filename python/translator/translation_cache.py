@@ -0,0 +1,381 @@
+# Copyright (c) 2026 Autodesk.
+#
+# CONFIDENTIAL AND PROPRIETARY
+#
+# This work is provided "AS IS" and subject to the ShotGrid Pipeline Toolkit
+# Source Code License included in this distribution package. See LICENSE.
+# By accessing, using, copying or modifying this work you indicate your
+# agreement to the ShotGrid Pipeline Toolkit Source Code License. All rights
+# not expressly granted therein are reserved by Autodesk.
+
+import hashlib
+import json
+import os
+import shutil
+import threading
+import time
+import uuid
+
+import sgtk
+
+from .file_utils import FileLock, get_directory_size, get_temporary_path
+from .fingerprint import FingerprintIndex, get_file_signature
+
+logger = sgtk.platform.get_logger(__name__)
+
+
+class TranslationCache(object):
+    """
+    An on-disk cache of LMV translation results.
+
+    Each entry stores the ``output`` tree produced by the translator for a given source
+    file content, file extension and translator executable. The source content is
+    identified by its quick fingerprint, see :class:`FingerprintIndex`, and the whole
+    content is only hashed to confirm a hit when the fingerprint is ambiguous. The cache
+    size is capped and the least recently used entries are evicted first. Entries are
+    published atomically and all the bookkeeping happens under a lock file, so several
+    publishers running on the same host can share the same cache directory.
+    """
+
+    # default maximum size of the cache: 20 GB
+    DEFAULT_MAX_SIZE = 20 * 1024 * 1024 * 1024
+
+    ENTRY_FILE_NAME = "entry.json"
+    FINGERPRINT_INDEX_FILE_NAME = "fingerprints.json"
+
+    # translation locks are refreshed while held, and broken when they haven't been
+    # refreshed for a while, e.g. when the process holding them crashed on another host
+    TRANSLATION_LOCK_HEARTBEAT = 30
+    TRANSLATION_LOCK_STALE_AGE = 120
+
+    def __init__(self, root, max_size=DEFAULT_MAX_SIZE):
+        """
+        Class constructor.
+
+        :param root: Path to the directory where the cache entries are stored.
+        :param max_size: Maximum size of the cache in bytes. ``None`` disables eviction.
+        """
+        self.__root = root
+        self.__max_size = max_size
+        self.__fingerprints = FingerprintIndex(
+            os.path.join(root, self.FINGERPRINT_INDEX_FILE_NAME)
+        )
+        self.__stats = {"hits": 0, "misses": 0, "stores": 0, "evictions": 0}
+        self.__stats_lock = threading.Lock()
+
+    ################################################################################################
+    # properties
+
+    @property
+    def root(self):
+        """
+        Path to the directory where the cache entries are stored.
+
+        :returns: The directory path as a string
+        """
+        return self.__root
+
+    @property
+    def max_size(self):
+        """
+        Maximum size of the cache in bytes.
+
+        :returns: The size as an integer, or None if the cache is unbounded
+        """
+        return self.__max_size
+
+    @property
+    def fingerprints(self):
+        """
+        Index of the fingerprints of the translated source files.
+
+        :returns: The :class:`FingerprintIndex` instance
+        """
+        return self.__fingerprints
+
+    @property
+    def stats(self):
+        """
+        Hit/miss statistics of this cache object.
+
+        :returns: A dictionary with the ``hits``, ``misses``, ``stores`` and
+                  ``evictions`` counters
+        """
+        with self.__stats_lock:
+            return dict(self.__stats)
+
+    ################################################################################################
+    # public methods
+
+    def get_key(self, source_path, translator_path):
+        """
+        Build the cache key for a source file translated with a given translator.
+
+        :param source_path: Path to the file to translate.
+        :param translator_path: Path to the translator executable.
+
+        :returns: The cache key as a string.
+        """
+
+        translator_stat = os.stat(translator_path)
+        hasher = hashlib.sha256()
+        hasher.update(
+            self.__fingerprints.get_fingerprint(source_path).digest.encode("utf-8")
+        )
+        hasher.update(os.path.splitext(source_path)[1].lower().encode("utf-8"))
+        hasher.update(
+            "{}|{}|{}".format(
+                os.path.normcase(os.path.abspath(translator_path)),
+                translator_stat.st_mtime,
+                translator_stat.st_size,
+            ).encode("utf-8")
+        )
+        return hasher.hexdigest()
+
+    def fetch(self, key, output_directory, source_path=None, count_miss=True):
+        """
+        Copy the output tree of a cache entry to the given output directory.
+
+        :param key: The cache key, as returned by :meth:`get_key`.
+        :param output_directory: The translation output directory. The cached tree will
+                                 be copied to its ``output`` folder.
+        :param source_path: Path to the translated file. If supplied and its fingerprint
+                            is ambiguous, its whole content is compared to the content
+                            the entry has been made from.
+        :param count_miss: If False, a miss isn't counted in the :attr:`stats`, e.g. when
+                           the same lookup is tried again once the translation lock of
+                           the entry is held.
+
+        :returns: True if the entry was found, False otherwise.
+        """
+
+        entry_path = self.__get_entry_path(key)
+        target_path = os.path.join(output_directory, "output")
+
+        # entries are published atomically, so they can be checked and copied outside
+        # of the lock, which isn't held while hashing the source file or copying the
+        # entry: the copy is only kept if the entry hasn't been evicted in the meantime
+        entry = self.__read_entry(entry_path)
+        if entry is not None and source_path:
+            if not self.__is_same_source(entry, source_path):
+                entry = None
+
+        copy_path = None
+        if entry is not None:
+            copy_path = get_temporary_path(target_path)
+            try:
+                shutil.copytree(os.path.join(entry_path, "output"), copy_path)
+            except (OSError, shutil.Error) as e:
+                logger.debug("Couldn't copy translation cache entry: {}".format(e))
+                entry = None
+
+        if entry is not None:
+            with self.__get_lock():
+                if self.__read_entry(entry_path) != entry:
+                    entry = None
+                else:
+                    # touch the entry to keep track of the last time it was used
+                    os.utime(os.path.join(entry_path, self.ENTRY_FILE_NAME), None)
+
+        if entry is None:
+            if copy_path:
+                shutil.rmtree(copy_path, ignore_errors=True)
+            if count_miss:
+                self.__increment("misses")
+            logger.debug("Translation cache miss for {}".format(key))
+            return False
+
+        if os.path.exists(target_path):
+            shutil.rmtree(target_path)
+        os.rename(copy_path, target_path)
+
+        self.__increment("hits")
+        logger.debug("Translation cache hit for {}".format(key))
+        return True
+
+    def store(self, key, output_directory, source_path=None):
+        """
+        Add the output tree of a translation to the cache.
+
+        :param key: The cache key, as returned by :meth:`get_key`.
+        :param output_directory: The translation output directory containing the
+                                 ``output`` folder to cache.
+        :param source_path: Path to the translated file, recorded to tell apart the files
+                            with the same fingerprint when fetching the entry. Without a
+                            known digest of its whole content, an entry of a sampled
+                            fingerprint is only reused for the same unchanged file. An
+                            existing entry made from another file, e.g. after a miss for
+                            a touched file, is replaced unless both have the same digest.
+        """
+
+        output_path = os.path.join(output_directory, "output")
+        if not os.path.isdir(output_path):
+            return
+
+        # stage the entry outside of the lock, then publish it with an atomic rename
+        staging_path = os.path.join(self.__root, "staging", uuid.uuid4().hex)
+        shutil.copytree(output_path, os.path.join(staging_path, "output"))
+        with open(os.path.join(staging_path, self.ENTRY_FILE_NAME), "w") as fh:
+            entry = {"size": get_directory_size(staging_path), "created": time.time()}
+            if source_path:
+                entry["source"] = self.__get_source_info(source_path)
+                # the whole content isn't hashed again here: the digest is only known
+                # if the fingerprint is exact or the lookup had to compare contents
+                self.__fingerprints.get_fingerprint(source_path)
+                digest = self.__fingerprints.get_digest(source_path, compute=False)
+                if digest:
+                    entry["digest"] = digest
+            json.dump(entry, fh)
+
+        entry_path = self.__get_entry_path(key)
+        with self.__get_lock():
+            existing_entry = self.__read_entry(entry_path)
+            if existing_entry is not None:
+                if existing_entry.get("source") == entry.get("source"):
+                    # another publisher stored the same translation in the meantime
+                    shutil.rmtree(staging_path, ignore_errors=True)
+                    return
+                if existing_entry.get("digest") and existing_entry.get(
+                    "digest"
+                ) == entry.get("digest"):
+                    # same content as another file: only record this one, so its
+                    # next lookups don't need to hash it
+                    existing_entry["source"] = entry["source"]
+                    self.__write_entry(entry_path, existing_entry)
+                    shutil.rmtree(staging_path, ignore_errors=True)
+                    return
+                # the entry has been made from another file with the same fingerprint,
+                # or from another version of this one, and can't be told apart from it:
+                # replace it, as it would otherwise keep missing for this file
+                logger.debug("Replacing translation cache entry {}".format(key))
+                replaced_path = get_temporary_path(entry_path)
+                os.rename(entry_path, replaced_path)
+                shutil.rmtree(replaced_path, ignore_errors=True)
+            elif os.path.exists(entry_path):
+                # incomplete or corrupted entry
+                shutil.rmtree(entry_path, ignore_errors=True)
+            if not os.path.isdir(os.path.dirname(entry_path)):
+                os.makedirs(os.path.dirname(entry_path))
+            os.rename(staging_path, entry_path)
+            self.__increment("stores")
+            self.__evict()
+
+    def get_translation_lock(self, key):
+        """
+        Get the lock held while translating the source file of a cache entry.
+
+        Processes translating the same content wait for each other through this lock,
+        so the first one runs the translator and the other ones reuse its result.
+
+        :param key: The cache key, as returned by :meth:`get_key`.
+        :returns: A :class:`FileLock`, not acquired yet.
+        """
+        return FileLock(
+            os.path.join(self.__root, "locks", "{}.lock".format(key)),
+            stale_age=self.TRANSLATION_LOCK_STALE_AGE,
+            heartbeat_interval=self.TRANSLATION_LOCK_HEARTBEAT,
+        )
+
+    def evict(self):
+        """Remove the least recently used entries until the cache fits its size cap."""
+        with self.__get_lock():
+            self.__evict()
+
+    def clear(self):
+        """Remove all the entries of the cache."""
+        with self.__get_lock():
+            shutil.rmtree(os.path.join(self.__root, "entries"), ignore_errors=True)
+
+    ################################################################################################
+    # private methods
+
+    def __get_entry_path(self, key):
+        """Get the path to the directory of a cache entry."""
+        return os.path.join(self.__root, "entries", key)
+
+    def __read_entry(self, entry_path):
+        """Read the information of a cache entry, None if the entry doesn't exist."""
+        try:
+            with open(os.path.join(entry_path, self.ENTRY_FILE_NAME), "r") as fh:
+                return json.load(fh)
+        except (OSError, IOError, ValueError):
+            return None
+
+    def __write_entry(self, entry_path, entry):
+        """Replace the information of a cache entry atomically. The lock must be held."""
+        entry_file_path = os.path.join(entry_path, self.ENTRY_FILE_NAME)
+        tmp_path = get_temporary_path(entry_file_path)
+        with open(tmp_path, "w") as fh:
+            json.dump(entry, fh)
+        os.replace(tmp_path, entry_file_path)
+
+    def __get_source_info(self, source_path):
+        """Get the path and signature identifying a version of a source file."""
+        return {
+            "path": os.path.normcase(os.path.abspath(source_path)),
+            "signature": get_file_signature(source_path),
+        }
+
+    def __is_same_source(self, entry, source_path):
+        """Check if a cache entry has been made from the content of a source file."""
+
+        if self.__fingerprints.get_fingerprint(source_path).exact:
+            return True
+        if entry.get("source") == self.__get_source_info(source_path):
+            # same file, which hasn't changed since it has been translated
+            return True
+        # same sampled fingerprint but another file, or the same file touched since:
+        # compare the whole contents. The digest of the file is kept in the fingerprint
+        # index, so it is only computed once, and recorded with the entry replacing this
+        # one if the entry doesn't have one
+        digest = self.__fingerprints.get_digest(source_path)
+        if entry.get("digest") is None:
+            return False
+        if digest != entry["digest"]:
+            logger.debug(
+                "Fingerprint of {} matches a different content".format(source_path)
+            )
+            return False
+        return True
+
+    def __get_lock(self):
+        """Get the lock protecting the cache bookkeeping."""
+        return FileLock(os.path.join(self.__root, "cache.lock"))
+
+    def __increment(self, counter):
+        """Increment one of the statistics counters."""
+        with self.__stats_lock:
+            self.__stats[counter] += 1
+
+    def __evict(self):
+        """Evict entries until the cache fits its size cap. The lock must be held."""
+
+        if self.__max_size is None:
+            return
+
+        entries_dir = os.path.join(self.__root, "entries")
+        if not os.path.isdir(entries_dir):
+            return
+
+        entries = []
+        total_size = 0
+        for key in os.listdir(entries_dir):
+            entry_file = os.path.join(entries_dir, key, self.ENTRY_FILE_NAME)
+            try:
+                with open(entry_file, "r") as fh:
+                    size = json.load(fh)["size"]
+                last_access = os.path.getmtime(entry_file)
+            except (OSError, IOError, ValueError, KeyError):
+                # incomplete or corrupted entry, get rid of it
+                shutil.rmtree(os.path.join(entries_dir, key), ignore_errors=True)
+                continue
+            entries.append((last_access, size, key))
+            total_size += size
+
+        for _, size, key in sorted(entries):
+            if total_size <= self.__max_size:
+                break
+            logger.debug("Evicting translation cache entry {}".format(key))
+            shutil.rmtree(os.path.join(entries_dir, key), ignore_errors=True)
+            total_size -= size
+            self.__increment("evictions")
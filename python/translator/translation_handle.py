@@ -0,0 +1,398 @@
+# Copyright (c) 2026 Autodesk.
+#
+# CONFIDENTIAL AND PROPRIETARY
+#
+# This work is provided "AS IS" and subject to the ShotGrid Pipeline Toolkit
+# Source Code License included in this distribution package. See LICENSE.
+# By accessing, using, copying or modifying this work you indicate your
+# agreement to the ShotGrid Pipeline Toolkit Source Code License. All rights
+# not expressly granted therein are reserved by Autodesk.
+
+import re
+import subprocess
+import threading
+import time
+
+import sgtk
+
+from .process_log import ProcessLog
+from .process_utils import kill_process, reap_process
+
+logger = sgtk.platform.get_logger(__name__)
+
+
+class TranslationError(Exception):
+    """Raised when the translation of a file fails."""
+
+
+class TranslationCancelled(TranslationError):
+    """Raised when a translation has been cancelled."""
+
+
+class TranslationTimeout(TranslationError):
+    """Raised when a translation took longer than its timeout."""
+
+
+class TranslationLimitError(TranslationError):
+    """Raised when a translator process has been killed for exceeding its resource limits."""
+
+    def __init__(self, message, limit, usage):
+        """
+        Class constructor.
+
+        :param message: The error message.
+        :param limit: Name of the exceeded limit, ``timeout`` or ``memory``.
+        :param usage: Dictionary of the resources used by the process: its ``elapsed``
+                      time in seconds and its ``peak_memory`` in bytes.
+        """
+        super(TranslationLimitError, self).__init__(message)
+        self.limit = limit
+        self.usage = usage
+
+
+class TranslationHandle(object):
+    """
+    A handle on a translation running in the background.
+
+    The translation runs in its own thread. The handle gives access to its progress, as
+    reported by the translator output, and allows to wait for its result or to cancel
+    it. Cancelling the translation, or reaching its timeout, kills the translator
+    process. The job is responsible for removing what it has written.
+    """
+
+    # pattern used to find the progress percentage in the translator output
+    PROGRESS_PATTERN = re.compile(r"(\d+(?:\.\d+)?)\s*%")
+
+    # number of seconds between two checks of the cancellation and timeout
+    POLL_INTERVAL = 0.1
+
+    def __init__(self, job, timeout=None, progress_callback=None):
+        """
+        Class constructor.
+
+        :param job: The callable running the translation. It is given this handle as
+                    argument and its return value is the result of the translation.
+        :param timeout: Maximum number of seconds the translation can take, None to
+                        wait forever.
+        :param progress_callback: Optional callable called with the progress, between 0
+                                  and 1, and the translator output line it comes from.
+        """
+        self.__job = job
+        self.__timeout = timeout
+        self.__progress_callback = progress_callback
+        self.__progress = None
+        self.__result = None
+        self.__exception = None
+        self.__start_time = None
+        self.__end_time = None
+        self.__process = None
+        self.__returncode = None
+        self.__peak_memory = None
+        self.__lock = threading.Lock()
+        self.__cancel_event = threading.Event()
+        self.__done_event = threading.Event()
+        self.__thread = None
+
+    ################################################################################################
+    # properties
+
+    @property
+    def progress(self):
+        """
+        Progress of the translation, as reported by the translator.
+
+        :returns: A float between 0 and 1, or None if no progress has been reported
+        """
+        return self.__progress
+
+    @property
+    def elapsed(self):
+        """
+        Time spent running the translation.
+
+        :returns: The number of seconds as a float
+        """
+        if self.__start_time is None:
+            return 0.0
+        return (self.__end_time or time.time()) - self.__start_time
+
+    @property
+    def timeout(self):
+        """
+        Maximum number of seconds the translation can take.
+
+        :returns: The timeout as a float, or None if there is no timeout
+        """
+        return self.__timeout
+
+    @property
+    def returncode(self):
+        """
+        Exit code of the last translator process run.
+
+        :returns: The exit code as an integer, or None if no process has exited
+        """
+        return self.__returncode
+
+    @property
+    def peak_memory(self):
+        """
+        Peak resident memory used by the last translator process run.
+
+        :returns: The size in bytes, or None if it is unknown
+        """
+        return self.__peak_memory
+
+    ################################################################################################
+    # public methods
+
+    def start(self):
+        """Start running the translation in the background."""
+
+        if self.__thread:
+            return
+        self.__start_time = time.time()
+        self.__thread = threading.Thread(target=self.__run, name="LMVTranslation")
+        self.__thread.daemon = True
+        self.__thread.start()
+
+    def done(self):
+        """
+        Check if the translation is over, either because it succeeded, failed or has
+        been cancelled.
+
+        :returns: True if the translation is over, False otherwise.
+        """
+        return self.__done_event.is_set()
+
+    def cancelled(self):
+        """
+        Check if the translation has been cancelled.
+
+        :returns: True if the translation has been cancelled, False otherwise.
+        """
+        return self.__cancel_event.is_set()
+
+    def cancel(self):
+        """
+        Cancel the translation, killing the translator process if it is running.
+
+        :returns: True if the translation was running, False if it was already over.
+        """
+
+        if self.done():
+            return False
+        self.__cancel_event.set()
+        self.__kill_process()
+        return True
+
+    def wait(self, timeout=None):
+        """
+        Wait for the translation to be over.
+
+        :param timeout: Maximum number of seconds to wait, None to wait forever.
+        :returns: True if the translation is over, False if the wait timed out.
+        """
+        return self.__done_event.wait(timeout)
+
+    def result(self, timeout=None):
+        """
+        Wait for the translation to be over and return its result.
+
+        :param timeout: Maximum number of seconds to wait, None to wait forever.
+        :returns: The path to the directory where all the translated files have been
+                  written.
+        :raises TranslationError: If the translation failed, was cancelled or timed out.
+        """
+
+        if not self.wait(timeout):
+            raise TranslationTimeout(
+                "Translation still running after waiting {}s".format(timeout)
+            )
+        if self.__exception:
+            raise self.__exception
+        return self.__result
+
+    def exception(self, timeout=None):
+        """
+        Wait for the translation to be over and return the exception it raised.
+
+        :param timeout: Maximum number of seconds to wait, None to wait forever.
+        :returns: The exception raised by the translation, or None if it succeeded.
+        """
+        self.wait(timeout)
+        return self.__exception
+
+    def run_process(self, cmd, limits=None, log=None, **kwargs):
+        """
+        Run a translator process, parsing its output line by line to report the progress.
+
+        The output is streamed to a :class:`ProcessLog` as it is produced, so it isn't
+        held in memory.
+
+        This method is meant to be called by the job running the translation.
+
+        :param cmd: The command to run, as a list of arguments.
+        :param limits: Optional :class:`ResourceLimits` applied to the process.
+        :param log: Optional :class:`ProcessLog` the output is written to. If not
+                    supplied, only the last lines of the output are kept.
+        :param kwargs: Additional keyword arguments given to :class:`subprocess.Popen`.
+        :returns: The process return code and the :class:`ProcessLog` of its output.
+        :raises TranslationCancelled: If the translation has been cancelled.
+        :raises TranslationTimeout: If the translation took longer than its timeout.
+        :raises TranslationLimitError: If the process exceeded its resource limits.
+        """
+
+        self.check_cancelled()
+
+        if limits:
+            kwargs = dict(limits.get_popen_kwargs(), **kwargs)
+
+        log = log or ProcessLog()
+        log.add_line_hook(self.__parse_progress)
+        with self.__lock:
+            process_start_time = time.time()
+            self.__process = subprocess.Popen(
+                cmd,
+                stdout=subprocess.PIPE,
+                stderr=subprocess.STDOUT,
+                universal_newlines=True,
+                errors="replace",
+                **kwargs,
+            )
+            if limits:
+                try:
+                    limits.apply(self.__process)
+                except OSError:
+                    self.__process.kill()
+                    self.__process.wait()
+                    raise
+            if self.cancelled():
+                kill_process(self.__process)
+        process = self.__process
+
+        reader = threading.Thread(target=self.__read_output, args=(process, log))
+        reader.daemon = True
+        reader.start()
+
+        timed_out = False
+        exceeded_limit = None
+        observed_memory = None
+        while True:
+            with self.__lock:
+                status = reap_process(process)
+            if status is not None:
+                self.__returncode, self.__peak_memory = status
+                break
+            if self.__timeout is not None and self.elapsed > self.__timeout:
+                timed_out = True
+                self.__kill_process()
+            if limits and exceeded_limit is None:
+                exceeded_limit, memory = limits.check(
+                    process, time.time() - process_start_time
+                )
+                if memory is not None:
+                    observed_memory = max(observed_memory or 0, memory)
+                if exceeded_limit:
+                    logger.debug(
+                        "Translation process exceeded its {} limit".format(
+                            exceeded_limit
+                        )
+                    )
+                    self.__kill_process()
+            if reader.is_alive():
+                # the output is closed when the process exits, which wakes us up
+                # without waiting for the whole poll interval
+                reader.join(self.POLL_INTERVAL)
+            else:
+                time.sleep(self.POLL_INTERVAL / 10.0)
+        reader.join()
+        log.close()
+
+        with self.__lock:
+            self.__process = None
+        if observed_memory is not None:
+            self.__peak_memory = max(self.__peak_memory or 0, observed_memory)
+
+        self.check_cancelled()
+        if timed_out:
+            raise TranslationTimeout(
+                "Translation timed out after {}s".format(self.__timeout)
+            )
+        if exceeded_limit:
+            usage = {
+                "elapsed": time.time() - process_start_time,
+                "peak_memory": self.__peak_memory,
+            }
+            message = "Translator exceeded its {} limit after {:.1f}s".format(
+                exceeded_limit, usage["elapsed"]
+            )
+            raise TranslationLimitError(
+                "\n".join([message, log.get_summary()]), exceeded_limit, usage
+            )
+
+        return process.returncode, log
+
+    def check_cancelled(self):
+        """
+        Raise an exception if the translation has been cancelled.
+
+        :raises TranslationCancelled: If the translation has been cancelled.
+        """
+        if self.cancelled():
+            raise TranslationCancelled("Translation has been cancelled")
+
+    def check_timeout(self):
+        """
+        Raise an exception if the translation took longer than its timeout.
+
+        :raises TranslationTimeout: If the translation took longer than its timeout.
+        """
+        if self.__timeout is not None and self.elapsed > self.__timeout:
+            raise TranslationTimeout(
+                "Translation timed out after {}s".format(self.__timeout)
+            )
+
+    ################################################################################################
+    # private methods
+
+    def __run(self):
+        """Run the translation job and store its outcome."""
+
+        try:
+            self.__result = self.__job(self)
+        except Exception as e:
+            self.__exception = e
+        finally:
+            self.__end_time = time.time()
+            self.__done_event.set()
+
+    def __read_output(self, process, log):
+        """Read the process output line by line and write it to the log."""
+
+        for line in iter(process.stdout.readline, ""):
+            log.write(line.rstrip())
+        process.stdout.close()
+
+    def __parse_progress(self, line):
+        """Report the progress found in a line of the translator output."""
+
+        match = self.PROGRESS_PATTERN.search(line)
+        if not match:
+            return
+        self.__progress = min(1.0, float(match.group(1)) / 100.0)
+        if self.__progress_callback:
+            try:
+                self.__progress_callback(self.__progress, line)
+            except Exception as e:
+                logger.debug("Translation progress callback failed: {}".format(e))
+
+    def __kill_process(self):
+        """Kill the translator process if it is running."""
+
+        with self.__lock:
+            if self.__process and self.__process.returncode is None:
+                logger.debug(
+                    "Killing translation process {}".format(self.__process.pid)
+                )
+                kill_process(self.__process)
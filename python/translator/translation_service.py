@@ -0,0 +1,711 @@
+# Copyright (c) 2026 Autodesk.
+#
+# CONFIDENTIAL AND PROPRIETARY
+#
+# This work is provided "AS IS" and subject to the ShotGrid Pipeline Toolkit
+# Source Code License included in this distribution package. See LICENSE.
+# By accessing, using, copying or modifying this work you indicate your
+# agreement to the ShotGrid Pipeline Toolkit Source Code License. All rights
+# not expressly granted therein are reserved by Autodesk.
+
+import heapq
+import itertools
+import json
+import os
+import shutil
+import threading
+from multiprocessing import connection
+
+import sgtk
+
+from .file_utils import get_directory_size
+from .lmv_translator import LMVTranslator
+from .registry import get_translator_registry
+from .translator_path_cache import get_translator_path_cache
+from .translation_handle import TranslationError, TranslationTimeout
+from .translation_statistics import get_translation_statistics
+from .workspace import get_workspace_manager
+
+logger = sgtk.platform.get_logger(__name__)
+
+# environment variables holding the key authenticating the service clients, or the
+# path to a file holding it
+AUTHKEY_ENV_VAR = "TK_LMV_TRANSLATION_SERVICE_AUTHKEY"
+AUTHKEY_FILE_ENV_VAR = "TK_LMV_TRANSLATION_SERVICE_AUTHKEY_FILE"
+
+# maximum size of the messages exchanged with the service, in bytes
+MAX_MESSAGE_SIZE = 1024 * 1024
+
+
+def get_authkey(authkey_file=None):
+    """
+    Get the key authenticating the clients of the translation service.
+
+    There is no default key: each install must share its own secret between the service
+    and its clients, in a file or in the environment.
+
+    :param authkey_file: Optional path to a file holding the key. If not supplied, the
+                         key is read from the ``TK_LMV_TRANSLATION_SERVICE_AUTHKEY``
+                         environment variable, or from the file whose path is in the
+                         ``TK_LMV_TRANSLATION_SERVICE_AUTHKEY_FILE`` one.
+    :returns: The key as bytes.
+    :raises TranslationError: If no key is configured.
+    """
+
+    authkey_file = authkey_file or os.environ.get(AUTHKEY_FILE_ENV_VAR)
+    if authkey_file:
+        with open(authkey_file, "rb") as fh:
+            authkey = fh.read().strip()
+    else:
+        authkey = os.environ.get(AUTHKEY_ENV_VAR, "").encode("utf-8")
+    if not authkey:
+        raise TranslationError(
+            "No key authenticating the translation service clients: set the {} or {} "
+            "environment variable".format(AUTHKEY_ENV_VAR, AUTHKEY_FILE_ENV_VAR)
+        )
+    return authkey
+
+
+def send_message(conn, message):
+    """
+    Send a message to the other end of a connection, as a JSON document.
+
+    :param conn: The :class:`multiprocessing.connection.Connection`.
+    :param message: The message, a JSON serializable dictionary.
+    """
+    conn.send_bytes(json.dumps(message).encode("utf-8"))
+
+
+def receive_message(conn, timeout=None):
+    """
+    Receive a JSON message from the other end of a connection.
+
+    Messages are never unpickled, so a peer can only send plain data.
+
+    :param conn: The :class:`multiprocessing.connection.Connection`.
+    :param timeout: Maximum number of seconds to wait for the message, None to wait
+                    forever.
+    :returns: The message as a dictionary.
+    :raises TranslationTimeout: If no message has been received in time.
+    :raises ValueError: If the message isn't a JSON object.
+    """
+
+    if timeout is not None and not conn.poll(timeout):
+        raise TranslationTimeout("No message received after {}s".format(timeout))
+    message = json.loads(conn.recv_bytes(MAX_MESSAGE_SIZE).decode("utf-8"))
+    if not isinstance(message, dict):
+        raise ValueError("Invalid translation service message")
+    return message
+
+
+def parse_address(address):
+    """
+    Convert a ``host:port`` string to a service address.
+
+    :param address: The address as a string. Addresses without port are returned as
+                    they are, e.g. Unix socket paths or Windows named pipes.
+    :returns: The address as expected by :mod:`multiprocessing.connection`.
+    """
+    host, sep, port = address.rpartition(":")
+    if sep and host and port.isdigit():
+        return host, int(port)
+    return address
+
+
+def _copy_translation(response, output_directory):
+    """
+    Copy the translated files and the package of a translation to a directory.
+
+    :param response: The response of the service to a translation request.
+    :param output_directory: Path to the directory to copy the files to.
+    """
+    shutil.copytree(
+        os.path.join(response["output_directory"], "output"),
+        os.path.join(output_directory, "output"),
+    )
+    if response.get("package_path"):
+        shutil.copyfile(
+            response["package_path"],
+            os.path.join(output_directory, os.path.basename(response["package_path"])),
+        )
+
+
+class _TimedConnection(object):
+    """
+    A connection whose reads give up after a timeout, so a client stalling during the
+    authentication handshake can't hold its thread forever.
+    """
+
+    def __init__(self, conn, timeout):
+        self.__conn = conn
+        self.__timeout = timeout
+
+    def send_bytes(self, data):
+        self.__conn.send_bytes(data)
+
+    def recv_bytes(self, maxlength=None):
+        if not self.__conn.poll(self.__timeout):
+            raise TranslationTimeout(
+                "No message received after {}s".format(self.__timeout)
+            )
+        return self.__conn.recv_bytes(maxlength)
+
+
+class _TranslationJob(object):
+    """A translation waiting for or running in the service."""
+
+    def __init__(self, key, request, memory, priority, sequence):
+        self.key = key
+        self.request = request
+        self.memory = memory
+        self.priority = priority
+        self.sequence = sequence
+        # connections of the clients waiting for the job
+        self.waiters = []
+
+    def __lt__(self, other):
+        # higher priorities first, then first in first out
+        return (-self.priority, self.sequence) < (-other.priority, other.sequence)
+
+
+class TranslationService(object):
+    """
+    A local service running the translations requested by all the publishers of a host.
+
+    Jobs are queued by priority and run while they fit in the limits of the host: a
+    maximum number of concurrent translations and a memory budget, based on an estimate
+    of the memory used by each translation. Identical jobs requested while one is
+    already queued or running are not run twice, all the clients get its result.
+
+    Each client gets the translation in its own workspace created by the service, which
+    the group of the service user can read. The client copies the translated files and
+    then releases the workspace, see :meth:`TranslationServiceClient.translate`. The
+    service never writes to the directories of its clients.
+    """
+
+    DEFAULT_MAX_CONCURRENT_JOBS = 2
+
+    # maximum number of seconds a client can take to send its request
+    REQUEST_TIMEOUT = 30
+
+    # estimated memory used by a translation, relative to the size of the source file
+    MEMORY_PER_SOURCE_BYTE = 4
+
+    # permissions of the workspaces handed over to the clients, which may be run by
+    # other users of the same group
+    WORKSPACE_MODE = 0o750
+
+    def __init__(
+        self,
+        address,
+        authkey=None,
+        max_concurrent_jobs=DEFAULT_MAX_CONCURRENT_JOBS,
+        max_memory=None,
+        cache=None,
+        limits=None,
+        statistics=None,
+        translator_paths=None,
+    ):
+        """
+        Class constructor.
+
+        :param address: Address to listen to, e.g. ``("localhost", 6000)``.
+        :param authkey: Key authenticating the clients. If not supplied, it is read from
+                        the environment, see :func:`get_authkey`.
+        :param max_concurrent_jobs: Maximum number of translations running at once.
+        :param max_memory: Memory budget of the running translations in bytes, None for
+                           no budget. A job bigger than the budget runs alone.
+        :param cache: Optional :class:`TranslationCache` used by all the translations.
+        :param limits: Optional :class:`ResourceLimits` applied to each translator process.
+        :param statistics: Optional :class:`TranslationStatistics` used to estimate the
+                           memory of the translations and updated by them. If not
+                           supplied, the statistics of the process are used.
+        :param translator_paths: Optional dictionary of the translator executable paths
+                                 by engine name. The translators of the other engines
+                                 are looked up in the translator path cache of the host.
+                                 The clients can't choose the translator which is run.
+        """
+        self.__address = address
+        self.__authkey = authkey or get_authkey()
+        self.__max_concurrent_jobs = max(1, max_concurrent_jobs)
+        self.__max_memory = max_memory
+        self.__cache = cache
+        self.__limits = limits
+        self.__statistics = statistics or get_translation_statistics()
+        self.__translator_paths = translator_paths or {}
+        self.__queue = []
+        self.__jobs = {}
+        self.__running = {}
+        self.__sequence = itertools.count()
+        # workspaces handed over to the clients, by path, until they release them
+        self.__workspaces = {}
+        self.__condition = threading.Condition()
+        self.__listener = None
+        self.__stopped = threading.Event()
+
+    ################################################################################################
+    # properties
+
+    @property
+    def address(self):
+        """
+        Address the service listens to.
+
+        :returns: The address, as given to :mod:`multiprocessing.connection`
+        """
+        if self.__listener:
+            return self.__listener.address
+        return self.__address
+
+    ################################################################################################
+    # public methods
+
+    def serve_forever(self):
+        """Accept and run translation requests until :meth:`stop` is called."""
+
+        # the clients are authenticated by their own thread, so a stalled client can't
+        # keep the others from connecting
+        self.__listener = connection.Listener(self.__address)
+        logger.info("LMV translation service listening on {}".format(self.address))
+
+        scheduler = threading.Thread(target=self.__schedule, name="LMVScheduler")
+        scheduler.daemon = True
+        scheduler.start()
+
+        while not self.__stopped.is_set():
+            try:
+                conn = self.__listener.accept()
+            except (OSError, EOFError) as e:
+                if self.__stopped.is_set():
+                    break
+                logger.warning(
+                    "Failed to accept translation service client: {}".format(e)
+                )
+                continue
+            client = threading.Thread(
+                target=self.__handle_client, args=(conn,), name="LMVServiceClient"
+            )
+            client.daemon = True
+            client.start()
+
+    def stop(self):
+        """Stop accepting requests. Running translations are not interrupted."""
+
+        self.__stopped.set()
+        with self.__condition:
+            self.__condition.notify_all()
+        if self.__listener:
+            self.__listener.close()
+
+    def get_status(self):
+        """
+        Get the state of the service.
+
+        :returns: A dictionary with the number of ``queued`` and ``running`` jobs and the
+                  estimated ``memory`` used by the running ones.
+        """
+        with self.__condition:
+            return {
+                "queued": len(self.__queue),
+                "running": len(self.__running),
+                "memory": sum(job.memory for job in self.__running.values()),
+            }
+
+    def get_translator_path(self, source_path):
+        """
+        Get the translator run for a file, according to its extension.
+
+        :param source_path: Path to the file to translate.
+        :returns: The path to the translator executable.
+        :raises TranslationError: If the file type isn't supported or its translator
+                                  can't be found on this host.
+        """
+        translator_entry = get_translator_registry().get_entry(source_path)
+        if not translator_entry:
+            raise TranslationError(
+                "LMV translation does not support file type: {}".format(
+                    os.path.splitext(source_path)[1]
+                )
+            )
+        translator_path = self.__translator_paths.get(translator_entry.engine_name)
+        if translator_path:
+            return translator_path
+        translator_path = get_translator_path_cache().get(
+            translator_entry.engine_name, translator_entry.relative_path
+        )
+        if not translator_path:
+            raise TranslationError(
+                "Couldn't find translator for {}.".format(translator_entry.engine_name)
+            )
+        return translator_path
+
+    def estimate_memory(self, request):
+        """
+        Estimate the memory used by a translation.
+
+        The peak memory of the previous translations of similar files is used when
+        there are some, capped by the memory limit of the translator processes.
+
+        :param request: The translation request.
+        :returns: The estimated memory in bytes.
+        """
+        if request.get("memory"):
+            return request["memory"]
+        max_memory = self.__limits.max_memory if self.__limits else None
+        estimate = self.__statistics.estimate(request["source_path"])
+        if estimate.sample_count:
+            return min(estimate.peak_memory, max_memory or estimate.peak_memory)
+        if max_memory:
+            return max_memory
+        return os.path.getsize(request["source_path"]) * self.MEMORY_PER_SOURCE_BYTE
+
+    ################################################################################################
+    # private methods
+
+    def __handle_client(self, conn):
+        """Read the request of a client and queue it, or answer it directly."""
+
+        try:
+            self.__authenticate(conn)
+        except (
+            EOFError,
+            OSError,
+            TranslationTimeout,
+            connection.AuthenticationError,
+        ) as e:
+            logger.warning("Rejected translation service client: {}".format(e))
+            conn.close()
+            return
+
+        try:
+            request = receive_message(conn, self.REQUEST_TIMEOUT)
+        except (EOFError, OSError, TranslationTimeout, ValueError) as e:
+            logger.debug("Invalid translation service request: {}".format(e))
+            conn.close()
+            return
+
+        command = request.get("command")
+        try:
+            if command == "status":
+                self.__reply(conn, {"status": "ok", "result": self.get_status()})
+            elif command == "translate":
+                self.__submit(conn, request)
+            elif command == "release":
+                self.__release(request.get("output_directory"))
+                self.__reply(conn, {"status": "ok"})
+            else:
+                raise ValueError("Unknown command {}".format(command))
+        except Exception as e:
+            self.__reply(conn, {"status": "error", "error": str(e)})
+
+    def __authenticate(self, conn):
+        """Run the authentication handshake of the listener, giving up after a timeout."""
+
+        timed_conn = _TimedConnection(conn, self.REQUEST_TIMEOUT)
+        connection.deliver_challenge(timed_conn, self.__authkey)
+        connection.answer_challenge(timed_conn, self.__authkey)
+
+    def __release(self, output_directory):
+        """Remove a workspace handed over to a client, once it copied its content."""
+
+        with self.__condition:
+            workspace = self.__workspaces.pop(output_directory, None)
+        if not workspace:
+            raise ValueError("Unknown output directory {!r}".format(output_directory))
+        workspace.remove()
+
+    def __create_workspace(self, required_space=0):
+        """Create a workspace handed over to a client."""
+
+        workspace = get_workspace_manager().create(
+            required_space=required_space, mode=self.WORKSPACE_MODE
+        )
+        with self.__condition:
+            self.__workspaces[workspace.path] = workspace
+        return workspace
+
+    def __submit(self, conn, request):
+        """Queue a translation, or attach the client to an identical job."""
+
+        source_path = request.get("source_path")
+        if not isinstance(source_path, str):
+            raise ValueError("Invalid source path {!r}".format(source_path))
+        # any translator sent by the client is ignored, only the translators of this
+        # host can be run
+        request["translator_path"] = self.get_translator_path(source_path)
+        source_stat = os.stat(source_path)
+        key = (
+            os.path.normcase(os.path.abspath(source_path)),
+            source_stat.st_size,
+            source_stat.st_mtime,
+            request["translator_path"],
+            request.get("package", False),
+            request.get("svf_file_name"),
+        )
+
+        with self.__condition:
+            job = self.__jobs.get(key)
+            if job:
+                logger.debug("Joining in-flight translation of {}".format(key[0]))
+                job.priority = max(job.priority, request.get("priority", 0))
+                heapq.heapify(self.__queue)
+            else:
+                job = _TranslationJob(
+                    key,
+                    request,
+                    self.estimate_memory(request),
+                    request.get("priority", 0),
+                    next(self.__sequence),
+                )
+                self.__jobs[key] = job
+                heapq.heappush(self.__queue, job)
+            job.waiters.append(conn)
+            self.__condition.notify_all()
+
+    def __schedule(self):
+        """Start the queued jobs as soon as they fit in the limits of the host."""
+
+        while not self.__stopped.is_set():
+            with self.__condition:
+                job = self.__pop_next_job()
+                if job is None:
+                    self.__condition.wait()
+                    continue
+                self.__running[job.key] = job
+            worker = threading.Thread(
+                target=self.__run_job, args=(job,), name="LMVServiceJob"
+            )
+            worker.daemon = True
+            worker.start()
+
+    def __pop_next_job(self):
+        """Pop the next job to run if it fits in the limits. The lock must be held."""
+
+        if not self.__queue or len(self.__running) >= self.__max_concurrent_jobs:
+            return None
+        job = self.__queue[0]
+        if self.__running and self.__max_memory is not None:
+            used_memory = sum(j.memory for j in self.__running.values())
+            if used_memory + job.memory > self.__max_memory:
+                return None
+        return heapq.heappop(self.__queue)
+
+    def __run_job(self, job):
+        """Run a translation and send its result to all the clients waiting for it."""
+
+        request = job.request
+        workspace = None
+        try:
+            # the translation is written to a workspace handed over to the first client,
+            # and removed if the translation fails
+            workspace = self.__create_workspace()
+            output_directory = workspace.path
+            lmv_translator = LMVTranslator(
+                request["source_path"],
+                None,
+                None,
+                cache=self.__cache,
+                translator_path=request["translator_path"],
+                limits=self.__limits,
+                statistics=self.__statistics,
+            )
+            lmv_translator.translate(output_directory, timeout=request.get("timeout"))
+            response = {"status": "ok", "output_directory": output_directory}
+            if request.get("package"):
+                response["package_path"], _ = lmv_translator.package(
+                    svf_file_name=request.get("svf_file_name")
+                )
+        except Exception as e:
+            logger.debug(
+                "Translation of {} failed: {}".format(request["source_path"], e)
+            )
+            response = {"status": "error", "error": str(e)}
+            if workspace:
+                self.__release(workspace.path)
+
+        with self.__condition:
+            del self.__running[job.key]
+            del self.__jobs[job.key]
+            self.__condition.notify_all()
+
+        # each client gets its own copy of the translation of the shared job, made
+        # before replying to the first one, which owns the translated files
+        responses = [response]
+        for _ in job.waiters[1:]:
+            waiter_response = response
+            if response["status"] == "ok":
+                try:
+                    waiter_response = self.__copy_result(response)
+                except Exception as e:
+                    waiter_response = {"status": "error", "error": str(e)}
+            responses.append(waiter_response)
+        for conn, waiter_response in zip(job.waiters, responses):
+            self.__reply(conn, waiter_response)
+
+    def __copy_result(self, response):
+        """Copy the result of a job to a new workspace handed over to another client."""
+
+        source_path = os.path.join(response["output_directory"], "output")
+        workspace = self.__create_workspace(
+            required_space=get_directory_size(source_path)
+        )
+        try:
+            result = dict(response, output_directory=workspace.path)
+            _copy_translation(response, workspace.path)
+            if response.get("package_path"):
+                result["package_path"] = os.path.join(
+                    workspace.path, os.path.basename(response["package_path"])
+                )
+        except Exception:
+            self.__release(workspace.path)
+            raise
+        return result
+
+    def __reply(self, conn, response):
+        """Send a response to a client, which may have stopped waiting for it."""
+        try:
+            send_message(conn, response)
+        except (OSError, EOFError):
+            logger.debug("Translation service client is gone")
+        finally:
+            conn.close()
+
+
+class TranslationServiceClient(object):
+    """A client submitting translations to a :class:`TranslationService`."""
+
+    # maximum number of seconds to wait for the status of the service
+    STATUS_TIMEOUT = 30
+
+    # maximum number of seconds to wait for a translation, queued or running
+    DEFAULT_RESPONSE_TIMEOUT = 6 * 60 * 60
+
+    def __init__(
+        self, address, authkey=None, response_timeout=DEFAULT_RESPONSE_TIMEOUT
+    ):
+        """
+        Class constructor.
+
+        :param address: Address of the service, e.g. ``("localhost", 6000)`` or
+                        ``"localhost:6000"``.
+        :param authkey: Key authenticating the client. If not supplied, it is read from
+                        the environment, see :func:`get_authkey`.
+        :param response_timeout: Maximum number of seconds to wait for the service to
+                                 answer a translation request.
+        """
+        if isinstance(address, str):
+            address = parse_address(address)
+        self.__address = address
+        self.__authkey = authkey or get_authkey()
+        self.__response_timeout = response_timeout
+
+    @property
+    def address(self):
+        """
+        Address of the service.
+
+        :returns: The address, as given to :mod:`multiprocessing.connection`
+        """
+        return self.__address
+
+    def get_status(self):
+        """
+        Get the state of the service.
+
+        :returns: See :meth:`TranslationService.get_status`.
+        """
+        return self.__request({"command": "status"}, self.STATUS_TIMEOUT)["result"]
+
+    def translate(
+        self,
+        source_path,
+        output_directory=None,
+        priority=0,
+        timeout=None,
+        memory=None,
+        package=False,
+        svf_file_name=None,
+    ):
+        """
+        Ask the service to translate a file and wait for the translation to be over.
+
+        The service runs the translator of the file type installed on its host.
+
+        :param source_path: Path to the file to translate.
+        :param output_directory: Path to the directory the translated files are copied
+                                 to from the workspace of the service, which is then
+                                 released. It must not hold an ``output`` folder. If not
+                                 supplied, the workspace of the service is returned and
+                                 must be released with :meth:`release`.
+        :param priority: Priority of the translation, higher priorities run first.
+        :param timeout: Maximum number of seconds the translation can take.
+        :param memory: Memory used by the translation in bytes, if known.
+        :param package: If True, the service also packages the translated files, see
+                        :meth:`LMVTranslator.package`.
+        :param svf_file_name: Name of the svf file in the package.
+        :returns: The path to the directory where all the translated files have been
+                  written, and the path to the package, or None if not packaged.
+        :raises TranslationError: If the translation failed.
+        :raises TranslationTimeout: If the service didn't answer in time.
+        """
+
+        if output_directory and os.path.exists(
+            os.path.join(output_directory, "output")
+        ):
+            raise TranslationError(
+                "Output directory {} already holds a translation".format(
+                    output_directory
+                )
+            )
+
+        response = self.__request(
+            {
+                "command": "translate",
+                "source_path": os.path.abspath(source_path),
+                "priority": priority,
+                "timeout": timeout,
+                "memory": memory,
+                "package": package,
+                "svf_file_name": svf_file_name,
+            },
+            self.__response_timeout,
+        )
+        if not output_directory:
+            return response["output_directory"], response.get("package_path")
+
+        try:
+            _copy_translation(response, output_directory)
+        finally:
+            self.release(response["output_directory"])
+        package_path = None
+        if response.get("package_path"):
+            package_path = os.path.join(
+                output_directory, os.path.basename(response["package_path"])
+            )
+        return output_directory, package_path
+
+    def release(self, output_directory):
+        """
+        Let the service remove the workspace of a translation, once its files are no
+        longer needed.
+
+        :param output_directory: The output directory returned by :meth:`translate`.
+        :raises TranslationError: If the service doesn't know the directory.
+        """
+        self.__request(
+            {"command": "release", "output_directory": output_directory},
+            self.STATUS_TIMEOUT,
+        )
+
+    def __request(self, request, timeout):
+        """Send a request to the service and wait for its response."""
+
+        conn = connection.Client(self.__address, authkey=self.__authkey)
+        try:
+            send_message(conn, request)
+            response = receive_message(conn, timeout)
+        finally:
+            conn.close()
+        if response["status"] != "ok":
+            raise TranslationError(response["error"])
+        return response
@@ -0,0 +1,275 @@
+# Copyright (c) 2026 Autodesk.
+#
+# CONFIDENTIAL AND PROPRIETARY
+#
+# This work is provided "AS IS" and subject to the ShotGrid Pipeline Toolkit
+# Source Code License included in this distribution package. See LICENSE.
+# By accessing, using, copying or modifying this work you indicate your
+# agreement to the ShotGrid Pipeline Toolkit Source Code License. All rights
+# not expressly granted therein are reserved by Autodesk.
+
+import collections
+import json
+import os
+import threading
+
+import sgtk
+
+from .file_utils import FileLock
+from .registry import get_translator_registry
+
+logger = sgtk.platform.get_logger(__name__)
+
+TranslationEstimate = collections.namedtuple(
+    "TranslationEstimate", ["duration", "peak_memory", "sample_count"]
+)
+TranslationEstimate.__doc__ = """
+Predicted cost of a translation.
+
+The ``duration`` is in seconds and the ``peak_memory`` in bytes. The ``sample_count``
+is the number of past translations the estimate is based on, 0 when nothing similar has
+been translated yet and the default rates have been used.
+"""
+
+
+class TranslationStatistics(object):
+    """
+    Historical wall time and peak memory of the translations, used to predict the cost of
+    the next ones.
+
+    The translations are grouped by file extension, translator engine and size bucket,
+    the buckets being powers of two. Each group keeps a moving average of its cost per
+    byte of source file, so recent translations weigh more than old ones and the file
+    stays small. The statistics can be persisted to a JSON file shared by the processes
+    of a host, updated after each translation.
+
+    The outcome of each translation is counted in its group. Only the translations run
+    to the end give the cost of the translator. The ones killed for exceeding a limit
+    give a lower bound of it. The other outcomes are only counted.
+    """
+
+    # outcomes of the translations
+    SUCCESS = "success"
+    CACHE_HIT = "cache_hit"
+    SERVICE = "service"
+    FAILURE = "failure"
+    TIMEOUT = "timeout"
+    MEMORY_LIMIT = "memory_limit"
+    CANCELLED = "cancelled"
+
+    # weight of the last translation in the moving averages
+    SMOOTHING = 0.3
+
+    # rates used when nothing similar has been translated yet: 1 second and 4 bytes of
+    # memory per byte of source file
+    DEFAULT_SECONDS_PER_BYTE = 1.0 / (1024 * 1024)
+    DEFAULT_MEMORY_PER_BYTE = 4
+
+    def __init__(self, path=None):
+        """
+        Class constructor.
+
+        :param path: Optional path to the JSON file the statistics are persisted to.
+        """
+        self.__path = None
+        self.__groups = {}
+        self.__lock = threading.Lock()
+        if path:
+            self.set_persistent_path(path)
+
+    ################################################################################################
+    # properties
+
+    @property
+    def persistent_path(self):
+        """
+        Path to the file the statistics are persisted to.
+
+        :returns: The file path as a string, or None if the statistics aren't persisted
+        """
+        return self.__path
+
+    ################################################################################################
+    # public methods
+
+    def set_persistent_path(self, path):
+        """
+        Persist the statistics to the given file, loading the ones it already contains.
+
+        :param path: Path to the JSON file.
+        """
+        with self.__lock:
+            self.__path = path
+            groups = self.__read_persistent_file()
+            groups.update(self.__groups)
+            self.__groups = groups
+
+    def record(self, source_path, engine_name, duration, peak_memory, outcome=SUCCESS):
+        """
+        Record the cost and the outcome of a translation.
+
+        :param source_path: Path to the translated file.
+        :param engine_name: Name of the engine of the translator.
+        :param duration: Wall time of the translation, in seconds.
+        :param peak_memory: Peak memory of the translator process, in bytes. None if
+                            it couldn't be measured.
+        :param outcome: How the translation ended, e.g. :attr:`SUCCESS`,
+                        :attr:`CACHE_HIT` or :attr:`TIMEOUT`.
+        """
+
+        size = max(os.path.getsize(source_path), 1)
+        key = self.__get_key(source_path, engine_name, size)
+        sample = {
+            "seconds_per_byte": float(duration) / size,
+            "memory_per_byte": float(peak_memory) / size if peak_memory else None,
+        }
+
+        with self.__lock:
+            if not self.__path:
+                self.__update_group(self.__groups, key, sample, outcome)
+                return
+
+            # other processes may have recorded translations since the file was read
+            try:
+                with FileLock(self.__path + ".lock", timeout=10):
+                    self.__groups = self.__read_persistent_file()
+                    self.__update_group(self.__groups, key, sample, outcome)
+                    self.__write_persistent_file()
+            except Exception as e:
+                logger.debug(
+                    "Couldn't update translation statistics {}: {}".format(
+                        self.__path, e
+                    )
+                )
+                self.__update_group(self.__groups, key, sample, outcome)
+
+    def estimate(self, source_path, engine_name=None):
+        """
+        Predict the cost of the translation of a file.
+
+        The translations of files of the same type and size are used first, then the
+        ones of files of the same type whatever their size, then the default rates.
+
+        :param source_path: Path to the file to translate.
+        :param engine_name: Name of the engine of the translator, defaults to the one
+                            registered for the file type.
+        :returns: A :class:`TranslationEstimate`.
+        """
+
+        if engine_name is None:
+            entry = get_translator_registry().get_entry(source_path)
+            engine_name = entry.engine_name if entry else None
+        size = max(os.path.getsize(source_path), 1)
+        key = self.__get_key(source_path, engine_name, size)
+
+        with self.__lock:
+            group = self.__groups.get(key)
+            if not group or not group["count"]:
+                group = None
+                # the closest buckets of the same file type, whatever their size
+                prefix = key.rsplit("|", 1)[0] + "|"
+                bucket = size.bit_length()
+                candidates = [
+                    (abs(int(other_key[len(prefix) :]) - bucket), other_group)
+                    for other_key, other_group in self.__groups.items()
+                    if other_key.startswith(prefix) and other_group["count"]
+                ]
+                if candidates:
+                    group = min(candidates, key=lambda candidate: candidate[0])[1]
+            group = dict(group) if group else None
+
+        if group is None:
+            return TranslationEstimate(
+                size * self.DEFAULT_SECONDS_PER_BYTE,
+                size * self.DEFAULT_MEMORY_PER_BYTE,
+                0,
+            )
+        return TranslationEstimate(
+            size * group["seconds_per_byte"],
+            size * (group["memory_per_byte"] or self.DEFAULT_MEMORY_PER_BYTE),
+            group["count"],
+        )
+
+    ################################################################################################
+    # private methods
+
+    def __get_key(self, source_path, engine_name, size):
+        """Build the key of the group of a translation."""
+        extension = os.path.splitext(source_path)[1].lower()
+        return "{}|{}|{}".format(extension, engine_name, size.bit_length())
+
+    def __update_group(self, groups, key, sample, outcome):
+        """Count the outcome of a translation and add its cost to the moving averages."""
+
+        group = groups.setdefault(
+            key, {"count": 0, "seconds_per_byte": None, "memory_per_byte": None}
+        )
+        outcomes = group.setdefault("outcomes", {})
+        outcomes[outcome] = outcomes.get(outcome, 0) + 1
+
+        lower_bound = outcome in (self.TIMEOUT, self.MEMORY_LIMIT)
+        if outcome != self.SUCCESS and not lower_bound:
+            return
+
+        updated = False
+        for name, value in sample.items():
+            if value is None:
+                continue
+            if group.get(name) is None:
+                group[name] = value
+            elif lower_bound and value <= group[name]:
+                # the translator was killed before the end, it would have cost more
+                continue
+            else:
+                group[name] += self.SMOOTHING * (value - group[name])
+            updated = True
+        if updated:
+            group["count"] += 1
+
+    def __read_persistent_file(self):
+        """Read the statistics stored in the persistent file."""
+
+        if not self.__path or not os.path.isfile(self.__path):
+            return {}
+        try:
+            with open(self.__path, "r") as fh:
+                return json.load(fh)
+        except (OSError, IOError, ValueError) as e:
+            logger.debug(
+                "Couldn't read translation statistics {}: {}".format(self.__path, e)
+            )
+            return {}
+
+    def __write_persistent_file(self):
+        """Write the statistics to the persistent file."""
+
+        stats_dir = os.path.dirname(self.__path)
+        if stats_dir and not os.path.isdir(stats_dir):
+            os.makedirs(stats_dir)
+        tmp_path = "{}.{}.tmp".format(self.__path, os.getpid())
+        with open(tmp_path, "w") as fh:
+            json.dump(self.__groups, fh, indent=2, sort_keys=True)
+        os.replace(tmp_path, self.__path)
+
+
+# statistics shared by all the translators of the current process
+_translation_statistics = TranslationStatistics()
+
+
+def get_translation_statistics():
+    """
+    Get the translation statistics shared by the current process.
+
+    :returns: The :class:`TranslationStatistics` instance.
+    """
+    return _translation_statistics
+
+
+def set_translation_statistics(translation_statistics):
+    """
+    Set the translation statistics shared by the current process.
+
+    :param translation_statistics: The :class:`TranslationStatistics` instance.
+    """
+    global _translation_statistics
+    _translation_statistics = translation_statistics
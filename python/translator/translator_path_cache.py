@@ -0,0 +1,157 @@
+# Copyright (c) 2026 Autodesk.
+#
+# CONFIDENTIAL AND PROPRIETARY
+#
+# This work is provided "AS IS" and subject to the ShotGrid Pipeline Toolkit
+# Source Code License included in this distribution package. See LICENSE.
+# By accessing, using, copying or modifying this work you indicate your
+# agreement to the ShotGrid Pipeline Toolkit Source Code License. All rights
+# not expressly granted therein are reserved by Autodesk.
+
+import json
+import os
+import threading
+
+import sgtk
+
+logger = sgtk.platform.get_logger(__name__)
+
+
+class TranslatorPathCache(object):
+    """
+    A process-wide cache of the translator executable paths found on disk.
+
+    Discovering a translator requires scanning the installed software versions of an
+    engine, which is slow. Paths are cached per engine name and relative translator
+    path, and are dropped as soon as the executable doesn't exist anymore. The cache can
+    optionally be persisted to a JSON file so new sessions start with the paths found by
+    the previous ones.
+    """
+
+    def __init__(self):
+        """Class constructor."""
+        self.__paths = {}
+        self.__persistent_path = None
+        self.__lock = threading.Lock()
+
+    @property
+    def persistent_path(self):
+        """
+        Path to the file where the cache is persisted.
+
+        :returns: The file path as a string, or None if the cache isn't persisted
+        """
+        return self.__persistent_path
+
+    def set_persistent_path(self, path):
+        """
+        Persist the cache to the given file, loading the paths it already contains.
+
+        :param path: Path to the JSON file. None stops persisting the cache.
+        """
+
+        with self.__lock:
+            self.__persistent_path = path
+            for key, translator_path in self.__read_persistent_file().items():
+                self.__paths.setdefault(key, translator_path)
+
+    def get(self, engine_name, relative_path):
+        """
+        Get the cached translator path.
+
+        :param engine_name: The name of the engine the translator belongs to.
+        :param relative_path: The path of the translator relative to the engine's
+                              software location.
+
+        :returns: The translator path, or None if it isn't cached or doesn't exist
+                  anymore.
+        """
+
+        key = self.__get_key(engine_name, relative_path)
+        with self.__lock:
+            translator_path = self.__paths.get(key)
+            if translator_path is None:
+                return None
+            if not os.path.exists(translator_path):
+                logger.debug(
+                    "Cached translator {} doesn't exist anymore".format(translator_path)
+                )
+                del self.__paths[key]
+                self.__write_persistent_file()
+                return None
+            return translator_path
+
+    def set(self, engine_name, relative_path, translator_path):
+        """
+        Add a translator path to the cache.
+
+        :param engine_name: The name of the engine the translator belongs to.
+        :param relative_path: The path of the translator relative to the engine's
+                              software location.
+        :param translator_path: The full path to the translator executable.
+        """
+
+        with self.__lock:
+            self.__paths[self.__get_key(engine_name, relative_path)] = translator_path
+            self.__write_persistent_file()
+
+    def clear(self):
+        """Remove all the cached paths, including the persisted ones."""
+
+        with self.__lock:
+            self.__paths = {}
+            self.__write_persistent_file()
+
+    def __get_key(self, engine_name, relative_path):
+        """Build the key used to store a translator path."""
+        return "{}|{}".format(engine_name, relative_path)
+
+    def __read_persistent_file(self):
+        """Read the paths stored in the persistent file."""
+
+        if not self.__persistent_path or not os.path.isfile(self.__persistent_path):
+            return {}
+        try:
+            with open(self.__persistent_path, "r") as fh:
+                return json.load(fh)
+        except (OSError, IOError, ValueError) as e:
+            logger.debug(
+                "Couldn't read translator cache {}: {}".format(
+                    self.__persistent_path, e
+                )
+            )
+            return {}
+
+    def __write_persistent_file(self):
+        """Write the cached paths to the persistent file, if any."""
+
+        if not self.__persistent_path:
+            return
+
+        try:
+            cache_dir = os.path.dirname(self.__persistent_path)
+            if cache_dir and not os.path.isdir(cache_dir):
+                os.makedirs(cache_dir)
+            tmp_path = "{}.{}.tmp".format(self.__persistent_path, os.getpid())
+            with open(tmp_path, "w") as fh:
+                json.dump(self.__paths, fh, indent=2)
+            os.replace(tmp_path, self.__persistent_path)
+        except (OSError, IOError) as e:
+            logger.debug(
+                "Couldn't write translator cache {}: {}".format(
+                    self.__persistent_path, e
+                )
+            )
+
+
+# cache shared by all the translators of the current process
+_translator_path_cache = TranslatorPathCache()
+
+
+def get_translator_path_cache():
+    """
+    Get the translator path cache shared by the current process.
+
+    :returns: The :class:`TranslatorPathCache` instance.
+    """
+    return _translator_path_cache
@@ -0,0 +1,235 @@
+# Copyright (c) 2026 Autodesk.
+#
+# CONFIDENTIAL AND PROPRIETARY
+#
+# This work is provided "AS IS" and subject to the ShotGrid Pipeline Toolkit
+# Source Code License included in this distribution package. See LICENSE.
+# By accessing, using, copying or modifying this work you indicate your
+# agreement to the ShotGrid Pipeline Toolkit Source Code License. All rights
+# not expressly granted therein are reserved by Autodesk.
+
+import json
+import os
+import shutil
+import socket
+import tempfile
+import time
+
+import sgtk
+
+from .process_utils import is_process_alive
+
+logger = sgtk.platform.get_logger(__name__)
+
+
+class WorkspaceError(Exception):
+    """Raised when a workspace can't be created, e.g. when the scratch volume is full."""
+
+
+class Workspace(object):
+    """
+    A temporary directory a translation is written to.
+
+    Used as a context manager, the workspace is removed if an exception is raised, and
+    kept otherwise so its content can be packaged and uploaded.
+    """
+
+    def __init__(self, path):
+        """
+        Class constructor.
+
+        :param path: Path to the workspace directory.
+        """
+        self.__path = path
+
+    @property
+    def path(self):
+        """
+        Path to the workspace directory.
+
+        :returns: The directory path as a string
+        """
+        return self.__path
+
+    def remove(self):
+        """Remove the workspace directory and all its content."""
+        logger.debug("Removing workspace {}".format(self.__path))
+        shutil.rmtree(self.__path, ignore_errors=True)
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        if exc_type is not None:
+            self.remove()
+
+
+class WorkspaceManager(object):
+    """
+    Create the workspaces of the translations on a scratch volume, and remove the ones
+    left behind by the processes which died before cleaning them up.
+
+    Each workspace holds a small file identifying the process which created it, so the
+    workspaces of crashed processes can be told apart from the ones still in use. Only
+    the directories holding this file are ever garbage collected.
+    """
+
+    WORKSPACE_PREFIX = "lmv_"
+    OWNER_FILE_NAME = ".lmv_workspace"
+
+    # orphaned workspaces older than this number of seconds are garbage collected: 1 day
+    DEFAULT_MAX_AGE = 24 * 60 * 60
+
+    def __init__(self, root=None, min_free_space=0, max_age=DEFAULT_MAX_AGE):
+        """
+        Class constructor.
+
+        :param root: Path to the directory the workspaces are created in, ideally on a
+                     fast local volume. Defaults to the system temporary directory.
+        :param min_free_space: Number of bytes which must remain free on the volume
+                               once a workspace is filled.
+        :param max_age: Age in seconds after which a workspace whose owner is unknown or
+                        dead is garbage collected.
+        """
+        self.__root = root
+        self.__min_free_space = min_free_space
+        self.__max_age = max_age
+
+    ################################################################################################
+    # properties
+
+    @property
+    def root(self):
+        """
+        Path to the directory the workspaces are created in.
+
+        :returns: The directory path as a string
+        """
+        return self.__root or tempfile.gettempdir()
+
+    ################################################################################################
+    # public methods
+
+    def create(self, required_space=0, mode=None):
+        """
+        Create a new workspace.
+
+        :param required_space: Number of bytes which will be written to the workspace.
+        :param mode: Optional permissions of the workspace directory, e.g. ``0o750`` to
+                     let the group of the user read it. Only the user can access it by
+                     default.
+        :returns: The new :class:`Workspace`.
+        :raises WorkspaceError: If there isn't enough free space on the volume.
+        """
+
+        if not os.path.isdir(self.root):
+            os.makedirs(self.root)
+        self.check_free_space(self.root, required_space)
+
+        path = tempfile.mkdtemp(prefix=self.WORKSPACE_PREFIX, dir=self.root)
+        if mode is not None:
+            os.chmod(path, mode)
+        with open(os.path.join(path, self.OWNER_FILE_NAME), "w") as fh:
+            json.dump(
+                {"pid": os.getpid(), "host": socket.gethostname(), "time": time.time()},
+                fh,
+            )
+        logger.debug("Created workspace {}".format(path))
+        return Workspace(path)
+
+    def check_free_space(self, path, required_space):
+        """
+        Check that some data can be written to a volume.
+
+        :param path: Path to a directory of the volume.
+        :param required_space: Number of bytes which will be written.
+        :raises WorkspaceError: If there isn't enough free space on the volume.
+        """
+
+        free_space = shutil.disk_usage(path).free
+        if free_space < required_space + self.__min_free_space:
+            raise WorkspaceError(
+                "Not enough free space in {}: {} bytes are needed, {} are available".format(
+                    path, required_space + self.__min_free_space, free_space
+                )
+            )
+
+    def collect_garbage(self, max_age=None):
+        """
+        Remove the workspaces left behind by dead processes.
+
+        Only the directories created by a workspace manager are considered. Workspaces
+        of processes which are still running on this host are never removed, the ones
+        of dead processes of this host are removed right away. The workspaces created
+        on other hosts, e.g. on a shared scratch volume, are removed once they are
+        older than the maximum age.
+
+        :param max_age: Age in seconds, defaults to the maximum age of the manager.
+        :returns: The list of the removed workspace paths.
+        """
+
+        max_age = self.__max_age if max_age is None else max_age
+        if not os.path.isdir(self.root):
+            return []
+
+        removed_paths = []
+        for name in os.listdir(self.root):
+            path = os.path.join(self.root, name)
+            if not name.startswith(self.WORKSPACE_PREFIX) or not os.path.isdir(path):
+                continue
+            if not self.__is_orphaned(path, max_age):
+                continue
+            logger.debug("Removing orphaned workspace {}".format(path))
+            shutil.rmtree(path, ignore_errors=True)
+            if not os.path.exists(path):
+                removed_paths.append(path)
+        return removed_paths
+
+    ################################################################################################
+    # private methods
+
+    def __is_orphaned(self, path, max_age):
+        """Check if a workspace has been left behind by its owner."""
+
+        owner_file_path = os.path.join(path, self.OWNER_FILE_NAME)
+        if not os.path.isfile(owner_file_path):
+            # not created by a workspace manager
+            return False
+
+        owner = None
+        try:
+            with open(owner_file_path, "r") as fh:
+                owner = json.load(fh)
+        except (OSError, IOError, ValueError):
+            pass
+
+        if owner and owner.get("host") == socket.gethostname():
+            return not is_process_alive(owner["pid"])
+
+        try:
+            age = time.time() - os.path.getmtime(path)
+        except OSError:
+            return False
+        return age > max_age
+
+
+_workspace_manager = WorkspaceManager()
+
+
+def get_workspace_manager():
+    """
+    Get the workspace manager used by the translators of this process.
+
+    :returns: The :class:`WorkspaceManager` instance
+    """
+    return _workspace_manager
+
+
+def set_workspace_manager(workspace_manager):
+    """
+    Set the workspace manager used by the translators of this process.
+
+    :param workspace_manager: The :class:`WorkspaceManager` instance
+    """
+    global _workspace_manager
+    _workspace_manager = workspace_manager
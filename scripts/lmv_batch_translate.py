@@ -0,0 +1,271 @@
+# Copyright (c) 2026 Autodesk.
+#
+# CONFIDENTIAL AND PROPRIETARY
+#
+# This work is provided "AS IS" and subject to the ShotGrid Pipeline Toolkit
+# Source Code License included in this distribution package. See LICENSE.
+# By accessing, using, copying or modifying this work you indicate your
+# agreement to the ShotGrid Pipeline Toolkit Source Code License. All rights
+# not expressly granted therein are reserved by Autodesk.
+
+"""
+Translate and package many files to LMV without running a Toolkit engine.
+
+Toolkit core must be importable, e.g. from the ``python`` folder of a pipeline
+configuration in ``PYTHONPATH``. No engine software is scanned: the translators are
+given on the command line, or read from a translator path cache file, e.g. the
+``translator_paths.json`` file in the cache location of the framework. The sources
+are paths or glob patterns, given on the command line or in a manifest file listing
+one of them per line. A JSON report of the results is written once all the files are
+done, and the exit code is 1 if any of them failed.
+
+Usage::
+
+    python lmv_batch_translate.py --output /mnt/farm/lmv \\
+        --translator tk-alias=/opt/Alias/bin/LMVExtractor/atf_lmv_extractor.exe \\
+        --translator-cache translator_paths.json \\
+        --report report.json "/mnt/catalogue/**/*.wire"
+"""
+
+import argparse
+import glob
+import json
+import os
+import sys
+import time
+from concurrent import futures
+
+import sgtk
+
+sys.path.insert(
+    0, os.path.join(os.path.dirname(os.path.abspath(__file__)), "..", "python")
+)
+
+from translator import (  # noqa: E402
+    LMVBatchTranslator,
+    LMVPackager,
+    ResourceStore,
+    TranslationCache,
+    TranslationStatistics,
+    get_translator_path_cache,
+    get_translator_registry,
+)
+
+
+def parse_translator(value):
+    """Parse an ``ENGINE=PATH`` translator argument."""
+
+    engine_name, separator, path = value.partition("=")
+    if not separator or not engine_name or not path:
+        raise argparse.ArgumentTypeError("Expected ENGINE=PATH, got {}".format(value))
+    if not get_translator_registry().get_engine_entry(engine_name):
+        raise argparse.ArgumentTypeError(
+            "No translator is registered for engine {}".format(engine_name)
+        )
+    return engine_name, path
+
+
+def read_manifest(path):
+    """Read the paths and glob patterns listed in a manifest file."""
+
+    with open(path, "r") as fh:
+        lines = [line.strip() for line in fh]
+    return [line for line in lines if line and not line.startswith("#")]
+
+
+def expand_sources(patterns):
+    """
+    Expand the glob patterns of the sources, keeping the order they are given in and
+    dropping the duplicates.
+    """
+
+    source_paths = []
+    known_paths = set()
+    for pattern in patterns:
+        if glob.has_magic(pattern):
+            paths = sorted(glob.glob(pattern, recursive=True))
+        else:
+            paths = [pattern]
+        for path in paths:
+            path = os.path.abspath(path)
+            if path not in known_paths:
+                known_paths.add(path)
+                source_paths.append(path)
+    return source_paths
+
+
+def package(result, compression_level):
+    """Package a translated file next to its translation."""
+
+    svf_file_name = os.path.splitext(os.path.basename(result.source_path))[0]
+    return result.translator.package(
+        svf_file_name=svf_file_name, compression_level=compression_level
+    )
+
+
+def main():
+    """Parse the command line, translate the files and write the report."""
+
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument(
+        "sources", nargs="*", help="paths or glob patterns of the files to translate"
+    )
+    parser.add_argument(
+        "--manifest",
+        action="append",
+        default=[],
+        help="file listing one path or glob pattern of the files to translate per line",
+    )
+    parser.add_argument(
+        "--output",
+        required=True,
+        help="directory the translations are written to, one sub-directory per file",
+    )
+    parser.add_argument(
+        "--translator",
+        action="append",
+        default=[],
+        type=parse_translator,
+        metavar="ENGINE=PATH",
+        help="path to the translator executable of an engine, e.g. tk-alias=/path/to/"
+        "atf_lmv_extractor.exe",
+    )
+    parser.add_argument(
+        "--translator-cache",
+        help="JSON file of a translator path cache the translators of the engines not "
+        "given with --translator are read from, updated if they don't exist anymore",
+    )
+    parser.add_argument(
+        "--workers",
+        type=int,
+        default=LMVBatchTranslator.DEFAULT_MAX_WORKERS,
+        help="maximum number of translations running at once",
+    )
+    parser.add_argument(
+        "--max-memory",
+        type=int,
+        help="memory budget of the running translations, in megabytes",
+    )
+    parser.add_argument(
+        "--statistics",
+        help="JSON file of the translation statistics used to schedule the files, "
+        "updated by the translations",
+    )
+    parser.add_argument(
+        "--package-workers",
+        type=int,
+        default=2,
+        help="maximum number of translations packaged at once",
+    )
+    parser.add_argument(
+        "--no-package",
+        action="store_true",
+        help="only translate the files, without packaging them",
+    )
+    parser.add_argument(
+        "--compression-level",
+        type=int,
+        default=LMVPackager.DEFAULT_COMPRESSION_LEVEL,
+        help="deflate compression level of the packages, from 0 to 9",
+    )
+    parser.add_argument(
+        "--cache", help="directory of a translation cache shared by all the files"
+    )
+    parser.add_argument(
+        "--resource-store",
+        help="directory of a resource store the packaged files are added to, and whose "
+        "unreferenced blobs are removed once all the files are done",
+    )
+    parser.add_argument(
+        "--report", default="-", help="path to the JSON report, - for the output"
+    )
+    args = parser.parse_args()
+
+    sgtk.LogManager().initialize_custom_handler()
+
+    patterns = list(args.sources)
+    for manifest_path in args.manifest:
+        patterns.extend(read_manifest(manifest_path))
+    source_paths = expand_sources(patterns)
+    if not source_paths:
+        parser.error("No file to translate")
+    if not args.translator and not args.translator_cache:
+        parser.error("No translator: use --translator or --translator-cache")
+    if args.translator_cache:
+        get_translator_path_cache().set_persistent_path(args.translator_cache)
+
+    if not os.path.isdir(args.output):
+        os.makedirs(args.output)
+
+    resource_store = ResourceStore(args.resource_store) if args.resource_store else None
+    batch_translator = LMVBatchTranslator(
+        source_paths,
+        None,
+        None,
+        max_workers=args.workers,
+        cache=TranslationCache(args.cache) if args.cache else None,
+        translator_paths=dict(args.translator),
+        resource_store=resource_store,
+        max_memory=args.max_memory * 1024 * 1024 if args.max_memory else None,
+        statistics=TranslationStatistics(args.statistics) if args.statistics else None,
+    )
+
+    start_time = time.time()
+    reports = {}
+    translators = {}
+    # the translations are packaged as soon as they are done, while the other files
+    # are still being translated
+    with futures.ThreadPoolExecutor(max_workers=args.package_workers) as executor:
+        package_futures = {}
+        for result in batch_translator.translate_iter(args.output):
+            reports[result.source_path] = {
+                "source_path": result.source_path,
+                "output_directory": result.output_directory,
+                "package_path": None,
+                "thumbnail_path": None,
+                "error": str(result.error) if result.error else None,
+            }
+            translators[result.source_path] = result.translator
+            if result.error or args.no_package:
+                continue
+            future = executor.submit(package, result, args.compression_level)
+            package_futures[future] = result
+
+        for future in futures.as_completed(package_futures):
+            report = reports[package_futures[future].source_path]
+            try:
+                report["package_path"], report["thumbnail_path"] = future.result()
+            except Exception as e:
+                report["error"] = "Couldn't package the translation: {}".format(e)
+
+    if resource_store:
+        resource_store.collect_garbage()
+
+    results = []
+    for source_path in source_paths:
+        report = reports[source_path]
+        translator = translators[source_path]
+        report["success"] = report["error"] is None
+        report["metrics"] = translator.metrics.to_dict() if translator else None
+        results.append(report)
+
+    failed_count = len([report for report in results if not report["success"]])
+    data = {
+        "duration": time.time() - start_time,
+        "total": len(results),
+        "succeeded": len(results) - failed_count,
+        "failed": failed_count,
+        "results": results,
+    }
+    if args.report == "-":
+        json.dump(data, sys.stdout, indent=2)
+        sys.stdout.write("\n")
+    else:
+        with open(args.report, "w") as fh:
+            json.dump(data, fh, indent=2)
+
+    return 1 if failed_count else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,150 @@
+# Copyright (c) 2026 Autodesk.
+#
+# CONFIDENTIAL AND PROPRIETARY
+#
+# This work is provided "AS IS" and subject to the ShotGrid Pipeline Toolkit
+# Source Code License included in this distribution package. See LICENSE.
+# By accessing, using, copying or modifying this work you indicate your
+# agreement to the ShotGrid Pipeline Toolkit Source Code License. All rights
+# not expressly granted therein are reserved by Autodesk.
+
+"""
+Run the local LMV translation service, translating the files submitted by the
+publishers of this host.
+
+Toolkit core must be importable, e.g. from the ``python`` folder of a pipeline
+configuration in ``PYTHONPATH``. The clients and the service share a secret key, read
+from ``--authkey-file`` or from the ``TK_LMV_TRANSLATION_SERVICE_AUTHKEY`` or
+``TK_LMV_TRANSLATION_SERVICE_AUTHKEY_FILE`` environment variables. The service only
+runs the translators given on the command line or read from a translator path cache
+file, e.g. the ``translator_paths.json`` file in the cache location of the framework,
+never a translator chosen by a client.
+
+Usage::
+
+    python lmv_translation_service.py --address localhost:6000 --max-jobs 2 \\
+        --authkey-file ~/.lmv_service_key \\
+        --translator tk-alias=/opt/Alias/bin/LMVExtractor/atf_lmv_extractor.exe
+"""
+
+import argparse
+import os
+import sys
+
+import sgtk
+
+sys.path.insert(
+    0, os.path.join(os.path.dirname(os.path.abspath(__file__)), "..", "python")
+)
+
+from translator import (  # noqa: E402
+    ResourceLimits,
+    TranslationCache,
+    TranslationService,
+    get_authkey,
+    get_translator_path_cache,
+    get_translator_registry,
+)
+from translator.translation_service import parse_address  # noqa: E402
+
+
+def parse_translator(value):
+    """Parse an ``ENGINE=PATH`` translator argument."""
+
+    engine_name, separator, path = value.partition("=")
+    if not separator or not engine_name or not path:
+        raise argparse.ArgumentTypeError("Expected ENGINE=PATH, got {}".format(value))
+    if not get_translator_registry().get_engine_entry(engine_name):
+        raise argparse.ArgumentTypeError(
+            "No translator is registered for engine {}".format(engine_name)
+        )
+    return engine_name, path
+
+
+def main():
+    """Parse the command line and serve until interrupted."""
+
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument(
+        "--address",
+        default="localhost:6000",
+        help="host:port, Unix socket path or Windows named pipe to listen to",
+    )
+    parser.add_argument(
+        "--authkey-file", help="file holding the key shared with the clients"
+    )
+    parser.add_argument(
+        "--translator",
+        action="append",
+        default=[],
+        type=parse_translator,
+        metavar="ENGINE=PATH",
+        help="path to the translator executable of an engine, e.g. tk-alias=/path/to/"
+        "atf_lmv_extractor.exe",
+    )
+    parser.add_argument(
+        "--translator-cache",
+        help="JSON file of a translator path cache the translators of the engines not "
+        "given with --translator are read from",
+    )
+    parser.add_argument(
+        "--max-jobs",
+        type=int,
+        default=TranslationService.DEFAULT_MAX_CONCURRENT_JOBS,
+        help="maximum number of translations running at once",
+    )
+    parser.add_argument(
+        "--max-memory",
+        type=int,
+        help="memory budget of the running translations, in megabytes",
+    )
+    parser.add_argument(
+        "--cache", help="directory of a translation cache shared by all the jobs"
+    )
+    parser.add_argument(
+        "--job-timeout", type=float, help="maximum number of seconds of a translator"
+    )
+    parser.add_argument(
+        "--job-memory",
+        type=int,
+        help="maximum resident memory of a translator, in megabytes",
+    )
+    parser.add_argument(
+        "--nice", type=int, help="niceness increment of the translator processes"
+    )
+    parser.add_argument(
+        "--threads", type=int, help="number of threads hinted to the translators"
+    )
+    args = parser.parse_args()
+
+    if not args.translator and not args.translator_cache:
+        parser.error("No translator: use --translator or --translator-cache")
+
+    sgtk.LogManager().initialize_custom_handler()
+
+    if args.translator_cache:
+        get_translator_path_cache().set_persistent_path(args.translator_cache)
+
+    service = TranslationService(
+        parse_address(args.address),
+        authkey=get_authkey(args.authkey_file),
+        max_concurrent_jobs=args.max_jobs,
+        max_memory=args.max_memory * 1024 * 1024 if args.max_memory else None,
+        cache=TranslationCache(args.cache) if args.cache else None,
+        limits=ResourceLimits(
+            timeout=args.job_timeout,
+            max_memory=args.job_memory * 1024 * 1024 if args.job_memory else None,
+            nice=args.nice,
+            threads=args.threads,
+        ),
+        translator_paths=dict(args.translator),
+    )
+    try:
+        service.serve_forever()
+    except KeyboardInterrupt:
+        service.stop()
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
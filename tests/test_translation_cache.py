@@ -0,0 +1,140 @@
+# Copyright (c) 2026 Autodesk.
+#
+# CONFIDENTIAL AND PROPRIETARY
+#
+# This work is provided "AS IS" and subject to the ShotGrid Pipeline Toolkit
+# Source Code License included in this distribution package. See LICENSE.
+# By accessing, using, copying or modifying this work you indicate your
+# agreement to the ShotGrid Pipeline Toolkit Source Code License. All rights
+# not expressly granted therein are reserved by Autodesk.
+
+"""
+Tests of the translation cache, translating with ``benchmarks/fake_extractor.py``.
+
+tk-core must be importable, e.g.::
+
+    PYTHONPATH=/path/to/tk-core/python python -m unittest discover tests
+"""
+
+import os
+import shutil
+import sys
+import tempfile
+import unittest
+
+TESTS_DIR = os.path.dirname(os.path.abspath(__file__))
+ROOT_DIR = os.path.dirname(TESTS_DIR)
+sys.path.insert(0, os.path.join(ROOT_DIR, "python"))
+
+import translator  # noqa: E402
+
+MB = 1024 * 1024
+
+
+class TestTranslationCache(unittest.TestCase):
+    """Reuse of the cached translations of files with a sampled fingerprint."""
+
+    # bigger than the files hashed completely by the quick fingerprint
+    SOURCE_SIZE = 6 * MB
+
+    def setUp(self):
+        self.work_dir = tempfile.mkdtemp(prefix="lmv_test_")
+        self.addCleanup(shutil.rmtree, self.work_dir, ignore_errors=True)
+        self.command_path = self.create_extractor_command()
+        self.source_path = os.path.join(self.work_dir, "source.stp")
+        with open(self.source_path, "wb") as fh:
+            fh.write(os.urandom(self.SOURCE_SIZE))
+        self.cache = translator.TranslationCache(os.path.join(self.work_dir, "cache"))
+
+    def create_extractor_command(self):
+        """Create an executable running the fake extractor with this interpreter."""
+
+        fake_extractor_path = os.path.join(ROOT_DIR, "benchmarks", "fake_extractor.py")
+        if sys.platform == "win32":
+            command_path = os.path.join(self.work_dir, "fake_extractor.cmd")
+            with open(command_path, "w") as fh:
+                fh.write('@"{}" "{}" %*\n'.format(sys.executable, fake_extractor_path))
+        else:
+            command_path = os.path.join(self.work_dir, "fake_extractor")
+            with open(command_path, "w") as fh:
+                fh.write(
+                    '#!/bin/sh\nexec "{}" "{}" "$@"\n'.format(
+                        sys.executable, fake_extractor_path
+                    )
+                )
+            os.chmod(command_path, 0o755)
+        return command_path
+
+    def translate(self, source_path):
+        """Translate a file with the cache, removing the translation afterwards."""
+
+        lmv_translator = translator.LMVTranslator(
+            source_path,
+            None,
+            None,
+            cache=self.cache,
+            translator_path=self.command_path,
+        )
+        lmv_translator.translate()
+        lmv_translator.cleanup()
+
+    def touch(self, path):
+        """Change the modification time of a file, keeping its content."""
+        mtime = os.path.getmtime(path) + 10
+        os.utime(path, (mtime, mtime))
+
+    def test_sampled_fingerprint(self):
+        """The source file is big enough to get a sampled fingerprint."""
+        self.assertFalse(
+            self.cache.fingerprints.get_fingerprint(self.source_path).exact
+        )
+
+    def test_touched_file(self):
+        """A touched file misses once, then its new entry is reused."""
+
+        self.translate(self.source_path)
+        self.touch(self.source_path)
+        for _ in range(3):
+            self.translate(self.source_path)
+        self.assertEqual(self.cache.stats["stores"], 2)
+        self.assertEqual(self.cache.stats["misses"], 2)
+        self.assertEqual(self.cache.stats["hits"], 2)
+
+    def test_copied_file(self):
+        """A copy of a file reuses its entry once the entry knows its digest."""
+
+        self.translate(self.source_path)
+        self.touch(self.source_path)
+        self.translate(self.source_path)
+        copy_path = os.path.join(self.work_dir, "copy.stp")
+        shutil.copyfile(self.source_path, copy_path)
+        for _ in range(3):
+            self.translate(copy_path)
+            self.translate(self.source_path)
+        self.assertEqual(self.cache.stats["stores"], 2)
+        self.assertEqual(self.cache.stats["misses"], 2)
+        self.assertEqual(self.cache.stats["hits"], 6)
+
+    def test_modified_file(self):
+        """A file modified outside of its sampled blocks is translated again."""
+
+        self.translate(self.source_path)
+        fingerprint = self.cache.fingerprints.get_fingerprint(self.source_path)
+        # between the first and the second sampled blocks
+        index = translator.FingerprintIndex
+        offset = index.HEAD_SIZE + index.SAMPLE_SIZE + 1024
+        with open(self.source_path, "r+b") as fh:
+            fh.seek(offset)
+            fh.write(b"modified")
+        self.touch(self.source_path)
+        self.assertEqual(
+            self.cache.fingerprints.get_fingerprint(self.source_path), fingerprint
+        )
+        for _ in range(2):
+            self.translate(self.source_path)
+        self.assertEqual(self.cache.stats["misses"], 2)
+        self.assertEqual(self.cache.stats["hits"], 1)
+
+
+if __name__ == "__main__":
+    unittest.main()